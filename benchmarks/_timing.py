@@ -0,0 +1,31 @@
+"""
+基准测试脚本共用的计时与输出
+"""
+import timeit
+from typing import Callable, Iterable, Tuple
+
+
+def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> float:
+    """
+    测量函数单次调用的耗时（毫秒），取多轮中最快的一轮
+
+    :param func: 被测函数
+    :param repeat: 轮数
+    :param min_time: 每轮至少运行的时长（秒），据此确定每轮的调用次数
+    :return: 单次调用的耗时（毫秒）
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def report(title: str, rows: Iterable[Tuple[str, float]]) -> None:
+    """
+    输出一组测量结果，并给出相对第一行的加速比
+    """
+    rows = list(rows)
+    print(title)
+    baseline = rows[0][1]
+    for name, ms in rows:
+        print(f'  {name:<32} {ms:10.3f} ms  {baseline / ms:6.2f}x')
@@ -0,0 +1,83 @@
+"""
+比较可选具体课程上课时间字符串的解析：原先逐段多次正则匹配的实现与现在的 :meth:`EnrollCourseTimetable.from_str`
+
+分别测量互不相同的字符串（缓存不命中）与反复出现的同一字符串（缓存命中）::
+
+    python benchmarks/bench_enroll_timetable.py
+"""
+import random
+import re
+import sys
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mycqu.course import CourseDayTime  # noqa: E402
+from mycqu.enroll.models.enroll_course_timetable import EnrollCourseTimetable, _parse_timetable_str  # noqa: E402
+from mycqu.utils.datetimes import parse_weekday_str, parse_period_str, parse_weeks_str  # noqa: E402
+
+from _timing import measure, report  # noqa: E402
+
+_WEEKS_RE = re.compile("^(.*)周")
+_PERIOD_RE = re.compile("星期. [0-9]-[0-9]小节")
+_POS_RE = re.compile("&(.*)$")
+_WEEKDAYS = '一二三四五六日'
+
+
+def legacy_from_str(data: str) -> List[EnrollCourseTimetable]:
+    """优化前的实现，只能识别一位数的节次"""
+    result = []
+    for item in data.split(';'):
+        pos_str = _POS_RE.search(item)
+        pos = pos_str.group().strip()[1:] if pos_str else None
+        period_str = _PERIOD_RE.search(item)
+        timetable = None
+        if period_str:
+            period_str = period_str.group()
+            timetable = CourseDayTime(weekday=parse_weekday_str(period_str[:3]),
+                                      period=parse_period_str(period_str[4:-2]))
+        result.append(EnrollCourseTimetable(weeks=parse_weeks_str(_WEEKS_RE.search(item).group()[:-1]),
+                                            time=timetable, pos=pos))
+    return result
+
+
+def _timetable_str(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 3)):
+        start = rng.randint(1, 8)
+        period = rng.randint(1, 8)
+        parts.append(f'{start}-{start + rng.randint(1, 8)},{start + 10}-17周 星期{rng.choice(_WEEKDAYS)} '
+                     f'{period}-{period + 1}小节 &D{rng.randint(1000, 1999)} ')
+    return ';'.join(parts)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    strings = [_timetable_str(rng) for _ in range(2000)]
+    for string in strings:
+        assert legacy_from_str(string) == EnrollCourseTimetable.from_str(string), string
+
+    def parse_all(parse):
+        def run():
+            for string in strings:
+                parse(string)
+        return run
+
+    def cold(string: str) -> List[EnrollCourseTimetable]:
+        _parse_timetable_str.cache_clear()
+        return EnrollCourseTimetable.from_str(string)
+
+    report(f'{len(strings)} distinct strings', [
+        ('legacy', measure(parse_all(legacy_from_str))),
+        ('from_str, cache cleared', measure(parse_all(cold))),
+    ])
+    repeated = strings[:20] * 100
+    report(f'{len(repeated)} strings, 20 distinct', [
+        ('legacy', measure(lambda: [legacy_from_str(string) for string in repeated])),
+        ('from_str', measure(lambda: [EnrollCourseTimetable.from_str(string) for string in repeated])),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+比较响应 json 的各种反序列化方式：标准库、:func:`mycqu._lib_wrapper.fastjson.loads` 当前使用的后端、
+已安装的 orjson 与 msgspec，以及按结构解析的 :func:`mycqu.utils.payload.decode_payload`
+
+默认使用按固定随机种子生成的课表响应（``--courses`` 指定课程数量）；也可以传入保存的响应::
+
+    python benchmarks/bench_json_decode.py --courses 20000
+    python benchmarks/bench_json_decode.py saved/timetable.json
+"""
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mycqu._lib_wrapper import fastjson  # noqa: E402
+from mycqu.course._schemas import CourseTimetableResponse  # noqa: E402
+from mycqu.utils.payload import decode_payload  # noqa: E402
+
+from _timing import measure, report  # noqa: E402
+
+
+def _timetable_payload(rng: random.Random, courses: int) -> bytes:
+    rows = [{
+        'courseName': f'课程{rng.randrange(500)}', 'courseCode': f'MATH{rng.randrange(10 ** 5):05d}',
+        'classNbr': f'{rng.randrange(10 ** 6):06d}-{rng.randrange(100):03d}', 'courseDepartmentName': '数学与统计学院',
+        'credit': rng.choice([1, 2, 3.5, '4']), 'instructorName': f'教师{rng.randrange(2000)}',
+        'selectedStuNum': rng.randrange(200), 'position': f'D{rng.randrange(1000, 2000)}',
+        'teachingWeekFormat': '1-8,10-16', 'weekDayFormat': rng.choice('一二三四五'), 'periodFormat': '1-2',
+        'wholeWeekOccupy': False, 'roomName': f'D{rng.randrange(1000, 2000)}', 'exprProjectName': None,
+        'classTimetableInstrVOList': [{'instructorName': f'教师{rng.randrange(2000)}'}],
+    } for _ in range(courses)]
+    return json.dumps({'classTimetableVOList': rows}, ensure_ascii=False).encode()
+
+
+def _decoders(schema: Optional[object]) -> List[Tuple[str, Callable[[bytes], object]]]:
+    decoders: List[Tuple[str, Callable[[bytes], object]]] = [
+        ('json.loads(str)', lambda content: json.loads(content.decode())),
+        ('json.loads(bytes)', json.loads),
+        (f'fastjson.loads ({fastjson._loads.__module__})', fastjson.loads),
+    ]
+    try:
+        import orjson
+        decoders.append(('orjson.loads', orjson.loads))
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        decoders.append(('msgspec.json.decode', msgspec.json.decode))
+    except ImportError:
+        pass
+    if schema is not None:
+        decoders.append(('decode_payload (typed)', lambda content: decode_payload(content, schema)))
+    return decoders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('paths', nargs='*', help='saved json responses')
+    parser.add_argument('--courses', type=int, default=10000, help='courses in the generated timetable')
+    args = parser.parse_args()
+    if args.paths:
+        payloads = [(path, Path(path).read_bytes(), None) for path in args.paths]
+    else:
+        payloads = [(f'timetable, {args.courses} courses',
+                     _timetable_payload(random.Random(0), args.courses), CourseTimetableResponse)]
+    for name, content, schema in payloads:
+        expected = json.loads(content)
+        rows = []
+        for decoder_name, decode in _decoders(schema):
+            if not decoder_name.startswith('decode_payload'):
+                assert decode(content) == expected, decoder_name
+            rows.append((decoder_name, measure(lambda: decode(content), repeat=3)))
+        report(f'{name} ({len(content) / 2 ** 20:.1f} MiB)', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+比较统一身份认证与校园卡页面上的目标扫描（``parse``）与完整的 HTMLParser 解析（``feed``）
+
+默认使用按固定随机种子生成的页面；也可以传入保存的页面，按文件名中的 ``authserver``、``sso``、``card``
+选择解析器，例如::
+
+    python benchmarks/bench_page_scanner.py
+    python benchmarks/bench_page_scanner.py saved/authserver_login.html saved/card_index.html
+"""
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mycqu.auth._page_parser import _AuthPageParser, _SSOPageParser  # noqa: E402
+from mycqu.card._help import _CardPageParser  # noqa: E402
+
+from _timing import measure, report  # noqa: E402
+
+
+def _filler(rng: random.Random, elements: int) -> str:
+    tags = ('div', 'span', 'a', 'li', 'p')
+    return ''.join(
+        f'<{tag} class="c{rng.randrange(100)}" data-i="{i}">文本 {rng.random():.6f}</{tag}>'
+        for i, tag in ((i, rng.choice(tags)) for i in range(elements))
+    )
+
+
+def _authserver_page(rng: random.Random, elements: int) -> str:
+    inputs = ''.join(f'<input type="hidden" name="{name}" value="{name}-{rng.randrange(10 ** 8)}"/>'
+                     for name in ('lt', 'dllt', 'execution', '_eventId', 'rmShown'))
+    return (f'<html><head><script type="text/javascript">var pwdDefaultEncryptSalt = "{rng.randrange(10 ** 16)}";'
+            f'</script></head><body>{_filler(rng, elements)}<form id="casLoginForm">{inputs}</form>'
+            f'{_filler(rng, elements // 4)}</body></html>')
+
+
+def _sso_page(rng: random.Random, elements: int) -> str:
+    fields = ''.join(f'<p id="{name}">{name}-{rng.randrange(10 ** 8)}</p>'
+                     for name in ('login-croypto', 'login-page-flowkey', 'captcha-url'))
+    return f'<html><body>{_filler(rng, elements)}{fields}{_filler(rng, elements // 4)}</body></html>'
+
+
+def _card_page(rng: random.Random, elements: int) -> str:
+    return (f'<html><body>{_filler(rng, elements)}<form><input type="hidden" name="ssoticketid" '
+            f'value="{rng.randrange(10 ** 16)}"/></form>{_filler(rng, elements // 4)}</body></html>')
+
+
+def _auth_result(parser: _AuthPageParser) -> Tuple:
+    return parser.salt, tuple(sorted(parser.input_data.items()))
+
+
+_PARSERS: Dict[str, Tuple[Callable[[], object], Callable[[object], object]]] = {
+    'authserver': (_AuthPageParser, _auth_result),
+    'sso': (_SSOPageParser, lambda parser: parser.data),
+    'card': (_CardPageParser, lambda parser: parser.ssoticket_id),
+}
+
+
+def _run(kind: str, name: str, page: str) -> None:
+    factory, result = _PARSERS[kind]
+
+    def scan():
+        parser = factory()
+        parser.parse(page)
+        return result(parser)
+
+    def feed():
+        parser = factory()
+        try:
+            parser.feed(page)
+        except _SSOPageParser._AllValuesGot:
+            # 原有的解析在取得全部目标后以异常提前结束
+            pass
+        return result(parser)
+
+    assert scan() == feed(), f'{name}: scan and feed disagree'
+    report(f'{name} ({len(page) // 1024} KiB)', [('HTMLParser.feed', measure(feed)), ('PageScanner', measure(scan))])
+
+
+def main(paths: List[str]) -> None:
+    if paths:
+        for path in paths:
+            kind = next((kind for kind in _PARSERS if kind in Path(path).name), None)
+            if kind is None:
+                raise SystemExit(f'cannot tell the page type of {path}')
+            _run(kind, path, Path(path).read_text(encoding='utf-8'))
+        return
+    rng = random.Random(0)
+    for elements in (200, 2000):
+        _run('authserver', f'authserver, {elements} elements', _authserver_page(rng, elements))
+        _run('sso', f'sso, {elements} elements', _sso_page(rng, elements))
+        _run('card', f'card, {elements} elements', _card_page(rng, elements))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,34 @@
+"""按 orjson、msgspec、标准库的顺序加载 json 解析函数
+"""
+from typing import Any, Union
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    try:
+        from msgspec import DecodeError as _DecodeError
+        from msgspec.json import decode as _decode
+    except ImportError:
+        from json import loads as _loads
+    else:
+        def _loads(data: Union[bytes, str]) -> Any:
+            try:
+                return _decode(data)
+            except _DecodeError as e:
+                # 与 orjson 和标准库一致的抛出 ValueError
+                raise ValueError(str(e)) from e
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """反序列化 json，直接传入响应的 ``content`` 以免先解码为 str
+
+    :param data: utf-8 编码的 json 或 json 字符串
+    :type data: Union[bytes, bytearray, memoryview, str]
+    :raises ValueError: json 格式错误时抛出
+    :return: 反序列化得到的对象
+    :rtype: Any
+    """
+    return _loads(data)
+
+
+__all__ = ("loads",)
@@ -7,38 +7,50 @@ from requests import Session, Response
 
 from ._authserver import *
 from ._sso import *
+from ._services import *
 from ..exception import NeedCaptcha, InvaildCaptcha
 from ..utils.request_transformer import Request
 
 
-__all__ = ['is_logined', 'logout', 'access_service', 'login',
-           'async_is_logined', 'async_logout', 'async_access_service', 'async_login']
+__all__ = ['is_logined', 'logout', 'access_service', 'access_services', 'login',
+           'async_is_logined', 'async_logout', 'async_access_service', 'async_access_services', 'async_login']
 
 
-def is_logined(session: Session, use_sso: bool = True) -> bool:
+def is_logined(session: Session, use_sso: bool = True, verify: bool = False) -> bool:
     """判断是否处于统一身份认证登陆状态
 
+    配置项`auth.login_state_ttl`（秒，默认为 0 即不缓存）大于 0 时，优先使用从此前响应中观察到、
+    且未超过该时长的登陆状态，不发出请求；任一请求返回 401 后缓存失效
+
     :param session: 会话
     :type session: Session
     :param use_sso: 是否使用 sso 而非 authserver, 默认为 :obj::`True`
     :type use_sso: bool, optional
+    :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+    :type verify: bool, optional
     :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
     :rtype: bool
     """
-    return is_sso_logined(session) if use_sso else is_authserver_logined(session)
+    return is_sso_logined(session, verify) if use_sso else is_authserver_logined(session, verify)
 
-async def async_is_logined(session: Generic[Request], use_sso: bool = True) -> bool:
+async def async_is_logined(session: Generic[Request], use_sso: bool = True, verify: bool = False) -> bool:
     """
     异步的判断是否处于统一身份认证登陆状态
 
+    配置项`auth.login_state_ttl`（秒，默认为 0 即不缓存）大于 0 时，优先使用从此前响应中观察到、
+    且未超过该时长的登陆状态，不发出请求；任一请求返回 401 后缓存失效
+
     :param session: 会话
     :type session: Session
     :param use_sso: 是否使用 sso 而非 authserver, 默认为 :obj::`True`
     :type use_sso: bool, optional
+    :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+    :type verify: bool, optional
     :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
     :rtype: bool
     """
-    return await async_is_sso_logined(session) if use_sso else await async_is_authserver_logined(session)
+    return await async_is_sso_logined(session, verify) if use_sso \
+        else await async_is_authserver_logined(session, verify)
 
 
 def logout(session: Session, use_sso: bool = True) -> None:
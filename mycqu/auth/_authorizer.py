@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from http.cookiejar import CookieJar
+from time import monotonic
 from typing import Optional, Callable, Dict, NoReturn, Union, Awaitable, Generic
 from functools import partial
+from urllib.parse import urlsplit
 
 from ..exception import NeedCaptcha, InvaildCaptcha, NotLogined
+from ..utils.config import ConfigManager
+from ..utils.login_state import observe_login_state, get_login_state
 from ..utils.request_transformer import Request, Response, RequestTransformer
 
 
@@ -128,35 +133,94 @@ class Authorizer(ABC, Generic[Request]):
 
         return await authorizer._login.async_request(authorizer.session, request_data)
 
+    @classmethod
+    def _observe_login_state(cls, session: Request, logined: bool) -> None:
+        """
+        记录从响应中观察到的登陆状态
+        """
+        observe_login_state(session, cls.LOGIN_URL, logined)
+
+    @classmethod
+    def _has_login_cookies(cls, session: Request) -> bool:
+        """
+        会话中是否还有未过期的登陆站点 cookie，无法检查时返回 :obj:`True`
+        """
+        cookies = getattr(session, 'cookies', None)
+        jar = getattr(cookies, 'jar', cookies)
+        if not isinstance(jar, CookieJar):
+            return True
+        host = urlsplit(cls.LOGIN_URL).hostname
+        for cookie in jar:
+            domain = cookie.domain.lstrip('.')
+            if (host == domain or host.endswith('.' + domain)) and not cookie.is_expired():
+                return True
+        return False
+
+    @classmethod
+    def _cached_login_state(cls, session: Request) -> Optional[bool]:
+        """
+        获取缓存的登陆状态，未启用缓存、缓存不存在或已超过配置项`auth.login_state_ttl`（秒）时返回 :obj:`None`
+        """
+        ttl = ConfigManager().config['auth']['login_state_ttl']
+        if not ttl:
+            return None
+        state = get_login_state(session, cls.LOGIN_URL)
+        if state is None or monotonic() - state[1] > ttl:
+            return None
+        if state[0] and not cls._has_login_cookies(session):
+            cls._observe_login_state(session, False)
+            return False
+        return state[0]
+
     @classmethod
     @RequestTransformer.register()
     def _is_logined(cls, session: Request) -> bool:
         assert cls.LOGIN_URL != '', '子类未重写`IS_LOGINED_URL`'
         res = yield session.get(cls.LOGIN_URL, allow_redirects=False)
-        return res.status_code == 302
+        logined = res.status_code == 302
+        cls._observe_login_state(session.requestable, logined)
+        return logined
 
     @classmethod
-    def is_logined(cls, session: Request) -> bool:
+    def is_logined(cls, session: Request, verify: bool = False) -> bool:
         """
         判断是否处于统一身份认证登陆状态
 
+        配置项`auth.login_state_ttl`（秒，默认为 0 即不缓存）大于 0 时，优先使用从此前响应中观察到、
+        且未超过该时长的登陆状态，不发出请求；任一请求返回 401 后缓存失效
+
         :param session: 会话
         :type session: Session
+        :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+        :type verify: bool, optional
         :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
         :rtype: bool
         """
+        if not verify:
+            cached = cls._cached_login_state(session)
+            if cached is not None:
+                return cached
         return cls._is_logined.sync_request(session)
 
     @classmethod
-    async def async_is_logined(cls, session: Request) -> bool:
+    async def async_is_logined(cls, session: Request, verify: bool = False) -> bool:
         """
         异步的判断是否处于统一身份认证登陆状态
 
+        配置项`auth.login_state_ttl`（秒，默认为 0 即不缓存）大于 0 时，优先使用从此前响应中观察到、
+        且未超过该时长的登陆状态，不发出请求；任一请求返回 401 后缓存失效
+
         :param session: 会话
         :type session: Session
+        :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+        :type verify: bool, optional
         :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
         :rtype: bool
         """
+        if not verify:
+            cached = cls._cached_login_state(session)
+            if cached is not None:
+                return cached
         return await cls._is_logined.async_request(session)
 
 
@@ -165,6 +229,7 @@ class Authorizer(ABC, Generic[Request]):
     def _access_service(cls, session: Request, service: str) -> Response:
         assert cls.LOGIN_URL != '', '子类未重写`ACCESS_SERVICE_URL`'
         resp = yield session.get(cls.LOGIN_URL, params={"service": service}, allow_redirects=False)
+        cls._observe_login_state(session.requestable, resp.status_code == 302)
         if resp.status_code != 302:
             # TODO
             raise NotLogined()
@@ -206,6 +271,7 @@ class Authorizer(ABC, Generic[Request]):
     def _logout(cls, session: Request) -> None:
         assert cls.LOGOUT_URL != '', '子类未重写`LOGOUT_URL`'
         yield session.get(cls.LOGOUT_URL)
+        cls._observe_login_state(session.requestable, False)
 
     @classmethod
     def logout(cls, session: Request) -> None:
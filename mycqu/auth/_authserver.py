@@ -15,26 +15,30 @@ __all__ = ['is_authserver_logined', 'logout_authserver', 'login_authserver', 'ac
            'async_is_authserver_logined', 'async_logout_authserver',
            'async_login_authserver', 'async_access_authserver_service']
 
-def is_authserver_logined(session: Session) -> bool:
+def is_authserver_logined(session: Session, verify: bool = False) -> bool:
     """判断是否处于统一身份认证（authserver）登陆状态
 
     :param session: 会话
     :type session: Session
+    :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+    :type verify: bool, optional
     :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
     :rtype: bool
     """
-    return AuthserverAuthorizer[Session].is_logined(session)
+    return AuthserverAuthorizer[Session].is_logined(session, verify)
 
-async def async_is_authserver_logined(session: Request) -> bool:
+async def async_is_authserver_logined(session: Request, verify: bool = False) -> bool:
     """
     异步的判断是否处于统一身份认证（authserver）登陆状态
 
     :param session: 会话
     :type session: Session
+    :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+    :type verify: bool, optional
     :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
     :rtype: bool
     """
-    return await AuthserverAuthorizer.async_is_logined(session)
+    return await AuthserverAuthorizer.async_is_logined(session, verify)
 
 def logout_authserver(session: Session) -> None:
     """注销统一身份认证登录（authserver）状态
@@ -95,6 +99,7 @@ class AuthserverAuthorizer(Authorizer, Generic[Request]):
         )
 
         login_page = yield session.get(**get_login_page_params)
+        self._observe_login_state(session.requestable, login_page.status_code == 302)
         if login_page.status_code == 302:
             if not self.force_relogin:
                 return login_page
@@ -131,7 +136,7 @@ class AuthserverAuthorizer(Authorizer, Generic[Request]):
 
     def _handle_login_error(self, login_resp: Response):
         parser = _LoginedPageParser(login_resp.status_code)
-        parser.feed(login_resp.text)
+        parser.parse(login_resp.text)
 
         if parser._kick:  # pylint: ignore disable=protected-access
             @RequestTransformer.register()
@@ -168,6 +173,7 @@ class AuthserverAuthorizer(Authorizer, Generic[Request]):
         login_resp = yield session.post(
             url=self.LOGIN_URL, data=request_data, allow_redirects=False)
 
+        self._observe_login_state(session.requestable, login_resp.status_code == 302)
         if login_resp.status_code != 302:
             return self._handle_login_error(login_resp)
         return (yield session.get(url=login_resp.headers['Location'], allow_redirects=False))
@@ -1,10 +1,13 @@
 import random
 import re
 from base64 import b64encode
+from html import unescape
 from html.parser import HTMLParser
-from typing import Dict, Optional
+from typing import Dict, Optional, NoReturn
 
 from .._lib_wrapper.encrypt import pad16, aes_cbc_encryptor
+from ..utils.page_scanner import PageScanner, element_text, element_inner, element_tag, attr_value, strip_tags, \
+    last_tag_end
 from mycqu.exception import NotAllowedService, InvaildCaptcha, IncorrectLoginCredentials, \
     UnknownAuthserverException, ParseError
 
@@ -13,6 +16,10 @@ _CHAR_SET = 'ABCDEFGHJKMNPQRSTWXYZabcdefhijkmnprstwxyz2345678'
 
 class _AuthPageParser(HTMLParser):
     _SALT_RE: re.Pattern = re.compile('var pwdDefaultEncryptSalt = "([^"]+)"')
+    _INPUT_NAMES = ('lt', 'dllt', 'execution', '_eventId', 'rmShown')
+    _SALT_SCANNER = PageScanner({'salt': _SALT_RE.pattern})
+    _SCANNER = PageScanner({name: element_tag('input', name=name) for name in _INPUT_NAMES}, optional=_INPUT_NAMES)
+    _ERROR_RE: re.Pattern = re.compile(element_tag('div', id='msg', **{'class': 'errors'}))
 
     def __init__(self):
         super().__init__()
@@ -27,6 +34,20 @@ class _AuthPageParser(HTMLParser):
         self._error: bool = False
         self._error_head: bool = False
 
+    def parse(self, page: str) -> None:
+        if self._ERROR_RE.search(page) is None:
+            salt = self._SALT_SCANNER.scan(page)
+            if salt is not None:
+                self.salt = salt['salt']
+                # 表单字段取最后一次出现的值，扫描到最后一个 input 标签即可结束
+                found = self._SCANNER.scan(page, last=True, endpos=last_tag_end(page, 'input'))
+                for name in self._INPUT_NAMES:
+                    if found[name] is not None:
+                        self.input_data[name] = attr_value(found[name], 'value')
+                return
+        # 出现错误信息或未找到盐时，由完整的解析过程给出错误或结果
+        self.feed(page)
+
     def handle_starttag(self, tag, attrs):
         if tag == 'input':
             name: Optional[str] = None
@@ -64,6 +85,9 @@ class _AuthPageParser(HTMLParser):
 
 class _SSOPageParser(HTMLParser):
     _SALT_RE: re.Pattern = re.compile('var pwdDefaultEncryptSalt = "([^"]+)"')
+    _SCANNER = PageScanner({
+        name: element_text('p', id=name) for name in ('login-croypto', 'login-page-flowkey', 'captcha-url')
+    })
 
     class _AllValuesGot(Exception):
         pass
@@ -76,6 +100,10 @@ class _SSOPageParser(HTMLParser):
         self._count = len(self.data)
 
     def parse(self, page: str) -> Dict[str, str]:
+        found = self._SCANNER.scan(page)
+        if found is not None and all(value.strip() for value in found.values()):
+            self.data = {name: strip_tags(value).strip() for name, value in found.items()}
+            return self.data  # type: ignore
         try:
             self.feed(page)
         except self._AllValuesGot:
@@ -102,6 +130,8 @@ class _SSOPageParser(HTMLParser):
 
 
 class _SSOErrorParser(HTMLParser):
+    _SCANNER = PageScanner({'error': element_inner('div', id='login-error-msg')})
+
     class _ErrorGot(Exception):
         pass
 
@@ -111,6 +141,9 @@ class _SSOErrorParser(HTMLParser):
         self._error_div_opened: bool = False
 
     def parse(self, page: str) -> Optional[int]:
+        found = self._SCANNER.scan(page)
+        if found is not None:
+            return int(strip_tags(found['error']).strip())
         try:
             self.feed(page)
         except self._ErrorGot:
@@ -136,6 +169,13 @@ class _LoginedPageParser(HTMLParser):
     KICK_TABLE_ATTRS = [("class", "kick_table")]
     KICK_POST_ATTRS = [('method', 'post'), ('id', 'continue')]
     CANCEL_POST_ATTRS = [('method', 'post'), ('id', 'cancel')]
+    _EXECUTION_INPUT = r'.*?(<input\b[^>]*\bname\s*=\s*["\']execution["\'][^>]*>)'
+    _MSG_SCANNER = PageScanner({'msg': element_text('span', id='msg', **{'class': 'login_auth_error'})})
+    _KICK_SCANNER = PageScanner({
+        'kick': element_tag('table', **{'class': 'kick_table'}),
+        'kick_execution': r'<form\b(?=[^>]*\bid\s*=\s*["\']continue["\'])[^>]*>' + _EXECUTION_INPUT,
+        'cancel_execution': r'<form\b(?=[^>]*\bid\s*=\s*["\']cancel["\'])[^>]*>' + _EXECUTION_INPUT,
+    })
 
     def __init__(self, status_code: int):
         super().__init__()
@@ -147,6 +187,30 @@ class _LoginedPageParser(HTMLParser):
         self._cancel_execution: str = ""
         self.status_code: int = status_code
 
+    def parse(self, page: str) -> None:
+        found = self._MSG_SCANNER.scan(page)
+        if found is not None:
+            self._raise_error(unescape(found['msg']).strip())
+        found = self._KICK_SCANNER.scan(page)
+        if found is not None:
+            self._kick = True
+            self._kick_execution = attr_value(found['kick_execution'], 'value') or ""
+            self._cancel_execution = attr_value(found['cancel_execution'], 'value') or ""
+            return
+        # 既无错误信息也无下线其他会话的表单时，由完整的解析过程确认
+        self.feed(page)
+
+    def _raise_error(self, error_str: str) -> NoReturn:
+        if error_str == "无效的验证码":
+            raise InvaildCaptcha()
+        elif error_str == "您提供的用户名或者密码有误":
+            raise IncorrectLoginCredentials()
+        else:
+            raise UnknownAuthserverException(
+                f"status code {self.status_code} is got (302 expected)"
+                f" when sending login post, {error_str}"
+            )
+
     def handle_starttag(self, tag, attrs):
         if tag == "span" and attrs == self.MSG_ATTRS:
             self._msg = True
@@ -170,16 +234,7 @@ class _LoginedPageParser(HTMLParser):
 
     def handle_data(self, data):
         if self._msg:
-            error_str = data.strip()
-            if error_str == "无效的验证码":
-                raise InvaildCaptcha()
-            elif error_str == "您提供的用户名或者密码有误":
-                raise IncorrectLoginCredentials()
-            else:
-                raise UnknownAuthserverException(
-                    f"status code {self.status_code} is got (302 expected)"
-                    f" when sending login post, {error_str}"
-                )
+            self._raise_error(data.strip())
 
 def _random_str(length: int) -> str:
     return ''.join(random.choices(_CHAR_SET, k=length))
@@ -187,7 +242,7 @@ def _random_str(length: int) -> str:
 def _get_formdata(html: str, username: str, password: str) -> Dict[str, Optional[str]]:
     # from https://github.com/CQULHW/CQUQueryGrade
     parser = _AuthPageParser()
-    parser.feed(html)
+    parser.parse(html)
     salt = parser.salt
     if not salt:
         ParseError("无法获取盐")
@@ -0,0 +1,254 @@
+"""
+各服务（mycqu、card、library 等）在统一身份认证之上的认证流程的登记与并发执行
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from time import monotonic
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
+from ..exception import NotAllowedService
+from ..utils.clients import TokenClient, AsyncTokenClient
+from ..utils.host_headers import set_host_headers, remove_host_headers, suspend_host_headers
+from ..utils.request_transformer import Request, Response, RequestTransformer
+from ..utils.request_transformer.models import RequestParams
+from ._sso import SSOAuthorizer
+from ._authserver import AuthserverAuthorizer
+
+__all__ = ['access_services', 'async_access_services', 'ServiceAccessRecovery']
+
+
+class _Service(NamedTuple):
+    name: str
+    """服务名称，如 :obj:`"mycqu"`"""
+    hosts: Tuple[str, ...]
+    """服务接口所在的主机名"""
+    handshake: RequestTransformer
+    """服务的认证流程，接受 ``use_sso`` 参数，返回需要写入会话请求头的认证信息"""
+    headers: Tuple[str, ...]
+    """认证流程会写入会话的请求头名称，仅附加到发往 :attr:`hosts` 的请求"""
+
+
+_SERVICES: Dict[str, _Service] = {}
+
+
+def _register_service(name: str, hosts: Tuple[str, ...], handshake: RequestTransformer,
+                      headers: Tuple[str, ...] = ()) -> None:
+    """
+    登记某个服务的认证流程，供 :func:`access_services` 使用
+    """
+    _SERVICES[name] = _Service(name, hosts, handshake, headers)
+
+
+@RequestTransformer.register()
+def _access_service(session: Request, service: str, use_sso: bool = True) -> Response:
+    authorizer = SSOAuthorizer if use_sso else AuthserverAuthorizer
+    return (yield authorizer._access_service, {'service': service})
+
+
+def _resolve_services(services: Iterable[str]) -> List[_Service]:
+    names = set(services)
+    for name in names:
+        if name not in _SERVICES:
+            raise NotAllowedService(f"unknown service {name}")
+    # 按登记顺序排列，保证写入请求头的顺序确定
+    return [service for name, service in _SERVICES.items() if name in names]
+
+
+def _clear_headers(session: Request, targets: List[_Service]) -> None:
+    for service in targets:
+        # 同时清除旧版本写入公共请求头的认证信息，否则其会优先于按主机附加的请求头
+        for header in service.headers:
+            if header in session.headers:
+                del session.headers[header]
+        remove_host_headers(session, service.hosts, service.headers)
+
+
+def _set_headers(session: Request, service: _Service, headers: Dict[str, str]) -> None:
+    set_host_headers(session, service.hosts, headers)
+
+
+def _suspend_headers(targets: List[_Service]):
+    # 认证过程中不发送旧的认证信息，但在全部认证成功前保留它们
+    return suspend_host_headers(host for service in targets for host in service.hosts)
+
+
+def _apply_results(session: Request, targets: List[_Service], results: List[Dict[str, str]],
+                   add_to_header: bool) -> Dict[str, Dict[str, str]]:
+    if add_to_header:
+        for service, headers in zip(targets, results):
+            _clear_headers(session, [service])
+            _set_headers(session, service, headers)
+    return {service.name: headers for service, headers in zip(targets, results)}
+
+
+def access_services(session: Request, services: Iterable[str], use_sso: bool = True,
+                    add_to_header: bool = True) -> Dict[str, Dict[str, str]]:
+    """用登陆了统一身份认证的会话并发地在多个服务进行认证
+
+    各服务的认证流程（获取服务许可及其后续的 token 请求）在多个线程中同时进行，
+    认证期间发往这些服务的请求不附加旧的认证信息；全部成功后才一次性替换会话中这些服务的认证信息，
+    任一服务认证失败时抛出其异常，会话中原有的认证信息保持不变。
+    各服务的认证信息只附加到发往该服务主机的请求（参见 :func:`.utils.host_headers.set_host_headers`），
+    因此 mycqu 与 library 的 ``Authorization`` 请求头可以同时保存在一个会话中；
+    认证信息不会写入 ``session.headers``，旧版本写入其中的同名请求头会在认证成功后被移除，
+    需要 token 本身时请使用返回值。
+
+    >>> access_services(session, {"mycqu", "card", "library"})
+
+    :param session: 登陆了统一身份认证的会话
+    :type session: Session
+    :param services: 需要认证的服务名称，可选 :obj:`"mycqu"`、:obj:`"card"`、:obj:`"library"`
+    :type services: Iterable[str]
+    :param use_sso: 是否使用 sso 而非 authserver, 默认为 :obj::`True`
+    :type use_sso: bool, optional
+    :param add_to_header: 是否将认证信息写入会话属性，默认为 :obj:`True`
+    :type add_to_header: bool, optional
+    :raises NotAllowedService: 服务名称未知时抛出
+    :raises NotLogined: 统一身份认证未登录时抛出
+    :return: 服务名称到该服务认证信息请求头的映射
+    :rtype: Dict[str, Dict[str, str]]
+    """
+    targets = _resolve_services(services)
+    with _suspend_headers(targets):
+        if len(targets) <= 1:
+            results = [service.handshake.sync_request(session, use_sso) for service in targets]
+        else:
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                # 每个线程在当前上下文的副本中运行，以沿用暂停附加的请求头
+                futures = [executor.submit(copy_context().run, service.handshake.sync_request, session, use_sso)
+                           for service in targets]
+                results = [future.result() for future in futures]
+    return _apply_results(session, targets, results, add_to_header)
+
+
+async def async_access_services(session: Request, services: Iterable[str], use_sso: bool = True,
+                                add_to_header: bool = True) -> Dict[str, Dict[str, str]]:
+    """异步的用登陆了统一身份认证的会话并发地在多个服务进行认证
+
+    各服务的认证流程同时进行，全部成功后才一次性替换会话中这些服务的认证信息；
+    任一服务认证失败时抛出其异常，会话中原有的认证信息保持不变。
+
+    :param session: 登陆了统一身份认证的会话
+    :type session: Request
+    :param services: 需要认证的服务名称，可选 :obj:`"mycqu"`、:obj:`"card"`、:obj:`"library"`
+    :type services: Iterable[str]
+    :param use_sso: 是否使用 sso 而非 authserver, 默认为 :obj::`True`
+    :type use_sso: bool, optional
+    :param add_to_header: 是否将认证信息写入会话属性，默认为 :obj:`True`
+    :type add_to_header: bool, optional
+    :raises NotAllowedService: 服务名称未知时抛出
+    :raises NotLogined: 统一身份认证未登录时抛出
+    :return: 服务名称到该服务认证信息请求头的映射
+    :rtype: Dict[str, Dict[str, str]]
+    """
+    targets = _resolve_services(services)
+    with _suspend_headers(targets):
+        results = list(await asyncio.gather(
+            *(service.handshake.async_request(session, use_sso) for service in targets)
+        ))
+    return _apply_results(session, targets, results, add_to_header)
+
+
+_IN_HANDSHAKE: ContextVar[bool] = ContextVar('_IN_HANDSHAKE', default=False)
+
+
+class ServiceAccessRecovery:
+    """
+    请求已登记服务（mycqu、card、library）的接口返回 401 时，重新进行一次该服务的认证，
+    认证成功后由 :class:`RequestTransformer` 重新发出失败的请求
+
+    重新认证得到的请求头只附加到发往该服务主机的请求，不影响同一会话中其他服务的认证信息；
+    同一会话同一服务的并发恢复只会进行一次认证，其余请求等待认证结束后直接重发；
+    自带 ``Authorization`` 请求头的请求及 :class:`.utils.clients.TokenClient` 发出的请求不会尝试恢复。
+    启用方式：
+
+    >>> from mycqu.utils.config import ConfigManager
+    >>> ConfigManager().config['request']['unauthorized_recovery'] = ServiceAccessRecovery()
+    """
+
+    def __init__(self, use_sso: bool = True):
+        """
+        :param use_sso: 重新认证时是否使用 sso 而非 authserver, 默认为 :obj::`True`
+        :type use_sso: bool, optional
+        """
+        self.use_sso = use_sso
+        self._lock = threading.Lock()
+        self._sync_locks: WeakKeyDictionary = WeakKeyDictionary()
+        self._async_tasks: WeakKeyDictionary = WeakKeyDictionary()
+        self._refreshed_at: WeakKeyDictionary = WeakKeyDictionary()
+
+    @staticmethod
+    def _match_service(request: Request, params: RequestParams) -> Optional[_Service]:
+        if isinstance(request, (TokenClient, AsyncTokenClient)):
+            return None
+        headers = params.other_params.get('headers') or {}
+        if any(key.lower() == 'authorization' for key in headers):
+            return None
+        host = urlsplit(params.url).hostname
+        for service in _SERVICES.values():
+            if host in service.hosts:
+                return service
+        return None
+
+    def _refreshed_since(self, session: Request, service: _Service, sent_at: float) -> bool:
+        return self._refreshed_at.get(session, {}).get(service.name, float('-inf')) > sent_at
+
+    def _mark_refreshed(self, session: Request, service: _Service) -> None:
+        with self._lock:
+            self._refreshed_at.setdefault(session, {})[service.name] = monotonic()
+
+    def recover(self, request: Request, params: RequestParams, sent_at: float) -> bool:
+        """
+        同步的恢复认证状态
+
+        :return: 是否需要重新发出请求
+        :rtype: bool
+        """
+        service = self._match_service(request, params)
+        if service is None or _IN_HANDSHAKE.get():
+            return False
+        with self._lock:
+            lock = self._sync_locks.setdefault(request, {}).setdefault(service.name, threading.Lock())
+        with lock:
+            if not self._refreshed_since(request, service, sent_at):
+                token = _IN_HANDSHAKE.set(True)
+                try:
+                    with _suspend_headers([service]):
+                        headers = service.handshake.sync_request(request, self.use_sso)
+                    _apply_results(request, [service], [headers], True)
+                finally:
+                    _IN_HANDSHAKE.reset(token)
+                self._mark_refreshed(request, service)
+        return True
+
+    async def _async_refresh(self, request: Request, service: _Service) -> None:
+        _IN_HANDSHAKE.set(True)
+        with _suspend_headers([service]):
+            headers = await service.handshake.async_request(request, self.use_sso)
+        _apply_results(request, [service], [headers], True)
+        self._mark_refreshed(request, service)
+
+    async def async_recover(self, request: Request, params: RequestParams, sent_at: float) -> bool:
+        """
+        异步的恢复认证状态
+
+        :return: 是否需要重新发出请求
+        :rtype: bool
+        """
+        service = self._match_service(request, params)
+        if service is None or _IN_HANDSHAKE.get():
+            return False
+        if self._refreshed_since(request, service, sent_at):
+            return True
+        tasks = self._async_tasks.setdefault(request, {})
+        task = tasks.get(service.name)
+        if task is None:
+            task = asyncio.ensure_future(self._async_refresh(request, service))
+            tasks[service.name] = task
+            task.add_done_callback(lambda _: tasks.pop(service.name, None))
+        await asyncio.shield(task)
+        return True
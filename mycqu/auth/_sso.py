@@ -19,26 +19,30 @@ _SSO_ERROR_CODES = {1030027: '用户名或密码错误，请确认后重新输
 __all__ = ['is_sso_logined', 'logout_sso', 'access_sso_service', 'login_sso',
            'async_is_sso_logined', 'async_logout_sso', 'async_access_sso_service', 'async_login_sso']
 
-def is_sso_logined(session: Session) -> bool:
+def is_sso_logined(session: Session, verify: bool = False) -> bool:
     """判断是否处于统一身份认证（sso）登陆状态
 
     :param session: 会话
     :type session: Session
+    :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+    :type verify: bool, optional
     :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
     :rtype: bool
     """
-    return SSOAuthorizer[Session].is_logined(session)
+    return SSOAuthorizer[Session].is_logined(session, verify)
 
-async def async_is_sso_logined(session: Request) -> bool:
+async def async_is_sso_logined(session: Request, verify: bool = False) -> bool:
     """
     异步的判断是否处于统一身份认证（sso）登陆状态
 
     :param session: 会话
     :type session: Session
+    :param verify: 是否忽略缓存的登陆状态，强制通过网络请求判断，默认为 :obj:`False`
+    :type verify: bool, optional
     :return: :obj:`True` 如果处于登陆状态，:obj:`False` 如果处于未登陆或登陆过期状态
     :rtype: bool
     """
-    return await SSOAuthorizer.async_is_logined(session)
+    return await SSOAuthorizer.async_is_logined(session, verify)
 
 def logout_sso(session: Session) -> None:
     """注销统一身份认证（sso）登录状态
@@ -113,6 +117,7 @@ class SSOAuthorizer(Authorizer, Generic[Request]):
             allow_redirects=False,
             timeout=self.timeout
         )
+        self._observe_login_state(session.requestable, resp.status_code == 302)
         if resp.status_code == 302:
             if self.force_relogin:
                 yield self._logout
@@ -159,6 +164,7 @@ class SSOAuthorizer(Authorizer, Generic[Request]):
                                   data=request_data,
                                   allow_redirects=False,
                                   timeout=self.timeout)
+        self._observe_login_state(session.requestable, login_resp.status_code == 302)
         if login_resp.status_code == 302:
             return (yield session.get(login_resp.headers['Location'], allow_redirects=False, timeout=self.timeout))
         elif login_resp.status_code == 401:
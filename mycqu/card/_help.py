@@ -1,15 +1,27 @@
-import json
 from html.parser import HTMLParser
+from .._lib_wrapper.fastjson import loads
 from ..exception import TicketGetError, ParseError, CQUWebsiteError
+from ..utils.page_scanner import PageScanner, element_tag, attr_value
 from ..utils.request_transformer import Request, RequestTransformer
 
 
 class _CardPageParser(HTMLParser):
+    _SCANNER = PageScanner({'ssoticketid': element_tag('input', name='ssoticketid')})
+
     def __init__(self):
         super().__init__()
         self._starttag: bool = False
         self.ssoticket_id: str = ""
 
+    def parse(self, page: str) -> str:
+        found = self._SCANNER.scan(page)
+        if found is not None:
+            self._starttag = True
+            self.ssoticket_id = attr_value(found['ssoticketid'], 'value') or ""
+        else:
+            self.feed(page)
+        return self.ssoticket_id
+
     def handle_starttag(self, tag, attrs):
         if not self._starttag and tag == 'input' and ('name', 'ssoticketid') in attrs:
             self._starttag = True
@@ -65,7 +77,7 @@ def _get_synjones_auth(session: Request, ticket: str):
     if r.status_code != 200:
         raise CQUWebsiteError()
     try:
-        dic = json.loads(r.text)
+        dic = loads(r.content)
         token = dic['data']['access_token']
     except:
         raise ParseError()
@@ -88,7 +100,7 @@ def _get_fee_data(session: Request, synjones_auth, room, fee_item_id):
     r = yield session.post(url, data=data, cookies=cookie)
     if r.status_code != 200:
         raise CQUWebsiteError()
-    dic = json.loads(r.text)
+    dic = loads(r.content)
     if dic['msg'] == 'success':
         return dic
     else:
@@ -0,0 +1,36 @@
+"""
+校园卡相关原始响应的结构，字段类型与 ``fetch`` 和 ``from_dict`` 的取值方式一致
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+from typing_extensions import TypedDict
+
+
+class CardData(TypedDict):
+    """``objs`` 中的一项"""
+    acctNo: str
+    acctAmt: float
+
+
+class _CardResponseRequired(TypedDict):
+    respCode: str
+
+
+class CardResponse(_CardResponseRequired, total=False):
+    respInfo: Optional[str]
+    objs: Optional[List[CardData]]
+
+
+class BillData(TypedDict):
+    """``rows`` 中的一项"""
+    tranName: str
+    tranDt: str
+    mchAcctName: str
+    tranAmt: float
+    acctAmt: Union[int, str]
+
+
+class BillResponse(TypedDict):
+    rows: List[BillData]
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
 from pydantic import BaseModel
+from requests import Session
 
+from ..tools import BILL_PAGE_SIZE, _get_bill_raw
 from ...utils.datetimes import TIMEZONE
+from ...utils.construct import construct_model
+from ...utils.request_transformer import Request
 
 
 __all__ = ['Bill']
@@ -36,7 +41,8 @@ class Bill(BaseModel):
         :return: 账单对象
         :rtype: Bill
         """
-        return Bill(
+        return construct_model(
+            Bill,
             name=data['tranName'],
             date=datetime.datetime.strptime(
                 data['tranDt'], "%Y-%m-%d %H:%M:%S").replace(tzinfo=TIMEZONE),
@@ -44,3 +50,72 @@ class Bill(BaseModel):
             tran_amount=float(data['tranAmt'] / 100),
             acc_amount=float(int(data['acctAmt']) / 100)
         )
+
+    @staticmethod
+    def iter_fetch(session: Session, account: str, duration: int = 30,
+                   page_size: int = BILL_PAGE_SIZE) -> Iterator[Bill]:
+        """
+        从card.cqu.edu.cn分页获取校园卡账单，每收到一页即逐个返回其中的账单
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 card.cqu.edu.cn 进行了认证（:func:`.card.access_card`）的 requests 会话
+        :type session: Session
+        :param account: 校园卡卡号
+        :type account: str
+        :param duration: 查询时间间隔(默认为30天)
+        :type duration: int, optional
+        :param page_size: 每页的账单数量
+        :type page_size: int, optional
+        :return: 账单对象的迭代器
+        :rtype: Iterator[Bill]
+        """
+        end_date = datetime.datetime.now(tz=TIMEZONE)
+        page, previous = 1, None
+        while True:
+            rows = _get_bill_raw.sync_request(session, account, duration, typed=True, page=page,
+                                              page_size=page_size, end_date=end_date)
+            if rows == previous:
+                # 网站忽略分页参数时会重复返回同一页
+                return
+            for row in rows:
+                yield Bill.from_dict(row)
+            if len(rows) < page_size:
+                return
+            page, previous = page + 1, rows
+
+    @staticmethod
+    async def async_iter_fetch(session: Request, account: str, duration: int = 30,
+                               page_size: int = BILL_PAGE_SIZE) -> AsyncIterator[Bill]:
+        """
+        异步的从card.cqu.edu.cn分页获取校园卡账单，返回当前页的账单时已在请求下一页
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 card.cqu.edu.cn 进行了认证（:func:`.card.access_card`）的异步客户端
+        :type session: Request
+        :param account: 校园卡卡号
+        :type account: str
+        :param duration: 查询时间间隔(默认为30天)
+        :type duration: int, optional
+        :param page_size: 每页的账单数量
+        :type page_size: int, optional
+        :return: 账单对象的异步迭代器
+        :rtype: AsyncIterator[Bill]
+        """
+        end_date = datetime.datetime.now(tz=TIMEZONE)
+
+        def fetch(page: int) -> asyncio.Future:
+            return asyncio.ensure_future(_get_bill_raw.async_request(session, account, duration, typed=True, page=page,
+                                                                     page_size=page_size, end_date=end_date))
+
+        page, previous, task = 1, None, fetch(1)
+        try:
+            while task is not None:
+                rows = await task
+                if rows == previous:
+                    # 网站忽略分页参数时会重复返回同一页
+                    break
+                task = fetch(page + 1) if len(rows) >= page_size else None
+                for row in rows:
+                    yield Bill.from_dict(row)
+                page, previous = page + 1, rows
+        finally:
+            if task is not None:
+                task.cancel()
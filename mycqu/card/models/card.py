@@ -6,7 +6,7 @@ from requests import Session
 from pydantic import BaseModel
 
 from .bill import Bill
-from ..tools import get_card_raw, get_bill_raw, async_get_card_raw, async_get_bill_raw
+from ..tools import _get_card_raw
 from ...utils.request_transformer import Request
 
 
@@ -33,7 +33,7 @@ class Card(BaseModel):
         :return: 获取的校园卡信息
         :rtype: Card
         """
-        card_info = get_card_raw(session)
+        card_info = _get_card_raw.sync_request(session, typed=True)
 
         return Card(
             id=card_info['acctNo'],
@@ -51,7 +51,7 @@ class Card(BaseModel):
         :return: 获取的校园卡信息
         :rtype: Card
         """
-        card_info = await async_get_card_raw(session)
+        card_info = await _get_card_raw.async_request(session, typed=True)
 
         return Card(
             id=card_info['acctNo'],
@@ -64,15 +64,10 @@ class Card(BaseModel):
 
         :param session: 登录了统一身份认证（:func:`.auth.login`）并在 card.cqu.edu.cn 进行了认证（:func:`.card.access_card`）的 requests 会话
         :type session: Session
-        :return: 获取的校园卡账单信息
-        :rtype: dict
+        :return: 最近30天的全部校园卡账单
+        :rtype: List[Bill]
         """
-        bill_info = get_bill_raw(session, self.id, 30)
-        bills = []
-        for bill in bill_info:
-            bills.append(Bill.from_dict(bill))
-
-        return bills
+        return list(Bill.iter_fetch(session, self.id))
 
     async def async_fetch_bills(self, session: Request) -> List[Bill]:
         """
@@ -80,12 +75,7 @@ class Card(BaseModel):
 
         :param session: 登录了统一身份认证（:func:`.auth.login`）并在 card.cqu.edu.cn 进行了认证（:func:`.card.access_card`）的 requests 会话
         :type session: Session
-        :return: 获取的校园卡账单信息
-        :rtype: dict
+        :return: 最近30天的全部校园卡账单
+        :rtype: List[Bill]
         """
-        bill_info = await async_get_bill_raw(session, self.id, 30)
-        bills = []
-        for bill in bill_info:
-            bills.append(Bill.from_dict(bill))
-
-        return bills
\ No newline at end of file
+        return [bill async for bill in Bill.async_iter_fetch(session, self.id)]
\ No newline at end of file
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from ..tools import get_fees_raw, async_get_fees_raw
 from ...utils.request_transformer import Request
+from ...utils.construct import construct_model
 
 
 __all__ = ['EnergyFees']
@@ -37,18 +38,20 @@ class EnergyFees(BaseModel):
         :rtype: EnergyFees
         """
         if is_huxi:
-            return EnergyFees(
-                balance=data["剩余金额"],
-                electricity_subsidy=data["电剩余补助"],
-                water_subsidy=data["水剩余补助"],
+            return construct_model(
+                EnergyFees,
+                balance=float(data["剩余金额"]),
+                electricity_subsidy=data["电剩余补助"] and float(data["电剩余补助"]),
+                water_subsidy=data["水剩余补助"] and float(data["水剩余补助"]),
                 subsidies=None,
             )
         else:
-            return EnergyFees(
-                balance=data["现金余额"],
+            return construct_model(
+                EnergyFees,
+                balance=float(data["现金余额"]),
                 electricity_subsidy=None,
                 water_subsidy=None,
-                subsidies=data["补贴余额"],
+                subsidies=data["补贴余额"] and float(data["补贴余额"]),
             )
 
     @staticmethod
@@ -1,12 +1,15 @@
-import json
 import datetime
+from typing import Dict, Optional
 
 from requests import Session
 
+from ._schemas import BillResponse, CardResponse
 from ._help import _get_ticket, _get_synjones_auth, _get_fee_data, _CardPageParser, _get_hall_ticket
+from .._lib_wrapper.fastjson import loads
 from ..exception import CQUWebsiteError
-from ..auth import access_service, async_access_service
+from ..auth._services import _access_service, _register_service
 from ..utils.datetimes import TIMEZONE
+from ..utils.payload import decode_payload
 from ..utils.request_transformer import Request, RequestTransformer
 
 # 缴费大厅页面的不同缴费项目的id不同，虎溪和老校区不同
@@ -15,23 +18,32 @@ FEE_ITEM_ID = {'Huxi': '182',
 
 LOGIN_URL = 'http://card.cqu.edu.cn:7280/ias/prelogin?sysid=FWDT'
 
+BILL_PAGE_SIZE = 100
+
 __all__ = ['get_fees_raw', 'get_card_raw', 'get_bill_raw', 'access_card',
            'async_get_fees_raw', 'async_get_card_raw', 'async_get_bill_raw', 'async_access_card']
 
 
+@RequestTransformer.register()
+def _access_card_service(session: Request, use_sso: bool = True) -> Dict[str, str]:
+    res = yield _access_service, {'service': LOGIN_URL, 'use_sso': use_sso}
+    res = yield session.get(res.headers["Location"])
+
+    ssoticket_id = _CardPageParser().parse(res.text)
+    yield _get_hall_ticket, {'ssoticket_id': ssoticket_id}
+    return {}
+
+
+_register_service('card', ('card.cqu.edu.cn',), _access_card_service)
+
+
 def access_card(session: Request):
     """用登陆了统一身份认证的会话在 card.cqu.edu.cn 进行认证
 
     :param session: 登陆了统一身份认证的会话
     :type session: Session
     """
-    res = access_service(session, LOGIN_URL)
-    res = session.get(res.headers["Location"])
-
-    parser = _CardPageParser()
-    parser.feed(res.text)
-    ssoticket_id = parser.ssoticket_id
-    _get_hall_ticket.sync_request(session, ssoticket_id)
+    _access_card_service.sync_request(session)
 
 async def async_access_card(session: Request):
     """
@@ -40,13 +52,7 @@ async def async_access_card(session: Request):
     :param session: 登陆了统一身份认证的会话
     :type session: Session
     """
-    res = await async_access_service(session, LOGIN_URL)
-    res = await session.get(res.headers["Location"])
-
-    parser = _CardPageParser()
-    parser.feed(res.text)
-    ssoticket_id = parser.ssoticket_id
-    await _get_hall_ticket.async_request(session, ssoticket_id)
+    await _access_card_service.async_request(session)
 
 @RequestTransformer.register()
 def _get_fees_raw(session: Request, is_huxi: bool, room: str):
@@ -94,11 +100,12 @@ async def async_get_fees_raw(session: Request, is_huxi: bool, room: str):
     return await _get_fees_raw.async_request(session, is_huxi, room)
 
 @RequestTransformer.register()
-def _get_card_raw(session: Request):
+def _get_card_raw(session: Request, typed: bool = False):
     url = "http://card.cqu.edu.cn/NcAccType/GetCurrentAccountList"
 
     res = yield session.post(url)
-    result = json.loads(json.loads(res.text))
+    # 响应为序列化两次的 json
+    result = decode_payload(loads(res.content), CardResponse) if typed else loads(loads(res.content))
     if result['respCode'] != "0000":
         raise CQUWebsiteError(error_msg=result['respInfo'])
 
@@ -129,22 +136,24 @@ async def async_get_card_raw(session: Session):
     return await _get_card_raw.async_request(session)
 
 @RequestTransformer.register()
-def _get_bill_raw(session: Session, account: str, duration: int):
+def _get_bill_raw(session: Session, account: str, duration: int, typed: bool = False, page: int = 1,
+                  page_size: int = BILL_PAGE_SIZE, end_date: Optional[datetime.datetime] = None):
     url = 'http://card.cqu.edu.cn/NcReport/GetMyBill'
 
-    end_date = datetime.datetime.now(tz=TIMEZONE)
+    # 分页获取时各页使用相同的截止时间
+    end_date = end_date or datetime.datetime.now(tz=TIMEZONE)
     start_date = end_date - datetime.timedelta(duration)
 
     data = {
         'sdate': start_date.strftime('%Y-%m-%d'),
         'edate': end_date.strftime('%Y-%m-%d'),
         'account': account,
-        'page': 1,
-        'row': 100,
+        'page': page,
+        'row': page_size,
     }
 
     res = yield session.post(url=url, data=data)
-    result = json.loads(res.text)
+    result = decode_payload(res.content, BillResponse) if typed else loads(res.content)
 
     return result['rows']
 
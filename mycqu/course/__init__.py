@@ -5,4 +5,4 @@
 from .models import *
 
 __all__ = ("CQUSession", "CQUSessionInfo",
-           "CourseTimetable", "CourseDayTime", "Course")
+           "CourseTimetable", "CourseDayTime", "Course", "AcademicCalendar")
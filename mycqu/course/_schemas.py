@@ -0,0 +1,50 @@
+"""
+课程相关原始响应的结构，字段类型与 ``from_dict`` 的取值方式一致
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+from typing_extensions import TypedDict
+
+
+class InstructorData(TypedDict, total=False):
+    instructorName: str
+
+
+class _CourseRequired(TypedDict):
+    courseName: str
+    courseCode: str
+
+
+class CourseData(_CourseRequired, total=False):
+    """:meth:`.Course.from_dict` 读取的字段"""
+    classNbr: Optional[str]
+    courseDepartmentName: Optional[str]
+    courseDeptShortName: Optional[str]
+    credit: Union[float, str, None]
+    courseCredit: Union[float, str, None]
+    instructorName: Optional[str]
+    instructorNames: Optional[str]
+    classTimetableInstrVOList: Optional[List[InstructorData]]
+    session: Optional[str]
+
+
+class _CourseTimetableRequired(CourseData):
+    wholeWeekOccupy: Union[bool, int, None]
+    roomName: Optional[str]
+    exprProjectName: Optional[str]
+
+
+class CourseTimetableData(_CourseTimetableRequired, total=False):
+    """``classTimetableVOList`` 中的一项"""
+    selectedStuNum: Optional[int]
+    position: Optional[str]
+    weeks: Optional[str]
+    teachingWeekFormat: Optional[str]
+    periodFormat: Optional[str]
+    weekDayFormat: Optional[str]
+
+
+class CourseTimetableResponse(TypedDict, total=False):
+    classTimetableVOList: Optional[List[CourseTimetableData]]
@@ -3,5 +3,6 @@ from .cqu_session_info import CQUSessionInfo
 from .course import Course
 from .course_day_time import CourseDayTime
 from .course_timetable import CourseTimetable
+from .academic_calendar import AcademicCalendar
 
-__all__ = ['Course', 'CourseDayTime', 'CourseTimetable', 'CQUSession', 'CQUSessionInfo']
+__all__ = ['Course', 'CourseDayTime', 'CourseTimetable', 'CQUSession', 'CQUSessionInfo', 'AcademicCalendar']
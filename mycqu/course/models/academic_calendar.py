@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import List, Optional
+
+from requests import Session
+from pydantic import BaseModel
+
+from .cqu_session_info import CQUSessionInfo
+from ...utils.request_transformer import Request
+
+__all__ = ['AcademicCalendar']
+
+
+class AcademicCalendar(BaseModel):
+    """由各学期信息 :class:`CQUSessionInfo` 得到的校历
+    """
+    sessions: List[CQUSessionInfo]
+    """有开始与结束日期的学期信息，按时间降序排序"""
+    exam_weeks: int = 2
+    """每学期最后的考试周数量"""
+
+    @staticmethod
+    def from_session_infos(infos: List[CQUSessionInfo], exam_weeks: int = 2) -> AcademicCalendar:
+        """从学期信息生成校历
+
+        :param infos: 学期信息
+        :type infos: List[CQUSessionInfo]
+        :param exam_weeks: 每学期最后的考试周数量
+        :type exam_weeks: int, optional
+        :return: 校历对象
+        :rtype: AcademicCalendar
+        """
+        return AcademicCalendar(
+            sessions=sorted((info for info in infos if info.begin_date and info.end_date),
+                            key=lambda info: info.begin_date, reverse=True),
+            exam_weeks=exam_weeks
+        )
+
+    def session_info_at(self, day: date) -> Optional[CQUSessionInfo]:
+        """获取某天所在的学期
+
+        :param day: 日期
+        :type day: date
+        :return: 该日期所在学期的信息，不在任何学期内（如假期）时为 :obj:`None`
+        :rtype: Optional[CQUSessionInfo]
+        """
+        for info in self.sessions:
+            if info.begin_date <= day <= info.end_date:
+                return info
+        return None
+
+    def week_of(self, day: date) -> Optional[int]:
+        """获取某天所在的教学周（从 1 开始）
+
+        :param day: 日期
+        :type day: date
+        :return: 教学周，不在任何学期内时为 :obj:`None`
+        :rtype: Optional[int]
+        """
+        info = self.session_info_at(day)
+        if info is None:
+            return None
+        return (day - info.begin_date).days // 7 + 1
+
+    def is_exam_period(self, day: date) -> bool:
+        """判断某天是否处于学期最后的考试周内
+
+        :param day: 日期
+        :type day: date
+        :rtype: bool
+        """
+        info = self.session_info_at(day)
+        if info is None:
+            return False
+        return day > info.end_date - timedelta(weeks=self.exam_weeks)
+
+    @staticmethod
+    def fetch(session: Session, exam_weeks: int = 2) -> AcademicCalendar:
+        """从 my.cqu.edu.cn 上获取校历
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param exam_weeks: 每学期最后的考试周数量
+        :type exam_weeks: int, optional
+        :return: 校历对象
+        :rtype: AcademicCalendar
+        """
+        return AcademicCalendar.from_session_infos(CQUSessionInfo.fetch_all(session), exam_weeks)
+
+    @staticmethod
+    async def async_fetch(session: Request, exam_weeks: int = 2) -> AcademicCalendar:
+        """
+        异步的从 my.cqu.edu.cn 上获取校历
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param exam_weeks: 每学期最后的考试周数量
+        :type exam_weeks: int, optional
+        :return: 校历对象
+        :rtype: AcademicCalendar
+        """
+        return AcademicCalendar.from_session_infos(await CQUSessionInfo.async_fetch_all(session), exam_weeks)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 from typing import Any, Dict, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .cqu_session import CQUSession
+from ...utils.construct import construct_model
+from ...utils.interning import COURSE_TABLE, intern_str, is_interning
+from ...utils.records import is_record, is_record_mode
 
 
 __all__ = ['Course']
 
 class Course(BaseModel):
-    """与具体行课时间无关的课程信息
+    """与具体行课时间无关的课程信息，不可变且可哈希
     """
+    model_config = ConfigDict(frozen=True)
+
     name: Optional[str] = None
     """课程名称"""
     code: Optional[str] = None
@@ -42,7 +47,7 @@ class Course(BaseModel):
             session = CQUSession.from_str(data["session"])
         if isinstance(session, str):
             session = CQUSession.from_str(session)
-        assert isinstance(session, CQUSession) or session is None
+        assert isinstance(session, CQUSession) or is_record(session) or session is None
 
         instructor_name = None
         if data.get("instructorName") is not None:
@@ -53,13 +58,19 @@ class Course(BaseModel):
             instructor_name = ', '.join(instructor.get('instructorName')
                                         for instructor in data.get('classTimetableInstrVOList'))
 
-        return Course(
+        credit = data.get("credit") or data.get("courseCredit")
+        fields = dict(
             name=data["courseName"],
             code=data["courseCode"],
             course_num=data.get("classNbr"),
             dept=data.get(
                 "courseDepartmentName") or data.get("courseDeptShortName"),
-            credit=data.get("credit") or data.get("courseCredit"),
+            credit=float(credit) if credit is not None else None,
             instructor=instructor_name,
             session=session,
         )
+        if is_interning():
+            fields.update(name=intern_str(fields['name']), dept=intern_str(fields['dept']),
+                          instructor=intern_str(fields['instructor']))
+            return COURSE_TABLE.get((is_record_mode(), *fields.values()), lambda: construct_model(Course, **fields))
+        return construct_model(Course, **fields)
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from ...utils.datetimes import parse_period_str, parse_weekday_str
 from ...utils.period import Period
+from ...utils.construct import construct_model
 
 
 __all__ = ['CourseDayTime']
@@ -29,7 +30,8 @@ class CourseDayTime(BaseModel):
         :rtype: Optional[CourseDayTime]
         """
         if data.get("periodFormat") and data.get("weekDayFormat"):
-            return CourseDayTime(
+            return construct_model(
+                CourseDayTime,
                 weekday=parse_weekday_str(data["weekDayFormat"]),
                 period=parse_period_str(data["periodFormat"])
             )
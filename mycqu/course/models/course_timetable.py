@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, List, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, List, Union
 
 from requests import Session
 
@@ -8,11 +8,14 @@ from pydantic import BaseModel
 
 from .course import Course
 from .course_day_time import CourseDayTime
-from ..tools import get_course_raw, async_get_course_raw, get_enroll_raw, async_get_enroll_raw
+from ..tools import _get_course_raw, _stream_course_raw, _async_stream_course_raw, get_enroll_raw, async_get_enroll_raw
 from .cqu_session import CQUSession
+from ...utils.clients import ensure_client, ensure_async_client
 from ...utils.datetimes import parse_weeks_str
 from ...utils.period import Period
 from ...utils.request_transformer import Request
+from ...utils.construct import construct_model
+from ...utils.interning import intern_str
 
 
 __all__ = ['CourseTimetable']
@@ -47,25 +50,26 @@ class CourseTimetable(BaseModel):
         :return: 课表对象
         :rtype: CourseTimetable
         """
-        return CourseTimetable(
+        return construct_model(
+            CourseTimetable,
             course=Course.from_dict(data),
-            stu_num=data.get("selectedStuNum"),
-            classroom=data.get("position"),
+            stu_num=int(data["selectedStuNum"]) if data.get("selectedStuNum") is not None else None,
+            classroom=intern_str(data.get("position")),
             weeks=parse_weeks_str(data.get("weeks")
                                   or data.get("teachingWeekFormat")),  # type: ignore
             day_time=CourseDayTime.from_dict(data),
             whole_week=bool(data["wholeWeekOccupy"]),
-            classroom_name=data["roomName"],
+            classroom_name=intern_str(data["roomName"]),
             expr_projects=(data["exprProjectName"] or '').split(',')
         )
 
     @staticmethod
-    def fetch(session: Session, code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
+    def fetch(session: Union[Session, str], code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
             -> List[CourseTimetable]:
         """从 my.cqu.edu.cn 上获取学生或老师的课表
 
-        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-        :type session: Session
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
         :param code: 学生或教师的学工号
         :type code: str
         :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
@@ -74,19 +78,16 @@ class CourseTimetable(BaseModel):
         :return: 获取的课表对象的列表
         :rtype: List[CourseTimetable]
         """
-        resp = get_course_raw(session, code, cqu_session)
-        return [CourseTimetable.from_dict(timetable) for timetable in resp
-                if timetable["teachingWeekFormat"]
-                ]
+        return list(CourseTimetable.iter_fetch(session, code, cqu_session))
 
     @staticmethod
-    async def async_fetch(session: Request, code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
+    async def async_fetch(session: Union[Request, str], code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
             -> List[CourseTimetable]:
         """
         异步的从 my.cqu.edu.cn 上获取学生或老师的课表
 
-        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-        :type session: Session
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
         :param code: 学生或教师的学工号
         :type code: str
         :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
@@ -95,17 +96,93 @@ class CourseTimetable(BaseModel):
         :return: 获取的课表对象的列表
         :rtype: List[CourseTimetable]
         """
-        resp = await async_get_course_raw(session, code, cqu_session)
-        return [CourseTimetable.from_dict(timetable) for timetable in resp
-                if timetable["teachingWeekFormat"]
-                ]
+        return [timetable async for timetable in CourseTimetable.async_iter_fetch(session, code, cqu_session)]
 
     @staticmethod
-    def fetch_enroll(session: Request) -> List[CourseTimetable]:
+    def iter_fetch(session: Union[Request, str], code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
+            -> Iterator[CourseTimetable]:
+        """从 my.cqu.edu.cn 上获取学生或老师的课表，逐个解析并返回课表对象
+
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
+        :param code: 学生或教师的学工号
+        :type code: str
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 课表对象的迭代器
+        :rtype: Iterator[CourseTimetable]
+        """
+        for timetable in _get_course_raw.sync_request(ensure_client(session), code, cqu_session, typed=True):
+            if timetable["teachingWeekFormat"]:
+                yield CourseTimetable.from_dict(timetable)
+
+    @staticmethod
+    async def async_iter_fetch(session: Union[Request, str], code: str,
+                               cqu_session: Optional[Union[CQUSession, str]] = None) -> AsyncIterator[CourseTimetable]:
+        """
+        异步的从 my.cqu.edu.cn 上获取学生或老师的课表，逐个解析并返回课表对象
+
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Request, str]
+        :param code: 学生或教师的学工号
+        :type code: str
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 课表对象的异步迭代器
+        :rtype: AsyncIterator[CourseTimetable]
+        """
+        for timetable in await _get_course_raw.async_request(ensure_async_client(session), code, cqu_session,
+                                                             typed=True):
+            if timetable["teachingWeekFormat"]:
+                yield CourseTimetable.from_dict(timetable)
+
+    @staticmethod
+    def stream_fetch(session: Union[Request, str], code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
+            -> Iterator[CourseTimetable]:
+        """从 my.cqu.edu.cn 上获取学生或老师的课表，边接收边解析响应并逐个返回，适用于课程较多的教师课表
+
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
+        :param code: 学生或教师的学工号
+        :type code: str
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 课表对象的迭代器
+        :rtype: Iterator[CourseTimetable]
+        """
+        for timetable in _stream_course_raw(ensure_client(session), code, cqu_session):
+            if timetable["teachingWeekFormat"]:
+                yield CourseTimetable.from_dict(timetable)
+
+    @staticmethod
+    async def async_stream_fetch(session: Union[Request, str], code: str,
+                                 cqu_session: Optional[Union[CQUSession, str]] = None) -> AsyncIterator[CourseTimetable]:
+        """
+        异步的从 my.cqu.edu.cn 上获取学生或老师的课表，边接收边解析响应并逐个返回
+
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Request, str]
+        :param code: 学生或教师的学工号
+        :type code: str
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 课表对象的异步迭代器
+        :rtype: AsyncIterator[CourseTimetable]
+        """
+        async for timetable in _async_stream_course_raw(ensure_async_client(session), code, cqu_session):
+            if timetable["teachingWeekFormat"]:
+                yield CourseTimetable.from_dict(timetable)
+
+    @staticmethod
+    def fetch_enroll(session: Union[Request, str]) -> List[CourseTimetable]:
         """从 my.cqu.edu.cn 上获取学生已选课程
 
-        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-        :type session: Session
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
         :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
         :return: 获取的课表对象的列表
         :rtype: List[CourseTimetable]
@@ -114,12 +191,12 @@ class CourseTimetable(BaseModel):
         return [CourseTimetable.from_dict(timetable) for timetable in res]
 
     @staticmethod
-    async def async_fetch_enroll(session: Request) -> List[CourseTimetable]:
+    async def async_fetch_enroll(session: Union[Request, str]) -> List[CourseTimetable]:
         """
         异步的从 my.cqu.edu.cn 上获取学生已选课程
 
-        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-        :type session: Session
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
         :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
         :return: 获取的课表对象的列表
         :rtype: List[CourseTimetable]
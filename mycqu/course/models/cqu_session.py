@@ -3,11 +3,15 @@ from __future__ import annotations
 import re
 from typing import ClassVar, Tuple, List, Optional
 
-import requests
 from requests import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from ..._lib_wrapper.fastjson import loads
+from ...utils.clients import anonymous_session, anonymous_async_client
 from ...utils.request_transformer import Request, RequestTransformer
+from ...utils.construct import construct_model
+from ...utils.interning import SESSION_TABLE, is_interning
+from ...utils.records import is_record_mode
 from ...exception import CQUSessionIdNotExist
 
 CQUSESSIONS_URL = "https://my.cqu.edu.cn/api/timetable/optionFinder/session?blankOption=false"
@@ -18,8 +22,10 @@ __all__ = ['CQUSession']
 
 
 class CQUSession(BaseModel):
-    """重大的某一学期
+    """重大的某一学期，不可变且可哈希
     """
+    model_config = ConfigDict(frozen=True, ignored_types=(RequestTransformer,))
+
     id: Optional[int] = None
     """学期ID"""
     year: int
@@ -46,7 +52,7 @@ class CQUSession(BaseModel):
         return self._get_id.sync_request(client)
 
     async def async_get_id(self, client: Request) -> int:
-        return self._get_id.async_request(client)
+        return await self._get_id.async_request(client)
 
     @staticmethod
     def from_str(string: str, id: Optional[int] = None) -> CQUSession:
@@ -66,14 +72,20 @@ class CQUSession(BaseModel):
         :return: 对应的学期
         :rtype: CQUSession
         """
+        if is_interning():
+            return SESSION_TABLE.get((is_record_mode(), string, id), lambda: CQUSession._parse(string, id))
+        return CQUSession._parse(string, id)
+
+    @staticmethod
+    def _parse(string: str, id: Optional[int]) -> CQUSession:
         match = SESSION_RE.match(string)
         if match:
-            result = CQUSession(
-                year=match[1],
+            return construct_model(
+                CQUSession,
+                id=id,
+                year=int(match[1]),
                 is_autumn=match[2] == "秋"
             )
-            result.id = id
-            return result
         else:
             raise ValueError(f"string {string} is not a session")
 
@@ -81,7 +93,7 @@ class CQUSession(BaseModel):
     @RequestTransformer.register()
     def _fetch(request: Request) -> List[CQUSession]:
         session_list = []
-        for session in (yield request.get(CQUSESSIONS_URL)).json():
+        for session in loads((yield request.get(CQUSESSIONS_URL)).content):
             session_list.append(CQUSession.from_str(session["name"], int(session["id"])))
         return session_list
 
@@ -89,17 +101,21 @@ class CQUSession(BaseModel):
     def fetch(session: Optional[Session] = None) -> List[CQUSession]:
         """从 my.cqu.edu.cn 上获取各个学期
 
+        :param session: 用于请求的会话，留空时使用共享连接池中的匿名会话
+        :type session: Optional[Session], optional
         :return: 各个学期组成的列表
         :rtype: List[CQUSession]
         """
-        return CQUSession._fetch.sync_request(requests if session is None else session)
+        return CQUSession._fetch.sync_request(anonymous_session() if session is None else session)
 
     @staticmethod
-    async def async_fetch(session: Request) -> List[CQUSession]:
+    async def async_fetch(session: Optional[Request] = None) -> List[CQUSession]:
         """
         异步的从 my.cqu.edu.cn 上获取各个学期
 
+        :param session: 用于请求的异步客户端，留空时使用共享连接池中的匿名客户端
+        :type session: Optional[Request], optional
         :return: 各个学期组成的列表
         :rtype: List[CQUSession]
         """
-        return await CQUSession._fetch.async_request(session)
+        return await CQUSession._fetch.async_request(anonymous_async_client() if session is None else session)
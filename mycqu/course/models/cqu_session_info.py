@@ -7,8 +7,10 @@ from requests import Session
 from pydantic import BaseModel
 
 from .cqu_session import CQUSession
+from ..._lib_wrapper.fastjson import loads
 from ...exception import MycquUnauthorized
 from ...utils.datetimes import date_from_str
+from ...utils.construct import construct_model
 from ...utils.request_transformer import Request, RequestTransformer
 
 CUR_SESSION_URL = "https://my.cqu.edu.cn/api/resourceapi/session/cur-active-session"
@@ -36,15 +38,13 @@ class CQUSessionInfo(BaseModel):
         :return: 学期信息对象
         :rtype: CQUSessionInfo
         """
-        res = CQUSessionInfo(
-            session=CQUSession(year=data["year"],
-                               is_autumn=data["term"] == "秋"),
+        return construct_model(
+            CQUSessionInfo,
+            session=construct_model(CQUSession, id=int(data["id"]), year=int(data["year"]),
+                                    is_autumn=data["term"] == "秋"),
             begin_date=date_from_str(data["beginDate"]),
             end_date=date_from_str(data["endDate"])
         )
-        res.session.id = int(data["id"])
-
-        return res
 
     @staticmethod
     @RequestTransformer.register()
@@ -53,7 +53,7 @@ class CQUSessionInfo(BaseModel):
         if resp.status_code == 401:
             raise MycquUnauthorized()
         cqusesions: List[CQUSessionInfo] = []
-        for data in resp.json()['sessionVOList']:
+        for data in loads(resp.content)['sessionVOList']:
             if not data['beginDate']:
                 break
             cqusesions.append(CQUSessionInfo.from_dict(data))
@@ -88,7 +88,7 @@ class CQUSessionInfo(BaseModel):
         resp = yield session.get(CUR_SESSION_URL)
         if resp.status_code == 401:
             raise MycquUnauthorized()
-        return CQUSessionInfo.from_dict(resp.json()["data"])
+        return CQUSessionInfo.from_dict(loads(resp.content)["data"])
 
     @staticmethod
     def fetch(session: Session) -> CQUSessionInfo:
@@ -1,11 +1,16 @@
 from __future__ import annotations
-from typing import Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union
 
 from requests import Session
+from ._schemas import CourseTimetableResponse
 from .models.cqu_session import CQUSession
 from .models.cqu_session_info import CQUSessionInfo
+from .._lib_wrapper.fastjson import loads
 from ..exception import MycquUnauthorized
+from ..utils.clients import ensure_client, ensure_async_client
+from ..utils.payload import decode_payload
 from ..utils.request_transformer import Request, RequestTransformer
+from ..utils.streaming import stream_items, async_stream_items
 
 TIMETABLE_URL = "https://my.cqu.edu.cn/api/timetable/class/timetable/student/my-table-detail"
 
@@ -13,32 +18,54 @@ __all__ = ['get_course_raw', 'async_get_course_raw', 'get_enroll_raw', 'async_ge
 
 
 @RequestTransformer.register()
-def _get_course_raw(session: Request, code: str, cqu_session: Optional[Union[CQUSession, str]] = None):
+def _get_session_id(session: Request, cqu_session: Optional[Union[CQUSession, str]] = None):
     if cqu_session is None:
         cqu_session = (yield CQUSessionInfo._fetch).session
     elif isinstance(cqu_session, str):
         cqu_session = CQUSession.from_str(cqu_session)
     assert isinstance(cqu_session, CQUSession)
+    return (yield cqu_session._get_id)
+
+
+@RequestTransformer.register()
+def _get_course_raw(session: Request, code: str, cqu_session: Optional[Union[CQUSession, str]] = None,
+                    typed: bool = False):
     resp = yield session.post(TIMETABLE_URL,
-                              params={"sessionId": (yield cqu_session._get_id)},
+                              params={"sessionId": (yield _get_session_id, {'cqu_session': cqu_session})},
                               json=[code],
                               )
     if resp.status_code == 401:
         raise MycquUnauthorized()
-    result = resp.json().get('classTimetableVOList')
+    result = (decode_payload(resp.content, CourseTimetableResponse) if typed else loads(resp.content)) \
+        .get('classTimetableVOList')
     return result if result is not None else []
 
+def _stream_course_raw(session: Request, code: str, cqu_session: Optional[Union[CQUSession, str]] = None) \
+        -> Iterator[Dict[str, Any]]:
+    session_id = _get_session_id.sync_request(session, cqu_session)
+    for _, data in stream_items(session, 'POST', TIMETABLE_URL, ('classTimetableVOList.item',),
+                                params={"sessionId": session_id}, json=[code]):
+        yield data
+
+
+async def _async_stream_course_raw(session: Request, code: str,
+                                   cqu_session: Optional[Union[CQUSession, str]] = None) -> AsyncIterator[Dict[str, Any]]:
+    session_id = await _get_session_id.async_request(session, cqu_session)
+    async for _, data in async_stream_items(session, 'POST', TIMETABLE_URL, ('classTimetableVOList.item',),
+                                            params={"sessionId": session_id}, json=[code]):
+        yield data
+
 @RequestTransformer.register()
 def _get_enroll_raw(session: Request):
     res = yield session.get(f'https://my.cqu.edu.cn/api/enrollment/timetable/student')
-    result = res.json().get('data')
+    result = loads(res.content).get('data')
     return result if result is not None else []
 
-def get_course_raw(session: Session, code: str, cqu_session: Optional[Union[CQUSession, str]] = None):
+def get_course_raw(session: Union[Session, str], code: str, cqu_session: Optional[Union[CQUSession, str]] = None):
     """从 my.cqu.edu.cn 上获取学生或老师的课表
 
-    :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-    :type session: Session
+    :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+    :type session: Union[Session, str]
     :param code: 学生或教师的学工号
     :type code: str
     :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
@@ -47,14 +74,14 @@ def get_course_raw(session: Session, code: str, cqu_session: Optional[Union[CQUS
     :return: 反序列化获取课表的json
     :rtype: dict
     """
-    return _get_course_raw.sync_request(session, code, cqu_session)
+    return _get_course_raw.sync_request(ensure_client(session), code, cqu_session)
 
-async def async_get_course_raw(session: Request, code: str, cqu_session: Optional[Union[CQUSession, str]] = None):
+async def async_get_course_raw(session: Union[Request, str], code: str, cqu_session: Optional[Union[CQUSession, str]] = None):
     """
     异步的从 my.cqu.edu.cn 上获取学生或老师的课表
 
-    :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-    :type session: Session
+    :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+    :type session: Union[Session, str]
     :param code: 学生或教师的学工号
     :type code: str
     :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
@@ -63,28 +90,28 @@ async def async_get_course_raw(session: Request, code: str, cqu_session: Optiona
     :return: 反序列化获取课表的json
     :rtype: dict
     """
-    return await _get_course_raw.async_request(session, code, cqu_session)
+    return await _get_course_raw.async_request(ensure_async_client(session), code, cqu_session)
 
-def get_enroll_raw(session: Request):
+def get_enroll_raw(session: Union[Request, str]):
     """
     从 my.cqu.edu.cn 上获取学生的选课信息
 
-    :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-    :type session: Session
+    :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+    :type session: Union[Session, str]
     :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
     :return: 反序列化获取课表的json
     :rtype: dict
     """
-    return _get_enroll_raw.sync_request(session)
+    return _get_enroll_raw.sync_request(ensure_client(session))
 
-async def async_get_enroll_raw(session: Request):
+async def async_get_enroll_raw(session: Union[Request, str]):
     """
     异步的从 my.cqu.edu.cn 上获取学生的选课信息
 
-    :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-    :type session: Session
+    :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+    :type session: Union[Session, str]
     :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
     :return: 反序列化获取课表的json
     :rtype: dict
     """
-    return await _get_enroll_raw.async_request(session)
+    return await _get_enroll_raw.async_request(ensure_async_client(session))
@@ -1,3 +1,6 @@
 from .models import *
+from .monitor import *
+from .conflict import *
 
-__all__ = ('EnrollCourseInfo', 'EnrollCourseTimetable', 'EnrollCourseItem')
\ No newline at end of file
+__all__ = ('EnrollCourseInfo', 'EnrollCourseTimetable', 'EnrollCourseItem', 'EnrollCatalog', 'EnrollMonitor', 'EnrollEvent',
+           'ConflictChecker', 'EnrollConflict')
\ No newline at end of file
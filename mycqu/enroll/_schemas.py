@@ -0,0 +1,63 @@
+"""
+选课相关原始响应的结构，字段类型与 ``from_dict`` 的取值方式一致
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+from typing_extensions import TypedDict
+
+from ..course._schemas import CourseData
+
+
+class EnrollCourseInfoData(TypedDict):
+    """``courseVOList`` 中的一项"""
+    id: str
+    name: str
+    codeR: str
+    departmentName: Optional[str]
+    credit: Union[float, str]
+    courseCategory: str
+    selectionArea: str
+    courseEnrollSign: Optional[str]
+    courseNature: str
+    campusShortNameSet: List[str]
+
+
+class EnrollAreaData(TypedDict):
+    selectionArea: str
+    courseVOList: List[EnrollCourseInfoData]
+
+
+class _EnrollListResponseRequired(TypedDict):
+    status: str
+
+
+class EnrollListResponse(_EnrollListResponseRequired, total=False):
+    data: Optional[List[EnrollAreaData]]
+
+
+class _EnrollCourseItemRequired(CourseData):
+    id: Optional[str]
+    sessionId: Optional[str]
+    checked: Optional[bool]
+    courseId: Optional[str]
+    classType: str
+    selectedNum: Optional[int]
+    stuCapacity: Optional[int]
+    childrenList: Optional[List[EnrollCourseItemData]]
+    campusShortName: Optional[str]
+    parentClassId: Optional[str]
+    classTime: Optional[str]
+
+
+class EnrollCourseItemData(_EnrollCourseItemRequired, total=False):
+    """``selectCourseVOList`` 中的一项"""
+
+
+class EnrollCourseListData(TypedDict):
+    selectCourseVOList: List[EnrollCourseItemData]
+
+
+class EnrollDetailResponse(TypedDict):
+    selectCourseListVOs: List[EnrollCourseListData]
@@ -0,0 +1,185 @@
+"""
+基于占用位图的选课时间冲突检测
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+
+from .models import EnrollCourseItem, EnrollCourseTimetable
+from ..course import CourseTimetable
+from ..utils.construct import construct_container
+from ..utils.period import Period
+from ..utils.request_transformer import Request
+
+__all__ = ['ConflictChecker', 'EnrollConflict']
+
+_SlotKey = Tuple[Tuple[Tuple[int, int], ...], int, int, int]
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(  # pylint: ignore disable=raise-missing-from
+            "Please install numpy to use ConflictChecker")
+    return numpy
+
+
+class EnrollConflict(BaseModel):
+    """某可选具体课程与已选课程的一处时间冲突
+    """
+    item: EnrollCourseItem
+    """被检测的可选具体课程"""
+    part: EnrollCourseItem
+    """发生冲突的部分，为 :attr:`item` 本身或其从属课程"""
+    timetable: CourseTimetable
+    """与之冲突的已选课程课表"""
+    weeks: List[int]
+    """发生冲突的周数"""
+
+
+class ConflictChecker:
+    """
+    检测可选具体课程与学生已选课程的时间冲突
+
+    构造时将已选课程预先展开为 周 × 星期 × 节次 的占用位图，检测时将所有候选课程（含从属课程）的上课时间
+    展开为位图下标，在一次数组运算中得到冲突位置。
+
+    >>> checker = ConflictChecker.fetch(session)
+    >>> conflicts = checker.check(EnrollCourseItem.fetch(session, course_id))
+    """
+
+    def __init__(self, timetables: Iterable[CourseTimetable], weeks: int = 25, periods: int = 13):
+        """
+        :param timetables: 学生已选课程的课表，如 :meth:`.course.CourseTimetable.fetch_enroll` 的结果
+        :type timetables: Iterable[CourseTimetable]
+        :param weeks: 位图覆盖的周数，超出的周数视为不冲突
+        :type weeks: int, optional
+        :param periods: 位图覆盖的每天节次数，超出的节次视为不冲突
+        :type periods: int, optional
+        """
+        np = _numpy()
+        self.timetables: List[CourseTimetable] = list(timetables)
+        self.weeks = weeks
+        self.periods = periods
+        self._slot_cache: Dict[_SlotKey, Any] = {}
+        self._owners: Dict[int, List[int]] = {}
+        self._occupied = np.zeros(weeks * 7 * periods, dtype=bool)
+        for index, timetable in enumerate(self.timetables):
+            if timetable.day_time is not None:
+                slots = self._slots(timetable.weeks, timetable.day_time.weekday, timetable.day_time.period)
+            elif timetable.whole_week:
+                slots = np.concatenate([self._slots(timetable.weeks, weekday, Period(start=1, end=periods))
+                                        for weekday in range(7)])
+            else:
+                continue
+            self._occupied[slots] = True
+            for slot in slots.tolist():
+                self._owners.setdefault(slot, []).append(index)
+
+    @staticmethod
+    def fetch(session: Union[Request, str], weeks: int = 25, periods: int = 13) -> ConflictChecker:
+        """从 my.cqu.edu.cn 上获取学生已选课程并构造冲突检测器
+
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Session, str]
+        :param weeks: 位图覆盖的周数
+        :type weeks: int, optional
+        :param periods: 位图覆盖的每天节次数
+        :type periods: int, optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :rtype: ConflictChecker
+        """
+        return ConflictChecker(CourseTimetable.fetch_enroll(session), weeks, periods)
+
+    @staticmethod
+    async def async_fetch(session: Union[Request, str], weeks: int = 25, periods: int = 13) -> ConflictChecker:
+        """
+        异步的从 my.cqu.edu.cn 上获取学生已选课程并构造冲突检测器
+
+        :param session: 登陆后获取的 authorization 或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+        :type session: Union[Request, str]
+        :param weeks: 位图覆盖的周数
+        :type weeks: int, optional
+        :param periods: 位图覆盖的每天节次数
+        :type periods: int, optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :rtype: ConflictChecker
+        """
+        return ConflictChecker(await CourseTimetable.async_fetch_enroll(session), weeks, periods)
+
+    def _slots(self, weeks: Sequence[Period], weekday: int, period: Period) -> Any:
+        key = (tuple((week.start, week.end) for week in weeks), weekday, period.start, period.end)
+        slots = self._slot_cache.get(key)
+        if slots is None:
+            np = _numpy()
+            week_index = np.concatenate([np.arange(week.start - 1, week.end) for week in weeks]) \
+                if weeks else np.zeros(0, dtype=np.intp)
+            period_index = np.arange(period.start - 1, period.end)
+            week_index = week_index[(week_index >= 0) & (week_index < self.weeks)]
+            period_index = period_index[(period_index >= 0) & (period_index < self.periods)]
+            slots = ((week_index[:, None] * 7 + weekday) * self.periods + period_index[None, :]).ravel()
+            self._slot_cache[key] = slots
+        return slots
+
+    def _timetable_slots(self, timetable: EnrollCourseTimetable) -> Optional[Any]:
+        if timetable.time is None:
+            return None
+        return self._slots(timetable.weeks, timetable.time.weekday, timetable.time.period)
+
+    def check(self, items: Iterable[EnrollCourseItem]) -> List[List[EnrollConflict]]:
+        """
+        检测一批可选具体课程（含从属课程）与已选课程的冲突
+
+        :param items: 待检测的可选具体课程
+        :type items: Iterable[EnrollCourseItem]
+        :return: 与 ``items`` 顺序一致的列表，每项为对应课程的全部冲突，不冲突时为空列表
+        :rtype: List[List[EnrollConflict]]
+        """
+        np = _numpy()
+        items = list(items)
+        parts: List[Tuple[int, EnrollCourseItem]] = []
+        slot_arrays, part_arrays = [], []
+        for item_index, item in enumerate(items):
+            for part in [item] + (item.children or []):
+                part_index = len(parts)
+                parts.append((item_index, part))
+                for timetable in part.timetables:
+                    slots = self._timetable_slots(timetable)
+                    if slots is not None and len(slots):
+                        slot_arrays.append(slots)
+                        part_arrays.append(np.full(len(slots), part_index, dtype=np.intp))
+
+        result: List[List[EnrollConflict]] = [[] for _ in items]
+        if not slot_arrays:
+            return result
+        slots = np.concatenate(slot_arrays)
+        owners = np.concatenate(part_arrays)
+        hit = self._occupied[slots]
+        if not hit.any():
+            return result
+
+        found: Dict[Tuple[int, int], set] = {}
+        day_size = 7 * self.periods
+        for slot, part_index in zip(slots[hit].tolist(), owners[hit].tolist()):
+            for timetable_index in self._owners[slot]:
+                found.setdefault((part_index, timetable_index), set()).add(slot // day_size + 1)
+        for (part_index, timetable_index), weeks in sorted(found.items()):
+            item_index, part = parts[part_index]
+            result[item_index].append(construct_container(EnrollConflict, item=items[item_index], part=part,
+                                                          timetable=self.timetables[timetable_index],
+                                                          weeks=sorted(weeks)))
+        return result
+
+    def free(self, items: Iterable[EnrollCourseItem]) -> List[EnrollCourseItem]:
+        """
+        筛选出不与已选课程冲突的可选具体课程
+
+        :param items: 待检测的可选具体课程
+        :type items: Iterable[EnrollCourseItem]
+        :rtype: List[EnrollCourseItem]
+        """
+        items = list(items)
+        return [item for item, conflicts in zip(items, self.check(items)) if not conflicts]
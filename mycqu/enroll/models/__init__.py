@@ -1,5 +1,6 @@
 from .enroll_course_info import EnrollCourseInfo
 from .enroll_course_item import EnrollCourseItem
 from .enroll_course_timetable import EnrollCourseTimetable
+from .enroll_catalog import EnrollCatalog
 
-__all__ = ['EnrollCourseInfo', 'EnrollCourseItem', 'EnrollCourseTimetable']
+__all__ = ['EnrollCourseInfo', 'EnrollCourseItem', 'EnrollCourseTimetable', 'EnrollCatalog']
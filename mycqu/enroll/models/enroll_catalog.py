@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, PrivateAttr
+
+from .enroll_course_info import EnrollCourseInfo
+from .enroll_course_item import EnrollCourseItem
+from ..tools import _get_enroll_detail_raw, _get_enroll_list_raw
+from ...exception import MycquUnauthorized
+from ...utils.records import is_record_mode
+from ...utils.request_transformer import Request
+
+from requests import Session
+
+__all__ = ['EnrollCatalog']
+
+_INSTRUCTOR_SEP = re.compile(r'[,，、;；\s]+')
+
+
+def _instructors(item: EnrollCourseItem) -> List[str]:
+    if not item.course.instructor:
+        return []
+    return [name for name in _INSTRUCTOR_SEP.split(item.course.instructor) if name]
+
+
+class EnrollCatalog(BaseModel):
+    """
+    全部可选课程及其可选具体课程的快照，可按课程id、课程代码、课程类型、校区与教师查找
+    """
+    courses: Dict[str, EnrollCourseInfo] = {}
+    """可选课程id到可选课程的映射"""
+    items: Dict[str, List[EnrollCourseItem]] = {}
+    """可选课程id到其可选具体课程的映射"""
+    failed: List[str] = []
+    """重试后仍未能获取可选具体课程的可选课程id"""
+
+    _by_code: Dict[Optional[str], List[EnrollCourseInfo]] = PrivateAttr(default_factory=dict)
+    _by_category: Dict[str, List[EnrollCourseInfo]] = PrivateAttr(default_factory=dict)
+    _by_campus: Dict[Optional[str], List[EnrollCourseItem]] = PrivateAttr(default_factory=dict)
+    _by_instructor: Dict[str, List[EnrollCourseItem]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        for info in self.courses.values():
+            self._by_code.setdefault(info.course.code, []).append(info)
+            self._by_category.setdefault(info.category, []).append(info)
+        for items in self.items.values():
+            for item in items:
+                for child in [item] + (item.children or []):
+                    self._by_campus.setdefault(child.campus or item.campus, []).append(child)
+                    for name in _instructors(child):
+                        self._by_instructor.setdefault(name, []).append(child)
+
+    def get(self, course_id: str) -> Optional[EnrollCourseInfo]:
+        """
+        按可选课程id查找可选课程
+
+        :param course_id: 可选课程id
+        :type course_id: str
+        :rtype: Optional[EnrollCourseInfo]
+        """
+        return self.courses.get(course_id)
+
+    def items_of(self, course_id: str) -> List[EnrollCourseItem]:
+        """
+        获取某可选课程的可选具体课程
+
+        :param course_id: 可选课程id
+        :type course_id: str
+        :rtype: List[EnrollCourseItem]
+        """
+        return self.items.get(course_id, [])
+
+    def find_by_code(self, code: str) -> List[EnrollCourseInfo]:
+        """
+        按课程代码查找可选课程
+
+        :param code: 课程代码，如 :obj:`"CST11204"`
+        :type code: str
+        :rtype: List[EnrollCourseInfo]
+        """
+        return list(self._by_code.get(code, []))
+
+    def find_by_category(self, category: str) -> List[EnrollCourseInfo]:
+        """
+        按可选课程类型查找可选课程
+
+        :param category: 可选课程类型，如 :obj:`"公共基础课"`
+        :type category: str
+        :rtype: List[EnrollCourseInfo]
+        """
+        return list(self._by_category.get(category, []))
+
+    def find_by_campus(self, campus: str) -> List[EnrollCourseItem]:
+        """
+        按校区查找可选具体课程（含从属课程）
+
+        :param campus: 校区，如 :obj:`"D区"`
+        :type campus: str
+        :rtype: List[EnrollCourseItem]
+        """
+        return list(self._by_campus.get(campus, []))
+
+    def find_by_instructor(self, instructor: str) -> List[EnrollCourseItem]:
+        """
+        按教师姓名查找可选具体课程（含从属课程）
+
+        :param instructor: 教师姓名
+        :type instructor: str
+        :rtype: List[EnrollCourseItem]
+        """
+        return list(self._by_instructor.get(instructor, []))
+
+    @staticmethod
+    def _from_results(courses: Iterable[EnrollCourseInfo],
+                      results: Iterable[Tuple[str, Optional[List[Dict]]]]) -> EnrollCatalog:
+        items, failed = {}, []
+        for course_id, raw in results:
+            if raw is None:
+                failed.append(course_id)
+            else:
+                items[course_id] = [EnrollCourseItem.from_dict(item) for item in raw]
+        courses = {info.id: info for info in courses}
+        if is_record_mode():
+            # 记录模式下其中的课程为记录，跳过校验
+            return EnrollCatalog.model_construct(courses=courses, items=items, failed=failed)
+        return EnrollCatalog(courses=courses, items=items, failed=failed)
+
+    @staticmethod
+    def fetch_full(session: Session, is_major: bool = True, concurrency: int = 16, retries: int = 2,
+                   retry_delay: float = 0.5) -> EnrollCatalog:
+        """从 my.cqu.edu.cn 上并发地获取全部可选课程及其可选具体课程
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :param retries: 每门课程获取失败后的重试次数
+        :type retries: int, optional
+        :param retry_delay: 第一次重试前等待的时间（秒），之后每次翻倍
+        :type retry_delay: float, optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 可选课程快照，重试后仍失败的课程记录在 :attr:`failed` 中
+        :rtype: EnrollCatalog
+        """
+        courses = [info for value in _get_enroll_list_raw.sync_request(session, is_major, typed=True).values()
+                   for info in map(EnrollCourseInfo.from_dict, value)]
+
+        def fetch(course_id: str) -> Tuple[str, Optional[List[Dict]]]:
+            for attempt in range(retries + 1):
+                try:
+                    return course_id, _get_enroll_detail_raw.sync_request(session, course_id, is_major, typed=True)
+                except MycquUnauthorized:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    if attempt < retries:
+                        time.sleep(retry_delay * 2 ** attempt)
+            return course_id, None
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(fetch, dict.fromkeys(info.id for info in courses)))
+        return EnrollCatalog._from_results(courses, results)
+
+    @staticmethod
+    async def async_fetch_full(session: Request, is_major: bool = True, concurrency: int = 16, retries: int = 2,
+                               retry_delay: float = 0.5) -> EnrollCatalog:
+        """
+        异步的从 my.cqu.edu.cn 上并发地获取全部可选课程及其可选具体课程
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的异步客户端
+        :type session: Request
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :param retries: 每门课程获取失败后的重试次数
+        :type retries: int, optional
+        :param retry_delay: 第一次重试前等待的时间（秒），之后每次翻倍
+        :type retry_delay: float, optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 可选课程快照，重试后仍失败的课程记录在 :attr:`failed` 中
+        :rtype: EnrollCatalog
+        """
+        raw = await _get_enroll_list_raw.async_request(session, is_major, typed=True)
+        courses = [info for value in raw.values() for info in map(EnrollCourseInfo.from_dict, value)]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(course_id: str) -> Tuple[str, Optional[List[Dict]]]:
+            for attempt in range(retries + 1):
+                try:
+                    async with semaphore:
+                        return course_id, await _get_enroll_detail_raw.async_request(
+                            session, course_id, is_major, typed=True)
+                except MycquUnauthorized:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    if attempt < retries:
+                        await asyncio.sleep(retry_delay * 2 ** attempt)
+            return course_id, None
+
+        results = await asyncio.gather(*(fetch(course_id) for course_id in dict.fromkeys(info.id for info in courses)))
+        return EnrollCatalog._from_results(courses, results)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterator
 
 from pydantic import BaseModel
 
-from ..tools import get_enroll_list_raw, async_get_enroll_list_raw
+from ..tools import _get_enroll_list_raw, _stream_enroll_list_raw, _async_stream_enroll_list_raw
 from ...course import Course
 from ...utils.request_transformer import Request
+from ...utils.construct import construct_model
+from ...utils.interning import intern_str
 
 from requests import Session
 
@@ -40,14 +42,15 @@ class EnrollCourseInfo(BaseModel):
         :return: 对应的可选课程列表
         :rtype: EnrollCourseInfo
         """
-        return EnrollCourseInfo(
+        return construct_model(
+            EnrollCourseInfo,
             id=data['id'],
-            course=Course(name=data['name'], code=data['codeR'], dept=data['departmentName'],
-                          credit=float(data['credit']), course_num=None, instructor=None, session=None),
-            category=data['courseCategory'],
-            type=data['selectionArea'],
+            course=construct_model(Course, name=data['name'], code=data['codeR'], dept=data['departmentName'],
+                                   credit=float(data['credit']), course_num=None, instructor=None, session=None),
+            category=intern_str(data['courseCategory']),
+            type=intern_str(data['selectionArea']),
             enroll_sign=data['courseEnrollSign'],
-            course_nature=data['courseNature'],
+            course_nature=intern_str(data['courseNature']),
             campus=data['campusShortNameSet']
         )
 
@@ -63,7 +66,7 @@ class EnrollCourseInfo(BaseModel):
         :return: 获取的可选课程对象的列表
         :rtype: List[EnrollCourseInfo]
         """
-        res = get_enroll_list_raw(session, is_major)
+        res = _get_enroll_list_raw.sync_request(session, is_major, typed=True)
         result = {}
         for key, value in res.items():
             result[key] = [EnrollCourseInfo.from_dict(item) for item in value]
@@ -83,9 +86,40 @@ class EnrollCourseInfo(BaseModel):
         :return: 获取的可选课程对象的列表
         :rtype: List[EnrollCourseInfo]
         """
-        res = await async_get_enroll_list_raw(session, is_major)
+        res = await _get_enroll_list_raw.async_request(session, is_major, typed=True)
         result = {}
         for key, value in res.items():
             result[key] = [EnrollCourseInfo.from_dict(item) for item in value]
 
         return result
+
+    @staticmethod
+    def stream_fetch(session: Session, is_major: bool = True) -> Iterator[EnrollCourseInfo]:
+        """从 my.cqu.edu.cn 上获取学生可选课程，边接收边解析响应并逐个返回，课程类别见 :attr:`type`
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 可选课程对象的迭代器
+        :rtype: Iterator[EnrollCourseInfo]
+        """
+        for item in _stream_enroll_list_raw(session, is_major):
+            yield EnrollCourseInfo.from_dict(item)
+
+    @staticmethod
+    async def async_stream_fetch(session: Request, is_major: bool = True) -> AsyncIterator[EnrollCourseInfo]:
+        """
+        异步的从 my.cqu.edu.cn 上获取学生可选课程，边接收边解析响应并逐个返回，课程类别见 :attr:`type`
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的异步客户端
+        :type session: Request
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 可选课程对象的异步迭代器
+        :rtype: AsyncIterator[EnrollCourseInfo]
+        """
+        async for item in _async_stream_enroll_list_raw(session, is_major):
+            yield EnrollCourseInfo.from_dict(item)
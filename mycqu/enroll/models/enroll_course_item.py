@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from typing import List, Dict, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel
 
 from .enroll_course_timetable import EnrollCourseTimetable
-from ..tools import get_enroll_detail_raw, async_get_enroll_detail_raw
+from ..tools import _get_enroll_detail_raw
 from ...course import Course
+from ...utils.construct import construct_model
+from ...utils.interning import intern_str
+from ...utils.request_transformer import Request
 
 from requests import Session
 
@@ -50,18 +55,19 @@ class EnrollCourseItem(BaseModel):
         :return: 对应的可选具体课程列表
         :rtype: EnrollCourseItem
         """
-        return EnrollCourseItem(
+        return construct_model(
+            EnrollCourseItem,
             id=data['id'],
             session_id=data['sessionId'],
-            checked=data['checked'],
+            checked=bool(data['checked']) if data['checked'] is not None else None,
             course_id=data['courseId'],
             course=Course.from_dict(data),
-            type=data['classType'],
-            selected_num=data['selectedNum'],
-            capacity=data['stuCapacity'],
+            type=intern_str(data['classType']),
+            selected_num=int(data['selectedNum']) if data['selectedNum'] is not None else None,
+            capacity=int(data['stuCapacity']) if data['stuCapacity'] is not None else None,
             children=[EnrollCourseItem.from_dict(item) for item in data['childrenList']]
                      if data['childrenList'] else None,
-            campus=data['campusShortName'],
+            campus=intern_str(data['campusShortName']),
             parent_id=data['parentClassId'],
             timetables=EnrollCourseTimetable.from_str(data['classTime']) if data['classTime'] is not None else []
         )
@@ -80,8 +86,7 @@ class EnrollCourseItem(BaseModel):
         :return: 获取的可选具体课程对象的列表
         :rtype: List[EnrollCourseItem]
         """
-        res = get_enroll_detail_raw(session, id, is_major)
-        return [EnrollCourseItem.from_dict(item) for item in res]
+        return list(EnrollCourseItem.iter_fetch(session, id, is_major))
 
     @staticmethod
     async def async_fetch(session: Session, id: str, is_major: bool = True) -> List[EnrollCourseItem]:
@@ -98,5 +103,99 @@ class EnrollCourseItem(BaseModel):
         :return: 获取的可选具体课程对象的列表
         :rtype: List[EnrollCourseItem]
         """
-        res = await async_get_enroll_detail_raw(session, id, is_major)
-        return [EnrollCourseItem.from_dict(item) for item in res]
+        return [item async for item in EnrollCourseItem.async_iter_fetch(session, id, is_major)]
+
+    @staticmethod
+    def iter_fetch(session: Session, id: str, is_major: bool = True) -> Iterator[EnrollCourseItem]:
+        """从 my.cqu.edu.cn 上获取学生可选具体课程，逐个解析并返回
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param id: 需要获取的课程id（非Course Code）
+        :type id: str
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 可选具体课程对象的迭代器
+        :rtype: Iterator[EnrollCourseItem]
+        """
+        for item in _get_enroll_detail_raw.sync_request(session, id, is_major, typed=True):
+            yield EnrollCourseItem.from_dict(item)
+
+    @staticmethod
+    async def async_iter_fetch(session: Request, id: str, is_major: bool = True) -> AsyncIterator[EnrollCourseItem]:
+        """
+        异步的从 my.cqu.edu.cn 上获取学生可选具体课程，逐个解析并返回
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的异步客户端
+        :type session: Request
+        :param id: 需要获取的课程id（非Course Code）
+        :type id: str
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: 可选具体课程对象的异步迭代器
+        :rtype: AsyncIterator[EnrollCourseItem]
+        """
+        for item in await _get_enroll_detail_raw.async_request(session, id, is_major, typed=True):
+            yield EnrollCourseItem.from_dict(item)
+
+    @staticmethod
+    def fetch_many(session: Session, ids: Iterable[str], is_major: bool = True,
+                   concurrency: int = 8) -> Iterator[Tuple[str, List[EnrollCourseItem]]]:
+        """从 my.cqu.edu.cn 上并发地获取多门可选课程的可选具体课程，按完成的先后顺序逐个返回
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param ids: 需要获取的课程id（非Course Code）
+        :type ids: Iterable[str]
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: (课程id, 该课程的可选具体课程) 的迭代器
+        :rtype: Iterator[Tuple[str, List[EnrollCourseItem]]]
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        futures = {executor.submit(EnrollCourseItem.fetch, session, course_id, is_major): course_id
+                   for course_id in dict.fromkeys(ids)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    async def async_fetch_many(session: Request, ids: Iterable[str], is_major: bool = True,
+                               concurrency: int = 8) -> AsyncIterator[Tuple[str, List[EnrollCourseItem]]]:
+        """
+        异步的从 my.cqu.edu.cn 上并发地获取多门可选课程的可选具体课程，按完成的先后顺序逐个返回
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的异步客户端
+        :type session: Request
+        :param ids: 需要获取的课程id（非Course Code）
+        :type ids: Iterable[str]
+        :param is_major: 是否获取主修可选课程，为`False`时查询辅修可选课程
+        :type is_major: bool
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :return: (课程id, 该课程的可选具体课程) 的异步迭代器
+        :rtype: AsyncIterator[Tuple[str, List[EnrollCourseItem]]]
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(course_id: str) -> Tuple[str, List[EnrollCourseItem]]:
+            async with semaphore:
+                return course_id, await EnrollCourseItem.async_fetch(session, course_id, is_major)
+
+        tasks = [asyncio.ensure_future(fetch(course_id)) for course_id in dict.fromkeys(ids)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,20 +1,43 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional, ClassVar, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
 from ...course import CourseDayTime
-from ...utils.datetimes import parse_weekday_str, parse_period_str, parse_weeks_str
+from ...utils.datetimes import parse_weekday_str
 from ...utils.period import Period
+from ...utils.construct import construct_model
+from ...utils.records import is_record_mode
 
 
 __all__ = ['EnrollCourseTimetable']
 
-WEEKS_RE = re.compile("^(.*)周")
-PERIOD_RE = re.compile("星期. [0-9]-[0-9]小节")
-POS_RE = re.compile("&(.*)$")
+TIMETABLE_RE = re.compile(
+    r"(?P<weeks>[^;周]*)周"
+    r"(?:[^;&]*?(?P<weekday>星期.)\s*(?P<period>\d+(?:-\d+)?)小节)?"
+    r"[^;&]*(?:&(?P<pos>[^;]*))?"
+)
+
+
+def _parse_range(string: str) -> Dict[str, int]:
+    start, _, end = string.strip().partition('-')
+    return {'start': int(start), 'end': int(end) if end else int(start)}
+
+
+@lru_cache(maxsize=4096)
+def _parse_timetable_str(data: str) -> Tuple[Dict[str, Any], ...]:
+    result = []
+    for match in TIMETABLE_RE.finditer(data):
+        weekday = parse_weekday_str(match['weekday']) if match['weekday'] else None
+        result.append({
+            'weeks': [_parse_range(unit) for unit in match['weeks'].split(',')],
+            'time': {'weekday': weekday, 'period': _parse_range(match['period'])} if weekday is not None else None,
+            'pos': match['pos'].strip() if match['pos'] is not None else None,
+        })
+    return tuple(result)
 
 
 class EnrollCourseTimetable(BaseModel):
@@ -31,37 +54,22 @@ class EnrollCourseTimetable(BaseModel):
     @staticmethod
     def from_str(data: str) -> List[EnrollCourseTimetable]:
         """从字符串中生成具体待选课程上课时间信息
-        示例字符串"1-5,7-9周 星期二 6-7小节 &D1144 ;1-5,7-9周 星期五 3-4小节 &D1143 "
+        示例字符串"1-5,7-9周 星期二 6-7小节 &D1144 ;1-5,7-9周 星期五 10-12小节 &D1143 "
+
+        同一字符串只进行一次正则匹配，每次调用返回新构造的对象。
 
         :param data: 需提取信息的字符串
         :type data: str
         :return: 返回待选课程上课时间信息当列表
         :rtype: List[EnrollCourseTimetable]
         """
-        items = data.split(';')
-        result = []
-
-        for item in items:
-            pos_str = POS_RE.search(item)
-            pos = None
-            if pos_str:
-                pos = pos_str.group().strip()[1:]
-
-            period_str = PERIOD_RE.search(item)
-            timetable = None
-            if period_str:
-                period_str = period_str.group()
-                timetable = CourseDayTime(
-                    weekday=parse_weekday_str(period_str[:3]),
-                    period=parse_period_str(period_str[4:-2])
-                )
-
-            result.append(
-                EnrollCourseTimetable(
-                    weeks=parse_weeks_str(WEEKS_RE.search(item).group()[:-1]),
-                    time=timetable,
-                    pos=pos
-                )
-            )
-
-        return result
\ No newline at end of file
+        if is_record_mode():
+            return [construct_model(
+                EnrollCourseTimetable,
+                weeks=[construct_model(Period, **week) for week in item['weeks']],
+                time=construct_model(CourseDayTime, weekday=item['time']['weekday'],
+                                     period=construct_model(Period, **item['time']['period']))
+                if item['time'] is not None else None,
+                pos=item['pos']
+            ) for item in _parse_timetable_str(data)]
+        return [EnrollCourseTimetable.model_validate(item) for item in _parse_timetable_str(data)]
@@ -0,0 +1,270 @@
+"""
+按变化频率调整轮询间隔的选课余量监视器
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Union
+
+from pydantic import BaseModel
+
+from .models import EnrollCourseItem
+from .tools import _get_enroll_detail_content, _parse_enroll_detail
+from ..utils.clients import ensure_async_client
+from ..utils.construct import construct_container
+from ..utils.fingerprint import digest, fingerprint
+from ..utils.request_transformer import Request
+
+__all__ = ['EnrollMonitor', 'EnrollEvent']
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnrollEvent(BaseModel):
+    """某可选具体课程的已选人数或容量发生的变化
+    """
+    course_id: str
+    """所属可选课程的id"""
+    item: EnrollCourseItem
+    """变化后的可选具体课程"""
+    previous: Optional[EnrollCourseItem] = None
+    """变化前的可选具体课程，第一次获取到该具体课程时为 :obj:`None`"""
+    subscribers: FrozenSet[Hashable] = frozenset()
+    """产生该事件时关注该课程的用户"""
+
+    @property
+    def available(self) -> bool:
+        """该具体课程当前是否有余量"""
+        return self.item.selected_num is not None and self.item.capacity is not None and \
+            self.item.selected_num < self.item.capacity
+
+    @property
+    def became_available(self) -> bool:
+        """该具体课程是否从无余量（或未知）变为有余量"""
+        if not self.available:
+            return False
+        previous = self.previous
+        return previous is None or previous.selected_num is None or previous.capacity is None or \
+            previous.selected_num >= previous.capacity
+
+
+def _item_fingerprint(data: Dict) -> str:
+    return fingerprint((json.dumps(data, sort_keys=True, ensure_ascii=False),))
+
+
+class _CourseState:
+    __slots__ = ('subscribers', 'digest', 'fingerprints', 'items', 'interval', 'next_poll')
+
+    def __init__(self, interval: float):
+        self.subscribers: Set[Hashable] = set()
+        self.digest: Optional[str] = None
+        self.fingerprints: Dict[str, str] = {}
+        self.items: Dict[str, EnrollCourseItem] = {}
+        self.interval = interval
+        self.next_poll = monotonic()
+
+
+class EnrollMonitor:
+    """
+    监视多门可选课程的已选人数与容量
+
+    不同用户关注同一课程时只轮询一次；某课程在一次轮询中发生变化时其轮询间隔缩短为原来的 ``1 / backoff``，
+    未变化时延长为原来的 ``backoff`` 倍，并限制在 ``[min_interval, max_interval]`` 内。
+    原始内容未变化时不做解析，变化时也只为指纹变化的具体课程构造 :class:`EnrollCourseItem` 对象。
+
+    >>> monitor = EnrollMonitor(client)
+    >>> monitor.watch("20200001", course_id)
+    >>> async for event in monitor.events():
+    ...     if event.became_available:
+    ...         notify(event.subscribers, event.item)
+    """
+
+    def __init__(self, session: Union[Request, str], is_major: bool = True, min_interval: float = 5,
+                 max_interval: float = 120, backoff: float = 1.5, jitter: float = 0.2, concurrency: int = 4,
+                 only_available: bool = False):
+        """
+        :param session: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的异步客户端，所有课程共用
+        :type session: Union[Request, str]
+        :param is_major: 是否查询主修专业可选课程(为false时查询辅修专业可选课程)
+        :type is_major: bool, optional
+        :param min_interval: 每门课程的最短轮询间隔（秒）
+        :type min_interval: float, optional
+        :param max_interval: 每门课程的最长轮询间隔（秒）
+        :type max_interval: float, optional
+        :param backoff: 轮询间隔的调整倍数
+        :type backoff: float, optional
+        :param jitter: 轮询间隔随机浮动的比例
+        :type jitter: float, optional
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :param only_available: 是否只产生有余量的事件
+        :type only_available: bool, optional
+        """
+        self.session = ensure_async_client(session)
+        self.is_major = is_major
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.only_available = only_available
+        self._courses: Dict[str, _CourseState] = {}
+        # 每个进行中的 events() 各自的唤醒事件，在其所在的事件循环中创建
+        self._wakeups: Set[asyncio.Event] = set()
+
+    @property
+    def course_ids(self) -> List[str]:
+        """当前被关注的课程id"""
+        return list(self._courses)
+
+    def watch(self, subscriber: Hashable, course_id: str) -> None:
+        """
+        关注某门课程，多个用户关注同一课程时只轮询一次
+
+        :param subscriber: 用户标识
+        :type subscriber: Hashable
+        :param course_id: 可选课程的id
+        :type course_id: str
+        """
+        state = self._courses.get(course_id)
+        if state is None:
+            state = self._courses[course_id] = _CourseState(self.min_interval)
+        state.subscribers.add(subscriber)
+        for wakeup in self._wakeups:
+            wakeup.set()
+
+    def unwatch(self, subscriber: Hashable, course_id: Optional[str] = None) -> None:
+        """
+        取消关注，课程没有关注者时停止轮询该课程
+
+        :param subscriber: 用户标识
+        :type subscriber: Hashable
+        :param course_id: 可选课程的id，为 :obj:`None` 时取消该用户关注的全部课程
+        :type course_id: Optional[str]
+        """
+        for key in [course_id] if course_id is not None else list(self._courses):
+            state = self._courses.get(key)
+            if state is None:
+                continue
+            state.subscribers.discard(subscriber)
+            if not state.subscribers:
+                del self._courses[key]
+
+    def interval_of(self, course_id: str) -> Optional[float]:
+        """
+        获取某课程当前的轮询间隔
+
+        :param course_id: 可选课程的id
+        :type course_id: str
+        :return: 轮询间隔（秒），未关注该课程时为 :obj:`None`
+        :rtype: Optional[float]
+        """
+        state = self._courses.get(course_id)
+        return None if state is None else state.interval
+
+    def _update(self, course_id: str, state: _CourseState, content: bytes) -> List[EnrollEvent]:
+        content_digest = digest(content)
+        events: List[EnrollEvent] = []
+        if content_digest != state.digest:
+            fingerprints: Dict[str, str] = {}
+            items: Dict[str, EnrollCourseItem] = {}
+            for data in _parse_enroll_detail(content, typed=True):
+                key = data.get('id')
+                if key is None:
+                    continue
+                item_fingerprint = _item_fingerprint(data)
+                fingerprints[key] = item_fingerprint
+                if state.fingerprints.get(key) == item_fingerprint:
+                    items[key] = state.items[key]
+                    continue
+                item = items[key] = EnrollCourseItem.from_dict(data)
+                previous = state.items.get(key)
+                if previous is not None and (previous.selected_num, previous.capacity) == \
+                        (item.selected_num, item.capacity):
+                    continue
+                event = construct_container(EnrollEvent, course_id=course_id, item=item, previous=previous,
+                                            subscribers=frozenset(state.subscribers))
+                if not self.only_available or event.available:
+                    events.append(event)
+            changed = state.digest is not None
+            state.digest, state.fingerprints, state.items = content_digest, fingerprints, items
+        else:
+            changed = False
+        if changed:
+            state.interval = max(self.min_interval, state.interval / self.backoff)
+        else:
+            state.interval = min(self.max_interval, state.interval * self.backoff)
+        self._schedule(state)
+        return events
+
+    def _schedule(self, state: _CourseState) -> None:
+        state.next_poll = monotonic() + state.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def poll(self, course_id: str) -> List[EnrollEvent]:
+        """
+        立即轮询一次某门已关注的课程
+
+        :param course_id: 可选课程的id
+        :type course_id: str
+        :return: 该课程各具体课程已选人数或容量的变化
+        :rtype: List[EnrollEvent]
+        """
+        state = self._courses[course_id]
+        content = await _get_enroll_detail_content.async_request(self.session, course_id, self.is_major)
+        if self._courses.get(course_id) is not state:
+            return []
+        return self._update(course_id, state, content)
+
+    async def events(self, on_error: Optional[Callable[[str, Exception], Any]] = None
+                     ) -> AsyncIterator[EnrollEvent]:
+        """
+        持续轮询已关注的课程，产生已选人数或容量变化的事件
+
+        第一次获取到某课程时，其各具体课程均会产生 :attr:`EnrollEvent.previous` 为 :obj:`None` 的事件。
+        某课程轮询出错时只跳过该课程的本轮轮询，按当前间隔稍后重试，不影响其他课程。
+
+        :param on_error: 某课程轮询出错时的回调，为 :obj:`None` 时记录日志；回调抛出的异常会中止轮询并抛出
+        :type on_error: Optional[Callable[[str, Exception], Any]]
+        :return: 事件的异步迭代器
+        :rtype: AsyncIterator[EnrollEvent]
+        """
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        wakeup = asyncio.Event()
+
+        async def limited(course_id: str) -> List[EnrollEvent]:
+            try:
+                async with semaphore:
+                    return await self.poll(course_id)
+            except Exception as e:  # pylint: disable=broad-except
+                state = self._courses.get(course_id)
+                if state is not None:
+                    self._schedule(state)
+                if on_error is None:
+                    _LOGGER.warning("failed to poll enroll course %s", course_id, exc_info=e)
+                else:
+                    on_error(course_id, e)
+                return []
+
+        self._wakeups.add(wakeup)
+        try:
+            while True:
+                now = monotonic()
+                due = [key for key, state in self._courses.items() if state.next_poll <= now]
+                if due:
+                    for future in asyncio.as_completed([limited(key) for key in due]):
+                        for event in await future:
+                            yield event
+                    continue
+                wakeup.clear()
+                delay = min((state.next_poll for state in self._courses.values()),
+                            default=now + self.max_interval) - now
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=max(0.0, delay))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeups.discard(wakeup)
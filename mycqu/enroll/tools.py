@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
-from typing import List, Dict
+from typing import AsyncIterator, Dict, Iterator, List
 
 from requests import Session
 
+from ._schemas import EnrollDetailResponse, EnrollListResponse
+from .._lib_wrapper.fastjson import loads
+from ..exception import MycquUnauthorized
+from ..utils.payload import decode_payload
 from ..utils.request_transformer import Request, RequestTransformer
+from ..utils.streaming import stream_items, async_stream_items
 
 ENROLLMENT_COURSE_LIST_URL = "https://my.cqu.edu.cn/api/enrollment/enrollment/course-list?selectionSource="
 ENROLLMENT_COURSE_DETAIL_URL = "https://my.cqu.edu.cn/api/enrollment/enrollment/courseDetails/"
@@ -16,10 +20,10 @@ __all__ = ['get_enroll_list_raw', 'get_enroll_detail_raw',
 
 
 @RequestTransformer.register()
-def _get_enroll_list_raw(session: Request, is_major: bool = True) -> Dict[str: List]:
+def _get_enroll_list_raw(session: Request, is_major: bool = True, typed: bool = False) -> Dict[str: List]:
     url = ENROLLMENT_COURSE_LIST_URL + ("主修" if is_major else "辅修")
     res = yield session.get(url)
-    content = json.loads(res.text)
+    content = decode_payload(res.content, EnrollListResponse) if typed else loads(res.content)
     assert content["status"] == "success"
 
     result = {}
@@ -28,6 +32,23 @@ def _get_enroll_list_raw(session: Request, is_major: bool = True) -> Dict[str: L
 
     return result
 
+def _stream_enroll_list_raw(session: Request, is_major: bool = True) -> Iterator[Dict]:
+    url = ENROLLMENT_COURSE_LIST_URL + ("主修" if is_major else "辅修")
+    for prefix, data in stream_items(session, 'GET', url, ('status', 'data.item.courseVOList.item')):
+        if prefix == 'status':
+            assert data == "success"
+        else:
+            yield data
+
+
+async def _async_stream_enroll_list_raw(session: Request, is_major: bool = True) -> AsyncIterator[Dict]:
+    url = ENROLLMENT_COURSE_LIST_URL + ("主修" if is_major else "辅修")
+    async for prefix, data in async_stream_items(session, 'GET', url, ('status', 'data.item.courseVOList.item')):
+        if prefix == 'status':
+            assert data == "success"
+        else:
+            yield data
+
 def get_enroll_list_raw(session: Session, is_major: bool = True) -> Dict[str: List]:
     """
 
@@ -61,12 +82,24 @@ async def async_get_enroll_list_raw(session: Request, is_major: bool = True) ->
     return await _get_enroll_list_raw.async_request(session, is_major)
 
 @RequestTransformer.register()
-def _get_enroll_detail_raw(session: Request, course_id: str, is_major: bool = True) -> List:
+def _get_enroll_detail_content(session: Request, course_id: str, is_major: bool = True) -> bytes:
     url = ENROLLMENT_COURSE_DETAIL_URL + course_id + "?selectionSource=" + ("主修" if is_major else "辅修")
     res = yield session.get(url)
-    content = json.loads(res.text)
+    if res.status_code == 401:
+        raise MycquUnauthorized()
+    return res.content
+
+
+def _parse_enroll_detail(content: bytes, typed: bool = False) -> List:
+    content = decode_payload(content, EnrollDetailResponse) if typed else loads(content)
     return content['selectCourseListVOs'][0]['selectCourseVOList'] if len(content['selectCourseListVOs']) > 0 else []
 
+
+@RequestTransformer.register()
+def _get_enroll_detail_raw(session: Request, course_id: str, is_major: bool = True, typed: bool = False) -> List:
+    return _parse_enroll_detail((yield _get_enroll_detail_content, {'course_id': course_id, 'is_major': is_major}),
+                                typed)
+
 def get_enroll_detail_raw(session: Session, course_id: str, is_major: bool = True) -> List:
     """
     从 my.cqu.edu.cn 上获取某可选课程详情
@@ -1,3 +1,4 @@
 from .models import *
+from .cache import ExamCache, ExamChanges
 
-__all__ = ['Exam']
+__all__ = ['Exam', 'ExamCache', 'ExamChanges']
@@ -0,0 +1,41 @@
+"""
+考试相关原始响应的结构，字段类型与 ``from_dict`` 的取值方式一致
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+from typing_extensions import TypedDict
+
+from ..course._schemas import CourseData
+
+
+class InvigilatorData(TypedDict):
+    instructor: str
+    instDeptShortName: str
+
+
+class _ExamRequired(CourseData):
+    batchName: str
+    batchId: int
+    buildingName: str
+    roomName: str
+    floorNum: Union[int, str, None]
+    examDate: str
+    startTime: str
+    endTime: str
+    week: int
+    weekDay: int
+    studentId: str
+    seatNum: int
+    examStuNum: int
+    simpleChiefinvigilatorVOS: Optional[List[InvigilatorData]]
+    simpleAssistantInviVOS: Optional[List[InvigilatorData]]
+
+
+class ExamData(_ExamRequired, total=False):
+    """考表中的一次考试"""
+
+
+class ExamResponse(TypedDict):
+    data: List[ExamData]
@@ -0,0 +1,240 @@
+"""
+按校历调整刷新频率的考表缓存
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from time import monotonic
+from typing import Dict, List, Optional, Tuple, Union, NamedTuple
+
+from pydantic import BaseModel
+
+from ._schemas import ExamResponse
+from .models import Exam
+from .tools import _get_exam_content
+from ..course import AcademicCalendar
+from ..utils.clients import ensure_client, ensure_async_client, anonymous_session, anonymous_async_client
+from ..utils.construct import construct_container
+from ..utils.datetimes import TIMEZONE
+from ..utils.fingerprint import digest, fingerprint
+from ..utils.payload import decode_payload
+from ..utils.request_transformer import Request
+
+__all__ = ['ExamCache', 'ExamChanges']
+
+
+class ExamChanges(BaseModel):
+    """某学生考表相对上次获取的变化
+    """
+    student_id: str
+    """学号"""
+    added: List[Exam] = []
+    """新增的考试"""
+    removed: List[Exam] = []
+    """被移除的考试"""
+    changed: List[Tuple[Exam, Exam]] = []
+    """日期、时间、考场或座号发生变化的考试，每项为 (变化前, 变化后)"""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _exam_key(exam: Exam) -> Tuple[Optional[str], int]:
+    return exam.course.code, exam.batch_id
+
+
+def _exam_fingerprint(exam: Exam) -> str:
+    return fingerprint((exam.date, exam.start_time, exam.end_time, exam.building, exam.floor, exam.room,
+                        exam.seat_num))
+
+
+class _Entry(NamedTuple):
+    digest: str
+    exams: List[Exam]
+    fingerprints: Dict[Tuple[Optional[str], int], str]
+    next_refresh: float
+
+
+class ExamCache:
+    """
+    按学号缓存考表
+
+    处于考试周（由 :class:`.course.AcademicCalendar` 判断）或临近已知考试时以较短的间隔刷新，其余时间以较长的间隔刷新；
+    刷新得到的原始内容与上次相同时不再解析，只有考试的日期、时间、考场或座号变化时才报告变化。
+    超过容量时淘汰最久未使用的学生的缓存。
+
+    >>> cache = ExamCache(AcademicCalendar.fetch(session))
+    >>> changes = cache.refresh("20200001")
+    >>> if changes:
+    ...     notify(changes)
+    """
+
+    def __init__(self, calendar: Optional[AcademicCalendar] = None, exam_interval: float = 600,
+                 idle_interval: float = 6 * 3600, near_days: int = 3, max_size: int = 10000):
+        """
+        :param calendar: 用于判断考试周的校历，为 :obj:`None` 时仅根据已知的考试日期调整刷新间隔
+        :type calendar: Optional[AcademicCalendar]
+        :param exam_interval: 考试周内或临近考试时的刷新间隔（秒）
+        :type exam_interval: float, optional
+        :param idle_interval: 其余时间的刷新间隔（秒）
+        :type idle_interval: float, optional
+        :param near_days: 距离已知考试不超过多少天时视为临近考试
+        :type near_days: int, optional
+        :param max_size: 最多缓存的学生数量
+        :type max_size: int, optional
+        """
+        self.calendar = calendar
+        self.exam_interval = exam_interval
+        self.idle_interval = idle_interval
+        self.near_days = near_days
+        self.max_size = max_size
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def interval_for(self, exams: List[Exam], today: Optional[date] = None) -> float:
+        """计算某学生考表的刷新间隔
+
+        :param exams: 该学生当前的考表
+        :type exams: List[Exam]
+        :param today: 当天日期，默认为当前日期
+        :type today: Optional[date]
+        :return: 刷新间隔（秒）
+        :rtype: float
+        """
+        today = today or datetime.now(TIMEZONE).date()
+        if self.calendar is not None and self.calendar.is_exam_period(today):
+            return self.exam_interval
+        if any(0 <= (exam.date - today).days <= self.near_days for exam in exams):
+            return self.exam_interval
+        return self.idle_interval
+
+    def get_cached(self, student_id: str) -> Optional[List[Exam]]:
+        """获取缓存的考表，不发出请求
+
+        :param student_id: 学号
+        :type student_id: str
+        :return: 缓存的考表，未缓存时为 :obj:`None`
+        :rtype: Optional[List[Exam]]
+        """
+        entry = self._entries.get(student_id)
+        return None if entry is None else entry.exams
+
+    def is_stale(self, student_id: str) -> bool:
+        """判断某学生的考表是否需要刷新
+
+        :param student_id: 学号
+        :type student_id: str
+        :rtype: bool
+        """
+        entry = self._entries.get(student_id)
+        return entry is None or entry.next_refresh <= monotonic()
+
+    def invalidate(self, student_id: str) -> None:
+        """移除某学生的缓存
+
+        :param student_id: 学号
+        :type student_id: str
+        """
+        with self._lock:
+            self._entries.pop(student_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, student_id: str, entry: _Entry) -> None:
+        # 调用方需持有 self._lock
+        self._entries[student_id] = entry
+        self._entries.move_to_end(student_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _update(self, student_id: str, content: bytes) -> ExamChanges:
+        content_digest = digest(content)
+        with self._lock:
+            entry = self._entries.get(student_id)
+            if entry is not None and entry.digest == content_digest:
+                # 原始内容未变化，跳过解析
+                self._store(student_id, entry._replace(next_refresh=monotonic() + self.interval_for(entry.exams)))
+                return ExamChanges(student_id=student_id)
+
+        exams = [Exam.from_dict(exam) for exam in decode_payload(content, ExamResponse)["data"]]
+        fingerprints = {_exam_key(exam): _exam_fingerprint(exam) for exam in exams}
+        if entry is not None:
+            old = {_exam_key(exam): exam for exam in entry.exams}
+            new = {_exam_key(exam): exam for exam in exams}
+            added = [exam for key, exam in new.items() if key not in old]
+            removed = [exam for key, exam in old.items() if key not in new]
+            changed = [(old[key], exam) for key, exam in new.items()
+                       if key in old and entry.fingerprints[key] != fingerprints[key]]
+        else:
+            added, removed, changed = exams, [], []
+        # 记录模式下考试为记录，由 construct_container 直接构造
+        changes = construct_container(ExamChanges, student_id=student_id, added=added, removed=removed,
+                                      changed=changed)
+        with self._lock:
+            self._store(student_id, _Entry(content_digest, exams, fingerprints, monotonic() + self.interval_for(exams)))
+        return changes
+
+    def refresh(self, student_id: str, session: Optional[Union[Request, str]] = None,
+                force: bool = False) -> ExamChanges:
+        """在需要时刷新某学生的考表
+
+        :param student_id: 学号
+        :type student_id: str
+        :param session: 登陆后获取的 authorization 或者会话，留空时使用共享连接池中的匿名会话
+        :type session: Optional[Union[Request, str]]
+        :param force: 是否忽略刷新间隔强制刷新
+        :type force: bool, optional
+        :return: 考表的变化，未到刷新时间时为空
+        :rtype: ExamChanges
+        """
+        if not force and not self.is_stale(student_id):
+            return ExamChanges(student_id=student_id)
+        client = ensure_client(session) if session else anonymous_session()
+        return self._update(student_id, _get_exam_content.sync_request(client, student_id))
+
+    async def async_refresh(self, student_id: str, session: Optional[Union[Request, str]] = None,
+                            force: bool = False) -> ExamChanges:
+        """异步的在需要时刷新某学生的考表
+
+        :param student_id: 学号
+        :type student_id: str
+        :param session: 登陆后获取的 authorization 或者异步客户端，为 :obj:`None` 时使用共享连接池中的匿名客户端
+        :type session: Optional[Union[Request, str]]
+        :param force: 是否忽略刷新间隔强制刷新
+        :type force: bool, optional
+        :return: 考表的变化，未到刷新时间时为空
+        :rtype: ExamChanges
+        """
+        if not force and not self.is_stale(student_id):
+            return ExamChanges(student_id=student_id)
+        client = ensure_async_client(session) if session else anonymous_async_client()
+        return self._update(student_id, await _get_exam_content.async_request(client, student_id))
+
+    def get(self, student_id: str, session: Optional[Union[Request, str]] = None) -> List[Exam]:
+        """获取某学生的考表，缓存过期时刷新
+
+        :param student_id: 学号
+        :type student_id: str
+        :param session: 登陆后获取的 authorization 或者会话，留空时使用共享连接池中的匿名会话
+        :type session: Optional[Union[Request, str]]
+        :return: 考表
+        :rtype: List[Exam]
+        """
+        self.refresh(student_id, session)
+        return self._entries[student_id].exams
+
+    async def async_get(self, student_id: str, session: Optional[Union[Request, str]] = None) -> List[Exam]:
+        """异步的获取某学生的考表，缓存过期时刷新
+
+        :param student_id: 学号
+        :type student_id: str
+        :param session: 登陆后获取的 authorization 或者异步客户端，为 :obj:`None` 时使用共享连接池中的匿名客户端
+        :type session: Optional[Union[Request, str]]
+        :return: 考表
+        :rtype: List[Exam]
+        """
+        await self.async_refresh(student_id, session)
+        return self._entries[student_id].exams
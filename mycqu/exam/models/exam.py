@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union, Iterable, Iterator, AsyncIterator, Tuple
 from datetime import date, time
 
 from pydantic import BaseModel
 
 from .invigilator import Invigilator
-from ..tools import get_exam_raw, async_get_exam_raw
+from ..tools import _get_exam_raw, _iter_exam_raw, _async_iter_exam_raw
 from ...course import Course
+from ...utils.clients import ensure_client, ensure_async_client, anonymous_session, anonymous_async_client
 from ...utils.datetimes import date_from_str, time_from_str
 from ...utils.request_transformer import Request
+from ...utils.construct import construct_model
+from ...utils.interning import intern_str
 
 
 __all__ = ['Exam']
@@ -61,21 +64,23 @@ class Exam(BaseModel):
         :rtype: [type]
         """
         course = Course.from_dict(data)
-        return Exam(
+        floor = data["floorNum"]
+        return construct_model(
+            Exam,
             course=course,
-            batch=data["batchName"],
-            batch_id=data["batchId"],
-            building=data["buildingName"],
-            room=data["roomName"],
-            floor=data["floorNum"] if data["floorNum"] != "null" else None,
+            batch=intern_str(data["batchName"]),
+            batch_id=int(data["batchId"]),
+            building=intern_str(data["buildingName"]),
+            room=intern_str(data["roomName"]),
+            floor=int(floor) if floor not in (None, "", "null") else None,
             date=date_from_str(data["examDate"]),
             start_time=time_from_str(data["startTime"]),
             end_time=time_from_str(data["endTime"]),
-            week=data["week"],
+            week=int(data["week"]),
             weekday=int(data["weekDay"]) - 1,
             stu_id=data["studentId"],
-            seat_num=data["seatNum"],
-            stu_num=data["examStuNum"],
+            seat_num=int(data["seatNum"]),
+            stu_num=int(data["examStuNum"]),
             chief_invi=[Invigilator.from_dict(invi)
                         for invi in data["simpleChiefinvigilatorVOS"]]
             if data['simpleChiefinvigilatorVOS'] is not None else [],
@@ -85,29 +90,91 @@ class Exam(BaseModel):
         )
 
     @staticmethod
-    def fetch(session: Request, student_id: str) -> List[Exam]:
+    def fetch(session: Union[Request, str], student_id: str) -> List[Exam]:
         """从 my.cqu.edu.cn 上获取指定学生的考表
 
         :param session: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的 Session
-        :type session: Request
+        :type session: Union[Request, str]
         :param student_id: 学生学号
         :type student_id: str
         :return: 本学期的考表
         :rtype: List[Exam]
         """
-        return [Exam.from_dict(exam)
-                for exam in get_exam_raw(student_id, session)["data"]]
+        return list(Exam.iter_fetch(session, student_id))
 
     @staticmethod
-    async def async_fetch(session: Request, student_id: str) -> List[Exam]:
+    async def async_fetch(session: Union[Request, str], student_id: str) -> List[Exam]:
         """从 my.cqu.edu.cn 上获取指定学生的考表
 
         :param session: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的 Session
-        :type session: Request
+        :type session: Union[Request, str]
         :param student_id: 学生学号
         :type student_id: str
         :return: 本学期的考表
         :rtype: List[Exam]
         """
-        return [Exam.from_dict(exam)
-                for exam in (await async_get_exam_raw(session, student_id))["data"]]
+        return [exam async for exam in Exam.async_iter_fetch(session, student_id)]
+
+    @staticmethod
+    def iter_fetch(session: Union[Request, str], student_id: str) -> Iterator[Exam]:
+        """从 my.cqu.edu.cn 上获取指定学生的考表，逐个解析并返回考试对象
+
+        :param session: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的 Session
+        :type session: Union[Request, str]
+        :param student_id: 学生学号
+        :type student_id: str
+        :return: 本学期考试的迭代器
+        :rtype: Iterator[Exam]
+        """
+        client = ensure_client(session) if session else anonymous_session()
+        for exam in _get_exam_raw.sync_request(client, student_id, typed=True)["data"]:
+            yield Exam.from_dict(exam)
+
+    @staticmethod
+    async def async_iter_fetch(session: Union[Request, str], student_id: str) -> AsyncIterator[Exam]:
+        """异步的从 my.cqu.edu.cn 上获取指定学生的考表，逐个解析并返回考试对象
+
+        :param session: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的异步客户端
+        :type session: Union[Request, str]
+        :param student_id: 学生学号
+        :type student_id: str
+        :return: 本学期考试的异步迭代器
+        :rtype: AsyncIterator[Exam]
+        """
+        client = ensure_async_client(session) if session else anonymous_async_client()
+        for exam in (await _get_exam_raw.async_request(client, student_id, typed=True))["data"]:
+            yield Exam.from_dict(exam)
+
+    @staticmethod
+    def fetch_many(student_ids: Iterable[str], session: Optional[Union[Request, str]] = None,
+                   concurrency: int = 8) -> Iterator[Tuple[str, List[Exam]]]:
+        """从 my.cqu.edu.cn 上并发地获取多个学生的考表，按完成的先后顺序逐个返回
+
+        :param student_ids: 学生学号
+        :type student_ids: Iterable[str]
+        :param session: 登陆后获取的 authorization 或者会话，留空时使用共享连接池中的匿名会话
+        :type session: Optional[Union[Request, str]]
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :return: (学号, 该学生本学期的考表) 的迭代器
+        :rtype: Iterator[Tuple[str, List[Exam]]]
+        """
+        for student_id, raw in _iter_exam_raw(student_ids, session, concurrency, typed=True):
+            yield student_id, [Exam.from_dict(exam) for exam in raw["data"]]
+
+    @staticmethod
+    async def async_fetch_many(student_ids: Iterable[str], session: Optional[Union[Request, str]] = None,
+                               concurrency: int = 8) -> AsyncIterator[Tuple[str, List[Exam]]]:
+        """异步的从 my.cqu.edu.cn 上并发地获取多个学生的考表，按完成的先后顺序逐个返回
+
+        :param student_ids: 学生学号
+        :type student_ids: Iterable[str]
+        :param session: 登陆后获取的 authorization 或者异步客户端，为 :obj:`None` 时使用共享连接池中的匿名客户端
+        :type session: Optional[Union[Request, str]]
+        :param concurrency: 同时进行的请求数量
+        :type concurrency: int, optional
+        :return: (学号, 该学生本学期的考表) 的异步迭代器
+        :rtype: AsyncIterator[Tuple[str, List[Exam]]]
+        """
+        async for student_id, raw in _async_iter_exam_raw(student_ids, session, concurrency, typed=True):
+            yield student_id, [Exam.from_dict(exam) for exam in raw["data"]]
@@ -4,6 +4,8 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel
 
+from ...utils.construct import construct_model
+
 
 __all__ = ['Invigilator']
 
@@ -24,7 +26,8 @@ class Invigilator(BaseModel):
         :return: 对应的 :class:`Invigilator` 对象
         :rtype: Invigilator
         """
-        return Invigilator(
+        return construct_model(
+            Invigilator,
             name=data["instructor"],  # type: ignore
             dept=data["instDeptShortName"]  # type: ignore
         )
\ No newline at end of file
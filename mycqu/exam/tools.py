@@ -2,46 +2,165 @@
 """
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Union, Iterable, Iterator, AsyncIterator, List, Tuple
 
 import requests
 
+from ._schemas import ExamResponse
 from .._lib_wrapper.encrypt import pad16, aes_ecb_encryptor
+from .._lib_wrapper.fastjson import loads
 
+from ..utils.clients import ensure_client, ensure_async_client, anonymous_session, anonymous_async_client
+from ..utils.payload import decode_payload
 from ..utils.request_transformer import Request, RequestTransformer
 
-__all__ = ['get_exam_raw', 'async_get_exam_raw']
+__all__ = ['get_exam_raw', 'async_get_exam_raw', 'iter_exam_raw', 'async_iter_exam_raw']
 
 __exam_encryptor = aes_ecb_encryptor("cquisse123456789".encode())
 EXAM_LIST_URL = "https://my.cqu.edu.cn/api/exam/examTask/get-student-exam-tab-list"
 
+_ENCRYPTED_ID_CACHE_SIZE = 65536
+_encrypted_ids: 'OrderedDict[str, str]' = OrderedDict()
+_encrypted_ids_lock = threading.Lock()
+
+
+def _encrypt_student_ids(student_ids: Iterable[str]) -> List[str]:
+    """
+    批量加密学号，未缓存的学号拼接后只调用一次加密（ECB 模式下各块独立加密），结果缓存在有上限的表中
+    """
+    student_ids = list(student_ids)
+    with _encrypted_ids_lock:
+        missing = list(dict.fromkeys(sid for sid in student_ids if sid not in _encrypted_ids))
+    if missing:
+        padded = [pad16(sid.encode()) for sid in missing]
+        cipher = __exam_encryptor(b''.join(padded))
+        start = 0
+        encrypted = {}
+        for sid, block in zip(missing, padded):
+            encrypted[sid] = cipher[start:start + len(block)].hex().upper()
+            start += len(block)
+        with _encrypted_ids_lock:
+            _encrypted_ids.update(encrypted)
+            while len(_encrypted_ids) > _ENCRYPTED_ID_CACHE_SIZE:
+                _encrypted_ids.popitem(last=False)
+    else:
+        encrypted = {}
+    with _encrypted_ids_lock:
+        result = []
+        for sid in student_ids:
+            value = encrypted.get(sid) or _encrypted_ids.get(sid)
+            if value is None:
+                # 已被挤出缓存时单独加密
+                value = __exam_encryptor(pad16(sid.encode())).hex().upper()
+            result.append(value)
+        return result
+
 
 @RequestTransformer.register()
-def _get_exam_raw(session: Request, student_id: str) -> Dict[str, Any]:
+def _get_exam_content(session: Request, student_id: str) -> bytes:
     return (yield session.get(EXAM_LIST_URL,
-                              params={"studentId": __exam_encryptor(pad16(student_id.encode())).hex().upper()}
-                              )).json()
+                              params={"studentId": _encrypt_student_ids((student_id,))[0]}
+                              )).content
+
 
-def get_exam_raw(student_id: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
+@RequestTransformer.register()
+def _get_exam_raw(session: Request, student_id: str, typed: bool = False) -> Dict[str, Any]:
+    content = yield _get_exam_content, {'student_id': student_id}
+    return decode_payload(content, ExamResponse) if typed else loads(content)
+
+def get_exam_raw(student_id: str, session: Optional[Union[requests.Session, str]] = None) -> Dict[str, Any]:
     """获取考表的原始 json 数据（被反序列化为 python 字典对象）
 
     :param student_id: 学号
     :type student_id: str
-    :param session: 用于请求的 requests session
-    :type session: requests.Session, optional
+    :param session: 用于请求的 requests session 或登陆后获取的 authorization，留空时使用共享连接池中的匿名会话
+    :type session: Union[requests.Session, str], optional
     :return: 反序列化后的课表 json 数据
     :rtype: Dict[str, Any]
     """
-    return _get_exam_raw.sync_request((session or requests), student_id)
+    return _get_exam_raw.sync_request(ensure_client(session) if session else anonymous_session(), student_id)
 
-async def async_get_exam_raw(session: Request, student_id: str) -> Dict[str, Any]:
+async def async_get_exam_raw(session: Optional[Union[Request, str]], student_id: str) -> Dict[str, Any]:
     """获取考表的原始 json 数据（被反序列化为 python 字典对象）
 
-    :param session: 用于请求的 requests session
-    :type session: requests.Session
+    :param session: 用于请求的异步客户端或登陆后获取的 authorization，为 :obj:`None` 时使用共享连接池中的匿名客户端
+    :type session: Optional[Union[Request, str]]
     :param student_id: 学号
     :type student_id: str
     :return: 反序列化后的课表 json 数据
     :rtype: Dict[str, Any]
     """
-    return await _get_exam_raw.async_request((session or requests), student_id)
+    return await _get_exam_raw.async_request(ensure_async_client(session) if session else anonymous_async_client(),
+                                             student_id)
+
+
+def iter_exam_raw(student_ids: Iterable[str], session: Optional[Union[requests.Session, str]] = None,
+                  concurrency: int = 8) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """并发地获取多个学生考表的原始 json 数据，按完成的先后顺序逐个返回
+
+    :param student_ids: 学号
+    :type student_ids: Iterable[str]
+    :param session: 用于请求的 requests session 或登陆后获取的 authorization，留空时使用共享连接池中的匿名会话
+    :type session: Union[requests.Session, str], optional
+    :param concurrency: 同时进行的请求数量
+    :type concurrency: int, optional
+    :return: (学号, 反序列化后的考表 json 数据) 的迭代器
+    :rtype: Iterator[Tuple[str, Dict[str, Any]]]
+    """
+    return _iter_exam_raw(student_ids, session, concurrency)
+
+
+def _iter_exam_raw(student_ids: Iterable[str], session: Optional[Union[requests.Session, str]] = None,
+                   concurrency: int = 8, typed: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    student_ids = list(dict.fromkeys(student_ids))
+    _encrypt_student_ids(student_ids)
+    client = ensure_client(session) if session else anonymous_session()
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    futures = {executor.submit(_get_exam_raw.sync_request, client, sid, typed): sid for sid in student_ids}
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def async_iter_exam_raw(student_ids: Iterable[str], session: Optional[Union[Request, str]] = None,
+                        concurrency: int = 8) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """异步的并发获取多个学生考表的原始 json 数据，按完成的先后顺序逐个返回
+
+    :param student_ids: 学号
+    :type student_ids: Iterable[str]
+    :param session: 用于请求的异步客户端或登陆后获取的 authorization，为 :obj:`None` 时使用共享连接池中的匿名客户端
+    :type session: Optional[Union[Request, str]]
+    :param concurrency: 同时进行的请求数量
+    :type concurrency: int, optional
+    :return: (学号, 反序列化后的考表 json 数据) 的异步迭代器
+    :rtype: AsyncIterator[Tuple[str, Dict[str, Any]]]
+    """
+    return _async_iter_exam_raw(student_ids, session, concurrency)
+
+
+async def _async_iter_exam_raw(student_ids: Iterable[str], session: Optional[Union[Request, str]] = None,
+                               concurrency: int = 8, typed: bool = False) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    student_ids = list(dict.fromkeys(student_ids))
+    _encrypt_student_ids(student_ids)
+    client = ensure_async_client(session) if session else anonymous_async_client()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(sid: str) -> Tuple[str, Dict[str, Any]]:
+        async with semaphore:
+            return sid, await _get_exam_raw.async_request(client, sid, typed)
+
+    tasks = [asyncio.ensure_future(fetch(sid)) for sid in student_ids]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, List
 
 from pydantic import BaseModel
 from requests import Session
@@ -41,37 +41,38 @@ class BookInfo(BaseModel):
 
     @staticmethod
     def from_list(*data: List[str], is_curr: bool) -> List[BookInfo]:
+        return list(BookInfo._iter_list(*data, is_curr=is_curr))
+
+    @staticmethod
+    def _iter_list(*data: List[str], is_curr: bool) -> Iterator[BookInfo]:
         max_len = max(map(lambda x: len(x), data))
         standard_data = list(map(lambda x: x if len(x) == max_len else [None for i in range(max_len)], data))
-        book_infos: List[Tuple] = list(zip(*standard_data))
-
-        result: List[BookInfo] = []
-
-        for book_info in book_infos:
-            result.append(
-                BookInfo(
-                    id=book_info[0],
-                    title=book_info[1],
-                    call_no=book_info[2],
-                    library_name=book_info[3],
-                    borrow_time=datetime_from_str(book_info[4]),
-                    should_return_time=date_from_str(book_info[5]) if book_info[5] is not None else None,
-                    is_return= not is_curr,
-                    return_time=date_from_str(book_info[6]) if book_info[6] is not None else None,
-                    renew_count=book_info[7],
-                    can_renew=book_info[8] if book_info[8] is not None else False,
-                )
-            )
 
-        return result
+        for book_info in zip(*standard_data):
+            yield BookInfo(
+                id=book_info[0],
+                title=book_info[1],
+                call_no=book_info[2],
+                library_name=book_info[3],
+                borrow_time=datetime_from_str(book_info[4]),
+                should_return_time=date_from_str(book_info[5]) if book_info[5] is not None else None,
+                is_return= not is_curr,
+                return_time=date_from_str(book_info[6]) if book_info[6] is not None else None,
+                renew_count=book_info[7],
+                can_renew=book_info[8] if book_info[8] is not None else False,
+            )
 
     @staticmethod
     @RequestTransformer.register()
     def _fetch(session: Request, is_curr: bool) -> List[BookInfo]:
         res = yield _get_borrow_books_raw, {'is_curr': is_curr}
+        return list(BookInfo._iter_response(res, is_curr))
+
+    @staticmethod
+    def _iter_response(res: Dict, is_curr: bool) -> Iterator[BookInfo]:
         data = res.get('columns')
         if data is None:
-            return []
+            return
 
         ids = parse_response(data, 'bookId')
         titles = parse_response(data, 'title')
@@ -83,10 +84,10 @@ class BookInfo(BaseModel):
         renew_count = parse_response(data, 'renewalNumber')
         can_renews = parse_response(data, 'renewflag')
 
-        return BookInfo.from_list(ids, titles, call_nos, library_names,
-                                  borrow_times, should_return_times,
-                                  return_times, renew_count, can_renews,
-                                  is_curr=is_curr)
+        yield from BookInfo._iter_list(ids, titles, call_nos, library_names,
+                                       borrow_times, should_return_times,
+                                       return_times, renew_count, can_renews,
+                                       is_curr=is_curr)
 
 
     @staticmethod
@@ -117,6 +118,35 @@ class BookInfo(BaseModel):
         """
         return await BookInfo._fetch.async_request(session, is_curr)
 
+    @staticmethod
+    def iter_fetch(session: Session, is_curr: bool) -> Iterator[BookInfo]:
+        """
+        获取当前/历史借阅书籍，逐个解析并返回图书对象
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu和lib.cqu.edu.cn 进行了认证（:func:`.mycqu.access_mycqu` :func:`.library.access_library`）的 requests 会话
+        :type session: Session
+        :param is_curr: 是否获取当前借阅书籍（为否则获取历史借阅书籍）
+        :type is_curr: bool
+        :return: 图书对象的迭代器
+        :rtype: Iterator[BookInfo]
+        """
+        yield from BookInfo._iter_response(_get_borrow_books_raw.sync_request(session, is_curr), is_curr)
+
+    @staticmethod
+    async def async_iter_fetch(session: Request, is_curr: bool) -> AsyncIterator[BookInfo]:
+        """
+        异步的获取当前/历史借阅书籍，逐个解析并返回图书对象
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu和lib.cqu.edu.cn 进行了认证（:func:`.mycqu.access_mycqu` :func:`.library.access_library`）的异步客户端
+        :type session: Request
+        :param is_curr: 是否获取当前借阅书籍（为否则获取历史借阅书籍）
+        :type is_curr: bool
+        :return: 图书对象的异步迭代器
+        :rtype: AsyncIterator[BookInfo]
+        """
+        for book in BookInfo._iter_response(await _get_borrow_books_raw.async_request(session, is_curr), is_curr):
+            yield book
+
     @staticmethod
     def _parse_renew_result(res: Dict) -> str:
         if res.get('data') is not None:
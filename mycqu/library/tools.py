@@ -6,7 +6,8 @@ from typing import Any, Dict, List
 
 from requests import Session
 
-from ..auth import access_service, async_access_service
+from .._lib_wrapper.fastjson import loads
+from ..auth._services import _access_service, _register_service, access_services, async_access_services
 from ..utils.request_transformer import RequestTransformer, Request
 
 __all__ = ['access_library', 'async_access_library',
@@ -28,44 +29,55 @@ def _access_library(request: Request, ticket: str) -> str:
         "orgCode": "cqu",
         "OrgTokenLink": ACCESS_URL
     })
-    token1 = res1.json()["data"]["token"]
+    token1 = loads(res1.content)["data"]["token"]
     res2 = yield request.get(
         AUTHORIZE_URL,
         params={'service': "http://lib.cqu.edu.cn/", "ticket": ticket}, headers={'Authorization': "Bearer " + token1})
-    token2 = res2.json()["data"]["token"]
+    token2 = loads(res2.content)["data"]["token"]
     return "Bearer " + token2
 
 
 
+@RequestTransformer.register()
+def _access_library_service(session: Request, use_sso: bool = True) -> Dict[str, str]:
+    res = yield _access_service, {'service': "http://lib.cqu.edu.cn/", 'use_sso': use_sso}
+    ticket = str(res.url)[30:]
+    token = yield _access_library, {'ticket': ticket}
+    return {"Authorization": token}
+
+
+_register_service('library', ('lib.cqu.edu.cn',), _access_library_service, ('Authorization',))
+
+
 def access_library(session: Session):
     """
     通过统一身份认证登陆图书馆页面，返回UserID和UserKey用于查询
 
+    图书馆的认证信息仅附加到发往 lib.cqu.edu.cn 的请求，不再写入 ``session.headers['Authorization']``，
+    因此不会覆盖 mycqu 的认证信息。
+
     :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
     :type session: Session
     """
-    res = access_service(session, "http://lib.cqu.edu.cn/")
-    ticket = res.url[30:]
-    token = _access_library.sync_request(session, ticket)
-    session.headers["Authorization"] = token
+    access_services(session, ('library',))
 
 async def async_access_library(session: Request):
     """
     异步的通过统一身份认证登陆图书馆页面，返回UserID和UserKey用于查询
 
+    图书馆的认证信息仅附加到发往 lib.cqu.edu.cn 的请求，不再写入 ``session.headers['Authorization']``，
+    因此不会覆盖 mycqu 的认证信息。
+
     :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
     :type session: Session
     """
-    res = await async_access_service(session, "http://lib.cqu.edu.cn/")
-    ticket = str(res.url)[30:]
-    token = await _access_library.async_request(session, ticket)
-    session.headers["Authorization"] = token
+    await async_access_services(session, ('library',))
 
 
 @RequestTransformer.register()
 def _get_borrow_books_raw(request: Request, is_curr: bool):
     res = yield request.get(CURR_BOOKS_URL if is_curr else HISTORY_BOOKS_URL)
-    return res.json()['data']['data']
+    return loads(res.content)['data']['data']
 
 
 def get_curr_books_raw(session: Session) -> Dict:
@@ -109,12 +121,12 @@ def _renew_book(request: Request, book_id: int) -> Dict:
         'data': str(book_id)
     })
 
-    return res.json()
+    return loads(res.content)
 
 @RequestTransformer.register()
 def _get_book_pos(request: Request, book_id: int):
     res = yield request.get(params={'bookid': book_id})
-    return res.json().get('data')
+    return loads(res.content).get('data')
 
 def parse_response(target: List[Dict], field_name: str) -> List[str]:
     result = list(filter(lambda x: x['fieldName'] == field_name, target))
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Generic, Optional
+from typing import Generic, Optional, Union
 
 from requests import Session
 
+from ..._lib_wrapper.fastjson import loads
 from ...exception import MycquUnauthorized
+from ...utils.clients import ensure_client, ensure_async_client
 from ...utils.request_transformer import Request
 from pydantic import BaseModel
 
@@ -28,19 +30,19 @@ class User(BaseModel, Generic[Request]):
     "电话号码"
 
     @staticmethod
-    def fetch_self(session: Session) -> User:
+    def fetch_self(session: Union[Session, str]) -> User:
         """从在 mycqu 认证了的会话获取当前登录用户的信息
 
-        :param session: 登陆了统一身份认证的会话
-        :type session: Session
+        :param session: 登陆后获取的 authorization 或者登陆了统一身份认证并在 mycqu 认证了的会话
+        :type session: Union[Session, str]
         :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
         :return: 当前用户信息
         :rtype: User
         """
-        resp = session.get("https://my.cqu.edu.cn/authserver/simple-user")
+        resp = ensure_client(session).get("https://my.cqu.edu.cn/authserver/simple-user")
         if resp.status_code == 401:
             raise MycquUnauthorized()
-        data = resp.json()
+        data = loads(resp.content)
         return User(
             name=data["name"],
             code=data["code"],
@@ -51,20 +53,20 @@ class User(BaseModel, Generic[Request]):
         )
 
     @staticmethod
-    async def async_fetch_self(session: Request) -> User:
+    async def async_fetch_self(session: Union[Request, str]) -> User:
         """
         异步的从在 mycqu 认证了的会话获取当前登录用户的信息
 
-        :param session: 登陆了统一身份认证的会话
-        :type session: Session
+        :param session: 登陆后获取的 authorization 或者登陆了统一身份认证并在 mycqu 认证了的会话
+        :type session: Union[Request, str]
         :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
         :return: 当前用户信息
         :rtype: User
         """
-        resp = await session.get("https://my.cqu.edu.cn/authserver/simple-user")
+        resp = await ensure_async_client(session).get("https://my.cqu.edu.cn/authserver/simple-user")
         if resp.status_code == 401:
             raise MycquUnauthorized()
-        data = resp.json()
+        data = loads(resp.content)
         return User(
             name=data["name"],
             code=data["code"],
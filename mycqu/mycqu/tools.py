@@ -3,7 +3,8 @@
 from typing import Dict, Generic
 import re
 
-from ..auth import access_service, async_access_service
+from .._lib_wrapper.fastjson import loads
+from ..auth._services import _access_service, _register_service, access_services, async_access_services
 from ..utils.request_transformer import Request, RequestTransformer
 
 __all__ = ["access_mycqu", "async_access_mycqu"]
@@ -31,7 +32,17 @@ def _get_oauth_token(session: Generic[Request]) -> str:
         'grant_type': 'authorization_code'
     }
     access_token = yield session.post(MYCQU_TOKEN_URL, data=token_data)
-    return "Bearer " + access_token.json()['access_token']
+    return "Bearer " + loads(access_token.content)['access_token']
+
+
+@RequestTransformer.register()
+def _access_mycqu_service(session: Generic[Request], use_sso: bool = True) -> Dict[str, str]:
+    yield _access_service, {'service': MYCQU_SERVICE_URL, 'use_sso': use_sso}
+    token = yield _get_oauth_token
+    return {"Authorization": token}
+
+
+_register_service('mycqu', ('my.cqu.edu.cn',), _access_mycqu_service, ('Authorization',))
 
 
 def access_mycqu(session: Generic[Request], add_to_header: bool = True) -> Dict[str, str]:
@@ -39,33 +50,23 @@ def access_mycqu(session: Generic[Request], add_to_header: bool = True) -> Dict[
 
     :param session: 登陆了统一身份认证的会话
     :type session: Session
-    :param add_to_header: 是否将 mycqu 的认证信息写入会话属性，默认为 :obj:`True`
+    :param add_to_header: 是否将 mycqu 的认证信息写入会话属性，默认为 :obj:`True`；
+                          认证信息仅附加到发往 my.cqu.edu.cn 的请求，不再写入 ``session.headers['Authorization']``
     :type add_to_header: bool, optional
     :return: mycqu 认证信息的请求头，当 ``add_to_header`` 参数为 :obj:`True` 时无需手动使用该返回值
     :rtype: Dict[str, str]
     """
-    if "Authorization" in session.headers:
-        del session.headers["Authorization"]
-    access_service(session, MYCQU_SERVICE_URL)
-    token = _get_oauth_token.sync_request(session)
-    if add_to_header:
-        session.headers["Authorization"] = token
-    return {"Authorization": token}
+    return access_services(session, ('mycqu',), add_to_header=add_to_header)['mycqu']
 
 async def async_access_mycqu(session: Generic[Request], add_to_header: bool = True) -> Dict[str, str]:
     """用登陆了统一身份认证的会话在 my.cqu.edu.cn 进行认证
 
     :param session: 登陆了统一身份认证的会话
     :type session: Generic[Request]
-    :param add_to_header: 是否将 mycqu 的认证信息写入会话属性，默认为 :obj:`True`
+    :param add_to_header: 是否将 mycqu 的认证信息写入会话属性，默认为 :obj:`True`；
+                          认证信息仅附加到发往 my.cqu.edu.cn 的请求，不再写入 ``session.headers['Authorization']``
     :type add_to_header: bool, optional
     :return: mycqu 认证信息的请求头，当 ``add_to_header`` 参数为 :obj:`True` 时无需手动使用该返回值
     :rtype: Dict[str, str]
     """
-    if "Authorization" in session.headers:
-        del session.headers["Authorization"]
-    await async_access_service(session, MYCQU_SERVICE_URL)
-    token = await _get_oauth_token.async_request(session)
-    if add_to_header:
-        session.headers["Authorization"] = token
-    return {"Authorization": token}
+    return (await async_access_services(session, ('mycqu',), add_to_header=add_to_header))['mycqu']
@@ -0,0 +1,54 @@
+"""
+教室相关原始响应的结构，字段类型与 ``from_dict`` 的取值方式一致
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from typing_extensions import TypedDict
+
+
+class RoomActivityData(TypedDict):
+    periodFormat: str
+    teachingWeekFormat: str
+    weekDay: int
+
+
+class RoomCourseData(RoomActivityData):
+    """``classTimetableVOList`` 中的一项"""
+    classNbr: str
+    courseCode: str
+    courseName: str
+    courseDepartmentName: str
+    selectedStuNum: int
+    credit: float
+    instructorName: str
+
+
+class RoomExamInvigilatorData(TypedDict):
+    name: str
+    invigilatorType: str
+    deptName: str
+
+
+class RoomExamData(RoomActivityData):
+    """``roomExamTimeTableVOList`` 中的一项"""
+    courseName: str
+    stuCapacity: int
+    timeIn: str
+    invigilatorVOList: List[RoomExamInvigilatorData]
+
+
+class RoomTempActivityData(RoomActivityData):
+    """``tempActivityTimetableVOList`` 中的一项"""
+    actContent: str
+    actDepartment: str
+    tempActType: str
+    timeIn: str
+    dateStr: str
+
+
+class RoomTimetableResponse(TypedDict):
+    classTimetableVOList: Optional[List[RoomCourseData]]
+    roomExamTimeTableVOList: Optional[List[RoomExamData]]
+    tempActivityTimetableVOList: Optional[List[RoomTempActivityData]]
@@ -5,8 +5,11 @@ from typing import Any, Dict, List
 from requests import Session
 from pydantic import BaseModel
 
+from ..._lib_wrapper.fastjson import loads
 from ...exception import MycquUnauthorized
 from ...utils.request_transformer import Request, RequestTransformer
+from ...utils.construct import construct_model
+from ...utils.interning import intern_str
 
 ROOM_ID_URL = "https://my.cqu.edu.cn/api/resourceapi/room/roomName-filter"
 
@@ -37,13 +40,14 @@ class Room(BaseModel):
         :return: 教室对象
         :rtype: Room
         """
-        return Room(
+        return construct_model(
+            Room,
             id=int(data['id']),
             name=data['name'],
             capacity=int(data['capacity']),
-            building_name=data['buildingName'],
-            campus_name=data['campusName'],
-            room_type=data['roomClassificationName']
+            building_name=intern_str(data['buildingName']),
+            campus_name=intern_str(data['campusName']),
+            room_type=intern_str(data['roomClassificationName'])
         )
 
     @staticmethod
@@ -53,7 +57,7 @@ class Room(BaseModel):
         if res.status_code == 401:
             raise MycquUnauthorized
 
-        return [Room.from_dict(room) for room in res.json()]
+        return [Room.from_dict(room) for room in loads(res.content)]
 
     @staticmethod
     def fetch(session: Session, name: str) -> List[Room]:
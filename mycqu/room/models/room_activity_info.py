@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from ...utils.datetimes import parse_period_str, parse_weeks_str
 from ...utils.period import Period
+from ...utils.construct import construct_model
 
 __all__ = ['RoomActivityInfo']
 
@@ -27,7 +28,8 @@ class RoomActivityInfo(BaseModel):
         :return: 教室活动
         :rtype: RoomActivityInfo
         """
-        return RoomActivityInfo(
+        return construct_model(
+            RoomActivityInfo,
             period=parse_period_str(data['periodFormat']),
             weeks=parse_weeks_str(data['teachingWeekFormat']),
             weekday=int(data['weekDay']) - 1
@@ -3,6 +3,8 @@ from typing import Dict, Any
 from pydantic import BaseModel
 
 from .room_activity_info import RoomActivityInfo
+from ...utils.construct import construct_model
+from ...utils.interning import intern_str
 
 
 class RoomCourse(BaseModel):
@@ -33,13 +35,14 @@ class RoomCourse(BaseModel):
         :return: 教室课程
         :rtype: RoomCourse
         """
-        return RoomCourse(
+        return construct_model(
+            RoomCourse,
             activity_info=RoomActivityInfo.from_dict(data),
             class_number=data['classNbr'],
             course_code=data['courseCode'],
-            course_name=data['courseName'],
-            department=data['courseDepartmentName'],
+            course_name=intern_str(data['courseName']),
+            department=intern_str(data['courseDepartmentName']),
             stu_num=int(data['selectedStuNum']),
             credit=float(data['credit']),
-            instructor_name=data['instructorName'],
+            instructor_name=intern_str(data['instructorName']),
         )
\ No newline at end of file
@@ -4,6 +4,7 @@ from pydantic import BaseModel
 
 from .room_activity_info import RoomActivityInfo
 from .room_exam_invigilator import RoomExamInvigilator
+from ...utils.construct import construct_model
 
 __all__ = ['RoomExam']
 
@@ -30,7 +31,8 @@ class RoomExam(BaseModel):
         :return: 教室考试
         :rtype: RoomExam
         """
-        return RoomExam(
+        return construct_model(
+            RoomExam,
             activity_info=RoomActivityInfo.from_dict(data),
             course_name=data['courseName'],
             stu_capacity=int(data['stuCapacity']),
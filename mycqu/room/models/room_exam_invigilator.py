@@ -2,6 +2,8 @@ from typing import Dict, Any
 
 from pydantic import BaseModel
 
+from ...utils.construct import construct_model
+
 __all__ = ['RoomExamInvigilator']
 
 
@@ -23,7 +25,8 @@ class RoomExamInvigilator(BaseModel):
         :return: 教室考试活动监考员对象
         :rtype: RoomExamInvigilator
         """
-        return RoomExamInvigilator(
+        return construct_model(
+            RoomExamInvigilator,
             name=data['name'],
             type=data['invigilatorType'],
             dept_name=data['deptName']
@@ -6,6 +6,7 @@ from pydantic import BaseModel
 
 from .room_activity_info import RoomActivityInfo
 from ...utils.datetimes import date_from_str
+from ...utils.construct import construct_model
 
 __all__ = ['RoomTempActivity']
 
@@ -34,7 +35,8 @@ class RoomTempActivity(BaseModel):
         :return: 教室临时活动
         :rtype: RoomTempActivity
         """
-        return RoomTempActivity(
+        return construct_model(
+            RoomTempActivity,
             activity_info=RoomActivityInfo.from_dict(data),
             content=data['actContent'],
             department=data['actDepartment'],
@@ -1,4 +1,4 @@
-from typing import Union, Optional, List, Dict, Any
+from typing import Union, Optional, List, Dict, Any, AsyncIterator, Iterator
 
 from requests import Session
 from pydantic import BaseModel
@@ -8,8 +8,9 @@ from .room import Room
 from .room_course import RoomCourse
 from .room_exam import RoomExam
 from .room_temp_activity import RoomTempActivity
-from ..tools import get_room_timetable_raw, async_get_room_timetable_raw
+from ..tools import _get_room_timetable_raw, _stream_room_timetable_raw, _async_stream_room_timetable_raw
 from ...utils.request_transformer import Request
+from ...utils.construct import construct_model
 
 __all__ = ['RoomTimetable']
 
@@ -28,7 +29,8 @@ class RoomTimetable(BaseModel):
         :return: 教室活动信息
         :rtype: RoomTimetable
         """
-        return RoomTimetable(
+        return construct_model(
+            RoomTimetable,
             course_timetable=[RoomCourse.from_dict(temp) for temp in data['classTimetableVOList']] \
             if data['classTimetableVOList'] is not None else [],
             exam_timetable=[RoomExam.from_dict(temp) for temp in data['roomExamTimeTableVOList']] \
@@ -54,7 +56,7 @@ class RoomTimetable(BaseModel):
         :rtype: RoomTimetable
         """
 
-        return RoomTimetable.from_dict(get_room_timetable_raw(session, room, cqu_session))
+        return RoomTimetable.from_dict(_get_room_timetable_raw.sync_request(session, room, cqu_session, typed=True))
 
     @staticmethod
     async def async_fetch(session: Request, room: Union[Room, str], cqu_session: Optional[Union[CQUSession, str]] = None):
@@ -72,4 +74,101 @@ class RoomTimetable(BaseModel):
         :return: 教室活动信息对象
         :rtype: RoomTimetable
         """
-        return RoomTimetable.from_dict(await async_get_room_timetable_raw(session, room, cqu_session))
+        return RoomTimetable.from_dict(
+            await _get_room_timetable_raw.async_request(session, room, cqu_session, typed=True))
+
+    @staticmethod
+    def iter_fetch(session: Session, room: Union[Room, str], cqu_session: Optional[Union[CQUSession, str]] = None) \
+            -> Iterator[Union[RoomCourse, RoomExam, RoomTempActivity]]:
+        """
+        获取某教室活动详情，依次逐个解析并返回课程、考试与临时活动
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param room: 教室信息（为Room对象或需要获取的教室名称）
+        :type room: Union[Room, str]
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :raises InvalidName: 若教室名称不为准确教室名称时
+        :return: 教室课程、教室考试与教室临时活动对象的迭代器
+        :rtype: Iterator[Union[RoomCourse, RoomExam, RoomTempActivity]]
+        """
+        yield from _iter_activities(_get_room_timetable_raw.sync_request(session, room, cqu_session, typed=True))
+
+    @staticmethod
+    async def async_iter_fetch(session: Request, room: Union[Room, str],
+                               cqu_session: Optional[Union[CQUSession, str]] = None) \
+            -> AsyncIterator[Union[RoomCourse, RoomExam, RoomTempActivity]]:
+        """
+        异步的获取某教室活动详情，依次逐个解析并返回课程、考试与临时活动
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的异步客户端
+        :type session: Request
+        :param room: 教室信息（为Room对象或需要获取的教室名称）
+        :type room: Union[Room, str]
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :raises InvalidName: 若教室名称不为准确教室名称时
+        :return: 教室课程、教室考试与教室临时活动对象的异步迭代器
+        :rtype: AsyncIterator[Union[RoomCourse, RoomExam, RoomTempActivity]]
+        """
+        for activity in _iter_activities(
+                await _get_room_timetable_raw.async_request(session, room, cqu_session, typed=True)):
+            yield activity
+
+    @staticmethod
+    def stream_fetch(session: Session, room: Union[Room, str], cqu_session: Optional[Union[CQUSession, str]] = None) \
+            -> Iterator[Union[RoomCourse, RoomExam, RoomTempActivity]]:
+        """
+        获取某教室活动详情，边接收边解析响应，按响应中的顺序逐个返回课程、考试与临时活动，适用于活动较多的大教室
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
+        :type session: Session
+        :param room: 教室信息（为Room对象或需要获取的教室名称）
+        :type room: Union[Room, str]
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :raises InvalidName: 若教室名称不为准确教室名称时
+        :return: 教室课程、教室考试与教室临时活动对象的迭代器
+        :rtype: Iterator[Union[RoomCourse, RoomExam, RoomTempActivity]]
+        """
+        for prefix, data in _stream_room_timetable_raw(session, room, cqu_session):
+            yield _ACTIVITY_TYPES[prefix].from_dict(data)
+
+    @staticmethod
+    async def async_stream_fetch(session: Request, room: Union[Room, str],
+                                 cqu_session: Optional[Union[CQUSession, str]] = None) \
+            -> AsyncIterator[Union[RoomCourse, RoomExam, RoomTempActivity]]:
+        """
+        异步的获取某教室活动详情，边接收边解析响应并逐个返回，参见 :meth:`stream_fetch`
+
+        :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的异步客户端
+        :type session: Request
+        :param room: 教室信息（为Room对象或需要获取的教室名称）
+        :type room: Union[Room, str]
+        :param cqu_session: 需要获取课表的学期，留空获取当前年级的课表
+        :type cqu_session: Optional[Union[CQUSession, str]], optional
+        :raises MycquUnauthorized: 若会话未在 my.cqu.edu.cn 进行认证
+        :raises InvalidName: 若教室名称不为准确教室名称时
+        :return: 教室课程、教室考试与教室临时活动对象的异步迭代器
+        :rtype: AsyncIterator[Union[RoomCourse, RoomExam, RoomTempActivity]]
+        """
+        async for prefix, data in _async_stream_room_timetable_raw(session, room, cqu_session):
+            yield _ACTIVITY_TYPES[prefix].from_dict(data)
+
+
+def _iter_activities(data: Dict[str, Any]) -> Iterator[Union[RoomCourse, RoomExam, RoomTempActivity]]:
+    for key, cls in (('classTimetableVOList', RoomCourse), ('roomExamTimeTableVOList', RoomExam),
+                     ('tempActivityTimetableVOList', RoomTempActivity)):
+        for temp in data[key] or []:
+            yield cls.from_dict(temp)
+
+
+_ACTIVITY_TYPES = {
+    'classTimetableVOList.item': RoomCourse,
+    'roomExamTimeTableVOList.item': RoomExam,
+    'tempActivityTimetableVOList.item': RoomTempActivity,
+}
@@ -1,13 +1,17 @@
 """教室相关信息模块"""
 
 from __future__ import annotations
-from typing import Optional, Union
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple, Union
 
 from requests import Session
+from .._lib_wrapper.fastjson import loads
 from ..course import CQUSession, CQUSessionInfo
+from ._schemas import RoomTimetableResponse
 from .models.room import Room
 from ..exception import MycquUnauthorized, InvalidRoom
+from ..utils.payload import decode_payload
 from ..utils.request_transformer import Request, RequestTransformer
+from ..utils.streaming import stream_items, async_stream_items
 
 ROOM_TIMETABLE_URL = "https://my.cqu.edu.cn/api/timetable/class/timetable/room/table-detail?sessionId=1039"
 
@@ -15,8 +19,7 @@ __all__ = ['get_room_timetable_raw', 'async_get_room_timetable_raw']
 
 
 @RequestTransformer.register()
-def _get_room_timetable_raw(session: Session, room: Union[Room, str],
-                            cqu_session: Optional[Union[CQUSession, str]] = None):
+def _resolve_room(session: Session, room: Union[Room, str], cqu_session: Optional[Union[CQUSession, str]] = None):
     if cqu_session is None:
         cqu_session = (yield CQUSessionInfo._fetch).session
     elif isinstance(cqu_session, str):
@@ -30,12 +33,37 @@ def _get_room_timetable_raw(session: Session, room: Union[Room, str],
         else:
             room = temp[0]
     assert isinstance(room, Room)
+    return room
+
 
+@RequestTransformer.register()
+def _get_room_timetable_raw(session: Session, room: Union[Room, str],
+                            cqu_session: Optional[Union[CQUSession, str]] = None, typed: bool = False):
+    room = yield _resolve_room, {'room': room, 'cqu_session': cqu_session}
     res = yield session.post(ROOM_TIMETABLE_URL, json=[str(room.id)])
     if res.status_code == 401:
         raise MycquUnauthorized
 
-    return res.json()
+    return decode_payload(res.content, RoomTimetableResponse) if typed else loads(res.content)
+
+
+_ROOM_TIMETABLE_PREFIXES = ('classTimetableVOList.item', 'roomExamTimeTableVOList.item',
+                            'tempActivityTimetableVOList.item')
+
+
+def _stream_room_timetable_raw(session: Session, room: Union[Room, str],
+                               cqu_session: Optional[Union[CQUSession, str]] = None) -> Iterator[Tuple[str, Dict]]:
+    room = _resolve_room.sync_request(session, room, cqu_session)
+    yield from stream_items(session, 'POST', ROOM_TIMETABLE_URL, _ROOM_TIMETABLE_PREFIXES, json=[str(room.id)])
+
+
+async def _async_stream_room_timetable_raw(session: Request, room: Union[Room, str],
+                                           cqu_session: Optional[Union[CQUSession, str]] = None) \
+        -> AsyncIterator[Tuple[str, Dict]]:
+    room = await _resolve_room.async_request(session, room, cqu_session)
+    async for item in async_stream_items(session, 'POST', ROOM_TIMETABLE_URL, _ROOM_TIMETABLE_PREFIXES,
+                                         json=[str(room.id)]):
+        yield item
 
 def get_room_timetable_raw(session: Session, room: Union[Room, str],
                            cqu_session: Optional[Union[CQUSession, str]] = None):
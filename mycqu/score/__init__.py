@@ -1,3 +1,5 @@
 from .models import *
+from .watcher import ScoreWatcher
+from .calculator import GpaCalculator, GpaSummary
 
-__all__ = ['Score', 'GpaRanking']
+__all__ = ['Score', 'GpaRanking', 'ScoreWatcher', 'GpaCalculator', 'GpaSummary']
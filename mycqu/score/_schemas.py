@@ -0,0 +1,34 @@
+"""
+成绩相关原始响应的结构，字段类型与 ``from_dict`` 的取值方式一致
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from typing_extensions import TypedDict
+
+from ..course._schemas import CourseData
+
+
+class _ScoreRequired(CourseData):
+    sessionName: str
+    effectiveScoreShow: Optional[str]
+    studyNature: str
+    courseNature: str
+
+
+class ScoreData(_ScoreRequired, total=False):
+    """``stuScoreHomePgVoS`` 中的一项"""
+
+
+class ScoreTermData(TypedDict):
+    stuScoreHomePgVoS: List[ScoreData]
+
+
+class _ScoreResponseRequired(TypedDict):
+    status: str
+
+
+class ScoreResponse(_ScoreResponseRequired, total=False):
+    msg: Optional[str]
+    data: Optional[Dict[str, ScoreTermData]]
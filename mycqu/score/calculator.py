@@ -0,0 +1,211 @@
+"""
+根据成绩在本地计算绩点与加权平均分
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .models import Score
+
+__all__ = ['GpaCalculator', 'GpaSummary', 'default_grade_point', 'DEFAULT_GRADE_SCORES']
+
+DEFAULT_GRADE_SCORES: Dict[str, float] = {
+    "优": 95, "优秀": 95, "良": 85, "良好": 85, "中": 75, "中等": 75,
+    "及格": 65, "合格": 85, "不及格": 0, "不合格": 0,
+}
+"""等级制成绩对应的分数"""
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(  # pylint: ignore disable=raise-missing-from
+            "Please install numpy to use GpaCalculator")
+    return numpy
+
+
+def default_grade_point(values: Any) -> Any:
+    """
+    默认的分数到绩点的换算：90 分及以上为 4.0，60 至 89 分为 (分数 - 50) / 10，60 分以下为 0
+
+    :param values: 分数数组
+    :type values: numpy.ndarray
+    :return: 绩点数组
+    :rtype: numpy.ndarray
+    """
+    np = _numpy()
+    return np.where(values >= 90, 4.0, np.where(values >= 60, (values - 50) / 10, 0.0))
+
+
+class GpaSummary(BaseModel):
+    """
+    本地计算得到的绩点与加权平均分
+    """
+    gpa: Optional[float] = None
+    """学分加权的平均绩点，没有计入的课程时为 :obj:`None`"""
+    weighted_avg: Optional[float] = None
+    """学分加权的平均分，没有计入的课程时为 :obj:`None`"""
+    credits: float = 0
+    """计入的总学分"""
+    course_count: int = 0
+    """计入的课程数量"""
+
+
+class GpaCalculator:
+    """
+    基于 numpy 数组运算的绩点计算器
+
+    成绩字符串为数字时直接使用，为等级（优、良等）时按 ``grade_scores`` 换算为分数，其他（如缓考）以及缺少学分的成绩不计入。
+
+    >>> calculator = GpaCalculator(course_natures={"必修"})
+    >>> calculator.summary(Score.fetch(session))
+    >>> calculator.batch({student_id: scores, ...})
+    """
+
+    def __init__(self, grade_scores: Optional[Mapping[str, float]] = None,
+                 grade_point: Callable[[Any], Any] = default_grade_point,
+                 study_natures: Optional[Iterable[str]] = None,
+                 course_natures: Optional[Iterable[str]] = None):
+        """
+        :param grade_scores: 等级制成绩到分数的映射，默认为 :data:`DEFAULT_GRADE_SCORES`
+        :type grade_scores: Optional[Mapping[str, float]]
+        :param grade_point: 将分数数组换算为绩点数组的函数
+        :type grade_point: Callable[[numpy.ndarray], numpy.ndarray], optional
+        :param study_natures: 只计入这些修读性质（初修/重修）的成绩，为 :obj:`None` 时不限制
+        :type study_natures: Optional[Iterable[str]]
+        :param course_natures: 只计入这些课程性质（必修/选修）的成绩，为 :obj:`None` 时不限制
+        :type course_natures: Optional[Iterable[str]]
+        """
+        self.grade_scores: Dict[str, float] = dict(DEFAULT_GRADE_SCORES if grade_scores is None else grade_scores)
+        self.grade_point = grade_point
+        self.study_natures = None if study_natures is None else frozenset(study_natures)
+        self.course_natures = None if course_natures is None else frozenset(course_natures)
+        self._values: Dict[Optional[str], float] = {}
+
+    def _selected(self, score: Score) -> bool:
+        return (self.study_natures is None or score.study_nature in self.study_natures) and \
+            (self.course_natures is None or score.course_nature in self.course_natures)
+
+    def score_value(self, score: Optional[str]) -> float:
+        """
+        将成绩字符串换算为分数，无法换算时为 nan
+
+        :param score: 成绩字符串
+        :type score: Optional[str]
+        :rtype: float
+        """
+        value = self._values.get(score)
+        if value is None:
+            if score is None:
+                value = float('nan')
+            else:
+                text = score.strip()
+                try:
+                    value = float(text)
+                except ValueError:
+                    value = float(self.grade_scores.get(text, float('nan')))
+            self._values[score] = value
+        return value
+
+    def _arrays(self, scores: Iterable[Score]) -> Tuple[Any, Any]:
+        np = _numpy()
+        values: List[float] = []
+        credits: List[float] = []
+        for score in scores:
+            if self._selected(score):
+                values.append(self.score_value(score.score))
+                credits.append(score.course.credit if score.course.credit is not None else float('nan'))
+        return np.asarray(values, dtype=float), np.asarray(credits, dtype=float)
+
+    def _grouped(self, values: Any, credits: Any, groups: Any, size: int) -> List[GpaSummary]:
+        np = _numpy()
+        valid = ~np.isnan(values) & ~np.isnan(credits) & (credits > 0)
+        values, credits, groups = values[valid], credits[valid], groups[valid]
+        total_credits = np.bincount(groups, weights=credits, minlength=size)
+        total_scores = np.bincount(groups, weights=values * credits, minlength=size)
+        total_points = np.bincount(groups, weights=self.grade_point(values) * credits, minlength=size)
+        counts = np.bincount(groups, minlength=size)
+        result = []
+        for credit, score_sum, point_sum, count in zip(total_credits, total_scores, total_points, counts):
+            if credit > 0:
+                result.append(GpaSummary(gpa=float(point_sum / credit), weighted_avg=float(score_sum / credit),
+                                         credits=float(credit), course_count=int(count)))
+            else:
+                result.append(GpaSummary())
+        return result
+
+    def summary(self, scores: Iterable[Score]) -> GpaSummary:
+        """
+        计算一组成绩的绩点与加权平均分
+
+        :param scores: 成绩
+        :type scores: Iterable[Score]
+        :rtype: GpaSummary
+        """
+        np = _numpy()
+        values, credits = self._arrays(scores)
+        return self._grouped(values, credits, np.zeros(len(values), dtype=np.intp), 1)[0]
+
+    def by_session(self, scores: Iterable[Score]) -> Dict[str, GpaSummary]:
+        """
+        按学期分别计算绩点与加权平均分
+
+        :param scores: 成绩
+        :type scores: Iterable[Score]
+        :return: 学期字符串（如 :obj:`"2021秋"`）到该学期结果的映射
+        :rtype: Dict[str, GpaSummary]
+        """
+        grouped: Dict[str, List[Score]] = {}
+        for score in scores:
+            grouped.setdefault(str(score.session), []).append(score)
+        return dict(zip(grouped, self.batch(grouped).values()))
+
+    def what_if(self, scores: Iterable[Score], changes: Optional[Mapping[str, str]] = None,
+                extra: Iterable[Tuple[str, float]] = ()) -> GpaSummary:
+        """
+        模拟修改或新增成绩后的绩点与加权平均分
+
+        :param scores: 现有成绩
+        :type scores: Iterable[Score]
+        :param changes: 课程代码到假设成绩字符串的映射，替换对应课程的成绩
+        :type changes: Optional[Mapping[str, str]]
+        :param extra: 假设新增的 (成绩字符串, 学分)，不受修读性质与课程性质的过滤
+        :type extra: Iterable[Tuple[str, float]]
+        :rtype: GpaSummary
+        """
+        np = _numpy()
+        changes = changes or {}
+        simulated = [score.model_copy(update={'score': changes[score.course.code]})
+                     if score.course.code in changes else score for score in scores]
+        values, credits = self._arrays(simulated)
+        extra = list(extra)
+        if extra:
+            values = np.concatenate([values, [self.score_value(score) for score, _ in extra]])
+            credits = np.concatenate([credits, [float(credit) for _, credit in extra]])
+        return self._grouped(values, credits, np.zeros(len(values), dtype=np.intp), 1)[0]
+
+    def batch(self, students: Mapping[Hashable, Iterable[Score]]) -> Dict[Hashable, GpaSummary]:
+        """
+        在一次数组运算中计算多个学生（或多个分组）的绩点与加权平均分
+
+        :param students: 学生标识到其成绩的映射
+        :type students: Mapping[Hashable, Iterable[Score]]
+        :return: 学生标识到计算结果的映射
+        :rtype: Dict[Hashable, GpaSummary]
+        """
+        np = _numpy()
+        keys = list(students)
+        all_values, all_credits, groups = [], [], []
+        for index, key in enumerate(keys):
+            values, credits = self._arrays(students[key])
+            all_values.append(values)
+            all_credits.append(credits)
+            groups.append(np.full(len(values), index, dtype=np.intp))
+        if not keys:
+            return {}
+        summaries = self._grouped(np.concatenate(all_values), np.concatenate(all_credits),
+                                  np.concatenate(groups), len(keys))
+        return dict(zip(keys, summaries))
@@ -6,6 +6,7 @@ from requests import Session
 from pydantic import BaseModel
 
 from ..tools import get_gpa_ranking_raw, async_get_gpa_ranking_raw
+from ...utils.construct import construct_model
 
 __all__ = ['GpaRanking']
 
@@ -39,7 +40,8 @@ class GpaRanking(BaseModel):
         @return: 返回绩点排名对象
         @rtype: GpaRanking
         """
-        return GpaRanking(
+        return construct_model(
+            GpaRanking,
             gpa=float(data['gpa']),
             major_ranking=data['majorRanking'] and int(data['majorRanking']),
             grade_ranking=data['gradeRanking'] and int(data['gradeRanking']),
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Union, Optional, List
+from typing import Dict, Any, Union, Optional, List, AsyncIterator, Iterator
 
 from requests import Session
 from pydantic import BaseModel
 
-from ..tools import get_score_raw, async_get_score_raw
+from ..tools import _get_score_raw, _score_client, _async_score_client
 from ...course import Course, CQUSession
+from ...utils.construct import construct_model
+from ...utils.request_transformer import Request
+from ...utils.interning import intern_str
 
 __all__ = ['Score']
 
@@ -36,12 +39,13 @@ class Score(BaseModel):
         @return: 返回成绩对象
         @rtype: Score
         """
-        return Score(
+        return construct_model(
+            Score,
             session=CQUSession.from_str(data["sessionName"]),
             course=Course.from_dict(data),
             score=data['effectiveScoreShow'],
-            study_nature=data['studyNature'],
-            course_nature=data['courseNature']
+            study_nature=intern_str(data['studyNature']),
+            course_nature=intern_str(data['courseNature'])
         )
 
     @staticmethod
@@ -57,12 +61,7 @@ class Score(BaseModel):
         :rtype: List[Score]
         :raises CQUWebsiteError: 查询时教务网报错
         """
-        temp = get_score_raw(auth, is_minor_boo)
-        score = []
-        for courses in temp.values():
-            for course in courses['stuScoreHomePgVoS']:
-                score.append(Score.from_dict(course))
-        return score
+        return list(Score.iter_fetch(auth, is_minor_boo))
 
     @staticmethod
     async def async_fetch(auth: Union[str, Session], is_minor_boo: bool = False) -> List[Score]:
@@ -77,9 +76,40 @@ class Score(BaseModel):
         :rtype: List[Score]
         :raises CQUWebsiteError: 查询时教务网报错
         """
-        temp = await async_get_score_raw(auth, is_minor_boo)
-        score = []
+        return [score async for score in Score.async_iter_fetch(auth, is_minor_boo)]
+
+    @staticmethod
+    def iter_fetch(auth: Union[str, Session], is_minor_boo: bool = False) -> Iterator[Score]:
+        """
+        从网站获取成绩信息，逐个解析并返回成绩对象
+
+        :param auth: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的 Session
+        :type auth: Union[Session, str]
+        :param is_minor_boo: 是否获取辅修成绩
+        :type is_minor_boo: bool
+        :return: 成绩对象的迭代器
+        :rtype: Iterator[Score]
+        :raises CQUWebsiteError: 查询时教务网报错
+        """
+        temp = _get_score_raw.sync_request(_score_client(auth), is_minor_boo, typed=True)
+        for courses in temp.values():
+            for course in courses['stuScoreHomePgVoS']:
+                yield Score.from_dict(course)
+
+    @staticmethod
+    async def async_iter_fetch(auth: Union[str, Request], is_minor_boo: bool = False) -> AsyncIterator[Score]:
+        """
+        异步的从网站获取成绩信息，逐个解析并返回成绩对象
+
+        :param auth: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的异步客户端
+        :type auth: Union[Request, str]
+        :param is_minor_boo: 是否获取辅修成绩
+        :type is_minor_boo: bool
+        :return: 成绩对象的异步迭代器
+        :rtype: AsyncIterator[Score]
+        :raises CQUWebsiteError: 查询时教务网报错
+        """
+        temp = await _get_score_raw.async_request(_async_score_client(auth), is_minor_boo, typed=True)
         for courses in temp.values():
             for course in courses['stuScoreHomePgVoS']:
-                score.append(Score.from_dict(course))
-        return score
\ No newline at end of file
+                yield Score.from_dict(course)
\ No newline at end of file
@@ -3,12 +3,13 @@
 """
 from __future__ import annotations
 
-import json
 from typing import Dict, Union, Optional, Generic
 
-import requests
-
+from .._lib_wrapper.fastjson import loads
+from ._schemas import ScoreResponse
 from ..exception import CQUWebsiteError, MycquUnauthorized
+from ..utils.clients import ensure_client, ensure_async_client
+from ..utils.payload import decode_payload
 from ..utils.request_transformer import Request, RequestTransformer
 
 __all__ = ("get_score_raw", "async_get_score_raw", "get_gpa_ranking_raw", "async_get_gpa_ranking_raw")
@@ -21,19 +22,38 @@ def _launch_authorized_header(authorization: str) -> Dict:
         'Authorization': authorization
     }
 
-@RequestTransformer.register()
-def _get_score_raw(request: Request, is_minor_boo: bool, headers: Optional[Dict] = None):
-    url = 'https://my.cqu.edu.cn/api/sam/score/student/score' + ('?isMinorBoo=true' if is_minor_boo else '')
-    res = yield request.get(url, headers=headers)
 
-    content = json.loads(res.content)
+def _score_client(auth: Union[Generic[Request], str]) -> Request:
+    return ensure_client(auth, _launch_authorized_header(auth)) if isinstance(auth, str) else auth
+
+
+def _async_score_client(auth: Union[Generic[Request], str]) -> Request:
+    return ensure_async_client(auth, _launch_authorized_header(auth)) if isinstance(auth, str) else auth
+
+SCORE_URL = 'https://my.cqu.edu.cn/api/sam/score/student/score'
+
+
+@RequestTransformer.register()
+def _get_score_content(request: Request, is_minor_boo: bool, headers: Optional[Dict] = None) -> bytes:
+    res = yield request.get(SCORE_URL + ('?isMinorBoo=true' if is_minor_boo else ''), headers=headers)
     if res.status_code == 401:
         raise MycquUnauthorized()
+    return res.content
+
+
+def _parse_score_content(content: bytes, typed: bool = False) -> Dict:
+    content = decode_payload(content, ScoreResponse) if typed else loads(content)
     if content['status'] == 'error':
         raise CQUWebsiteError(content['msg'])
     return content['data']
 
 
+@RequestTransformer.register()
+def _get_score_raw(request: Request, is_minor_boo: bool, headers: Optional[Dict] = None, typed: bool = False):
+    return _parse_score_content((yield _get_score_content, {'is_minor_boo': is_minor_boo, 'headers': headers}),
+                                typed)
+
+
 def get_score_raw(auth: Union[Generic[Request], str], is_minor_boo: bool = False) -> Dict:
     """
     获取学生原始成绩
@@ -45,31 +65,28 @@ def get_score_raw(auth: Union[Generic[Request], str], is_minor_boo: bool = False
     :return: 反序列化获取的score列表
     :rtype: Dict
     """
-    if not isinstance(auth, str):
-        return _get_score_raw.sync_request(auth, is_minor_boo)
-    else:
-        return _get_score_raw.sync_request(requests, is_minor_boo, _launch_authorized_header(auth))
+    return _get_score_raw.sync_request(_score_client(auth), is_minor_boo)
 
-async def async_get_score_raw(session: Generic[Request], is_minor_boo: bool = False):
+async def async_get_score_raw(session: Union[Generic[Request], str], is_minor_boo: bool = False):
     """
     异步的获取学生原始成绩
 
-    :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-    :type session: Session
+    :param session: 登陆后获取的authorization或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+    :type session: Union[Request, str]
     :param is_minor_boo: 是否获取辅修成绩
     :type is_minor_boo: bool
     :return: 反序列化获取的score列表
     :rtype: Dict
     """
-    return await _get_score_raw.async_request(session, is_minor_boo)
+    return await _get_score_raw.async_request(_async_score_client(session), is_minor_boo)
 
 @RequestTransformer.register()
 def _get_gpa_ranking_raw(request: Request, headers: Optional[Dict] = None):
     res = yield request.get('https://my.cqu.edu.cn/api/sam/score/student/studentGpaRanking', headers=headers)
 
-    content = json.loads(res.content)
     if res.status_code == 401:
         raise MycquUnauthorized()
+    content = loads(res.content)
     if content['status'] == 'error':
         raise CQUWebsiteError(content['msg'])
     return content['data']
@@ -84,19 +101,15 @@ def get_gpa_ranking_raw(auth: Union[Generic[Request], str]):
     :return: 反序列化获取的绩点、排名
     :rtype: Dict
     """
-    if not isinstance(auth, str):
-        return _get_gpa_ranking_raw.sync_request(auth)
-    else:
-        headers = _launch_authorized_header(auth)
-        return _get_gpa_ranking_raw.sync_request(headers)
+    return _get_gpa_ranking_raw.sync_request(_score_client(auth))
 
-async def async_get_gpa_ranking_raw(session: Generic[Request]):
+async def async_get_gpa_ranking_raw(session: Union[Generic[Request], str]):
     """
     异步的获取学生绩点排名
 
-    :param session: 登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的 requests 会话
-    :type session: Union[Session, str]
+    :param session: 登陆后获取的authorization或者登录了统一身份认证（:func:`.auth.login`）并在 mycqu 进行了认证（:func:`.mycqu.access_mycqu`）的会话
+    :type session: Union[Request, str]
     :return: 反序列化获取的绩点、排名
     :rtype: Dict
     """
-    return await _get_gpa_ranking_raw.async_request(session)
+    return await _get_gpa_ranking_raw.async_request(_async_score_client(session))
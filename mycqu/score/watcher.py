@@ -0,0 +1,182 @@
+"""
+增量检测成绩变化的轮询器
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .models import Score
+from .tools import _get_score_content, _parse_score_content, _score_client, _async_score_client
+from ..utils.fingerprint import digest, fingerprint
+from ..utils.request_transformer import Request
+
+__all__ = ['ScoreWatcher']
+
+_RowKey = Tuple[Optional[str], Optional[str]]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _UserState:
+    __slots__ = ('digest', 'rows')
+
+    def __init__(self):
+        self.digest: Optional[str] = None
+        self.rows: Dict[_RowKey, str] = {}
+
+
+class ScoreWatcher:
+    """
+    检测多个用户成绩变化的轮询器
+
+    对每个用户记录原始成绩数据的摘要以及每门课程（按课程代码与学期区分）的指纹：
+    原始数据未变化时不做任何解析；变化时只为新增或指纹变化的课程构造 :class:`Score` 对象。
+
+    >>> watcher = ScoreWatcher(interval=60)
+    >>> async for user, scores in watcher.watch({"20200001": token1, "20200002": token2}):
+    ...     notify(user, scores)
+    """
+
+    def __init__(self, interval: float = 60, jitter: float = 0.2, concurrency: int = 32,
+                 is_minor_boo: bool = False, emit_initial: bool = False):
+        """
+        :param interval: 每个用户的轮询间隔（秒）
+        :type interval: float, optional
+        :param jitter: 轮询间隔随机浮动的比例，避免所有用户同时请求
+        :type jitter: float, optional
+        :param concurrency: :meth:`watch` 中同时进行的请求数量
+        :type concurrency: int, optional
+        :param is_minor_boo: 是否获取辅修成绩
+        :type is_minor_boo: bool, optional
+        :param emit_initial: 第一次获取某用户的成绩时是否将全部成绩作为新成绩返回，
+                             为 :obj:`False` 时第一次获取只作为比较的基准
+        :type emit_initial: bool, optional
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.is_minor_boo = is_minor_boo
+        self.emit_initial = emit_initial
+        self._states: Dict[Hashable, _UserState] = {}
+        self._lock = threading.Lock()
+
+    def forget(self, user: Hashable) -> None:
+        """
+        丢弃某用户的记录，下次获取时重新作为基准
+
+        :param user: 用户标识
+        :type user: Hashable
+        """
+        with self._lock:
+            self._states.pop(user, None)
+
+    def _update(self, user: Hashable, content: bytes) -> List[Score]:
+        content_digest = digest(content)
+        with self._lock:
+            state = self._states.get(user)
+            initial = state is None
+            if state is None:
+                state = self._states[user] = _UserState()
+            if state.digest == content_digest:
+                return []
+        new_scores: List[Score] = []
+        rows: Dict[_RowKey, str] = {}
+        for courses in _parse_score_content(content, typed=True).values():
+            for row in courses['stuScoreHomePgVoS']:
+                key = (row.get('courseCode'), row.get('sessionName'))
+                row_fingerprint = fingerprint((json.dumps(row, sort_keys=True, ensure_ascii=False),))
+                rows[key] = row_fingerprint
+                if state.rows.get(key) != row_fingerprint and (self.emit_initial or not initial):
+                    new_scores.append(Score.from_dict(row))
+        with self._lock:
+            state.digest = content_digest
+            state.rows = rows
+        return new_scores
+
+    def check(self, user: Hashable, auth: Union[Request, str]) -> List[Score]:
+        """
+        获取一次某用户的成绩，返回新增或变化的成绩
+
+        :param user: 用户标识
+        :type user: Hashable
+        :param auth: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的会话
+        :type auth: Union[Session, str]
+        :return: 新增或变化的成绩
+        :rtype: List[Score]
+        """
+        return self._update(user, _get_score_content.sync_request(_score_client(auth), self.is_minor_boo))
+
+    async def async_check(self, user: Hashable, auth: Union[Request, str]) -> List[Score]:
+        """
+        异步的获取一次某用户的成绩，返回新增或变化的成绩
+
+        :param user: 用户标识
+        :type user: Hashable
+        :param auth: 登陆后获取的 authorization 或者调用过 :func:`.mycqu.access_mycqu` 的异步客户端
+        :type auth: Union[Request, str]
+        :return: 新增或变化的成绩
+        :rtype: List[Score]
+        """
+        return self._update(user, await _get_score_content.async_request(_async_score_client(auth),
+                                                                          self.is_minor_boo))
+
+    def _next_delay(self) -> float:
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def watch(self, users: Union[Dict[Hashable, Union[Request, str]], Iterable[Tuple[Hashable, Union[Request, str]]]],
+                    on_error: Optional[Callable[[Hashable, Exception], Any]] = None
+                    ) -> AsyncIterator[Tuple[Hashable, List[Score]]]:
+        """
+        持续轮询多个用户的成绩，有新增或变化的成绩时返回
+
+        各用户的第一次轮询随机分布在一个轮询间隔内，之后每次间隔随机浮动 ``jitter`` 的比例。
+        某用户轮询出错（如 token 过期、网络错误）时只跳过该用户的本轮轮询，不影响其他用户。
+
+        :param users: 用户标识到 authorization 或异步客户端的映射
+        :type users: Union[Dict[Hashable, Union[Request, str]], Iterable[Tuple[Hashable, Union[Request, str]]]]
+        :param on_error: 某用户轮询出错时的回调，为 :obj:`None` 时记录日志；回调抛出的异常会中止轮询并抛出
+        :type on_error: Optional[Callable[[Hashable, Exception], Any]]
+        :return: (用户标识, 新增或变化的成绩) 的异步迭代器
+        :rtype: AsyncIterator[Tuple[Hashable, List[Score]]]
+        """
+        items = list(users.items() if isinstance(users, dict) else users)
+        if not items:
+            return
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def poll(user: Hashable, auth: Union[Request, str]) -> None:
+            await asyncio.sleep(random.uniform(0, self.interval))
+            while True:
+                try:
+                    async with semaphore:
+                        new_scores = await self.async_check(user, auth)
+                except Exception as e:  # pylint: disable=broad-except
+                    if on_error is None:
+                        _LOGGER.warning("failed to poll scores of %r", user, exc_info=e)
+                    else:
+                        try:
+                            on_error(user, e)
+                        except Exception as raised:  # pylint: disable=broad-except
+                            await queue.put(raised)
+                            return
+                else:
+                    if new_scores:
+                        await queue.put((user, new_scores))
+                await asyncio.sleep(self._next_delay())
+
+        tasks = [asyncio.ensure_future(poll(user, auth)) for user, auth in items]
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
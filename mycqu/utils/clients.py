@@ -0,0 +1,388 @@
+"""
+多用户共享连接池的会话
+
+每个用户的会话仍各自保存 cookie 与请求头（如 mycqu 的 ``Authorization``），
+但所有会话的请求都经由同一个保持连接的连接池发出，避免每个用户各自建立连接与 TLS 握手。
+异步请求的连接只能在创建它的事件循环中使用，因此异步连接池按事件循环分别创建。
+"""
+import asyncio
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, List, Optional, Union
+from weakref import WeakKeyDictionary
+
+from requests import Session, PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from .config import ConfigManager
+from .request_transformer import Request
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+__all__ = ['SharedConnectionPool', 'default_pool', 'anonymous_session', 'anonymous_async_client',
+           'TokenClient', 'AsyncTokenClient', 'ensure_client', 'ensure_async_client']
+
+
+class _SharedAdapter(BaseAdapter):
+    """
+    将请求转交给共享的 :class:`HTTPAdapter`，关闭会话时不关闭共享的连接池
+    """
+
+    def __init__(self, adapter: HTTPAdapter):
+        super().__init__()
+        self._adapter = adapter
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        return self._adapter.send(request, **kwargs)
+
+    def close(self) -> None:
+        pass
+
+
+if httpx is not None:
+    class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+        """
+        将请求转交给连接池在当前事件循环中共享的 :class:`httpx.AsyncHTTPTransport`，关闭客户端时不关闭共享的连接池
+        """
+
+        def __init__(self, pool: 'SharedConnectionPool'):
+            self._pool = pool
+
+        async def handle_async_request(self, request: 'httpx.Request') -> 'httpx.Response':
+            return await self._pool.transport.handle_async_request(request)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args) -> None:
+            pass
+
+        async def aclose(self) -> None:
+            pass
+
+
+class SharedConnectionPool:
+    """
+    供多个用户会话共享的连接池
+
+    由 :meth:`session` 与 :meth:`async_client` 创建的会话可以在任何接受 ``Request`` 的地方使用：
+
+    >>> pool = SharedConnectionPool()
+    >>> session = pool.session()
+    >>> login(session, username, password)
+    >>> access_mycqu(session)
+    >>> session.close()  # 只丢弃该用户的 cookie 与请求头，不会关闭共享的连接
+
+    异步客户端不绑定事件循环，可以在多次 :func:`asyncio.run` 之间复用，每个事件循环使用各自的连接。
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 100, keepalive_expiry: float = 30.0,
+                 max_retries: int = 0):
+        """
+        :param pool_connections: 同步请求时保留连接池的主机数量
+        :type pool_connections: int, optional
+        :param pool_maxsize: 每个主机保持的最大连接数，异步请求时为总的最大连接数
+        :type pool_maxsize: int, optional
+        :param keepalive_expiry: 异步请求时空闲连接的保持时长（秒）
+        :type keepalive_expiry: float, optional
+        :param max_retries: 同步请求时连接失败的重试次数
+        :type max_retries: int, optional
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_expiry = keepalive_expiry
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self._adapter: Optional[HTTPAdapter] = None
+        self._transports: 'WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]' = \
+            WeakKeyDictionary()
+        self._stateless_session: Optional[Session] = None
+        self._stateless_async_client: Optional['httpx.AsyncClient'] = None
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """
+        同步请求共享的 :class:`HTTPAdapter`，首次使用时创建
+        """
+        if self._adapter is None:
+            with self._lock:
+                if self._adapter is None:
+                    self._adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                                pool_maxsize=self.pool_maxsize,
+                                                max_retries=self.max_retries)
+        return self._adapter
+
+    @property
+    def transport(self) -> 'httpx.AsyncHTTPTransport':
+        """
+        当前事件循环中异步请求共享的 :class:`httpx.AsyncHTTPTransport`，在该事件循环中首次使用时创建
+
+        :raises RuntimeError: 不在事件循环中调用时抛出
+        """
+        if httpx is None:
+            raise ImportError("Please install httpx to use async clients")
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            with self._lock:
+                transport = self._transports.get(loop)
+                if transport is None:
+                    # 已关闭的事件循环中的连接无法再使用；其连接引用着事件循环，不会被弱引用自动清除
+                    for closed in [closed for closed in self._transports if closed.is_closed()]:
+                        del self._transports[closed]
+                    transport = self._transports[loop] = httpx.AsyncHTTPTransport(limits=httpx.Limits(
+                        max_connections=self.pool_maxsize,
+                        max_keepalive_connections=self.pool_maxsize,
+                        keepalive_expiry=self.keepalive_expiry
+                    ))
+        return transport
+
+    def transports(self) -> 'List[httpx.AsyncHTTPTransport]':
+        """
+        各事件循环中已创建的 :class:`httpx.AsyncHTTPTransport`
+
+        :rtype: List[httpx.AsyncHTTPTransport]
+        """
+        with self._lock:
+            return list(self._transports.values())
+
+    def session(self) -> Session:
+        """
+        创建一个使用共享连接池的同步会话，其 cookie 与请求头独立于其他会话
+
+        :return: 新的会话
+        :rtype: Session
+        """
+        session = Session()
+        adapter = _SharedAdapter(self.adapter)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def async_client(self, **kwargs) -> 'httpx.AsyncClient':
+        """
+        创建一个使用共享连接池的异步客户端，其 cookie 与请求头独立于其他客户端
+
+        :param kwargs: 传给 :class:`httpx.AsyncClient` 的其他参数
+        :return: 新的异步客户端
+        :rtype: httpx.AsyncClient
+        """
+        if httpx is None:
+            raise ImportError("Please install httpx to use async clients")
+        return httpx.AsyncClient(transport=_SharedAsyncTransport(self), **kwargs)
+
+    def stateless_session(self) -> Session:
+        """
+        获取使用共享连接池、不保存任何 cookie 的同步会话，供多个用户同时使用，首次使用时创建
+
+        :return: 共享的会话
+        :rtype: Session
+        """
+        if self._stateless_session is None:
+            session = self.session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            with self._lock:
+                if self._stateless_session is None:
+                    self._stateless_session = session
+        return self._stateless_session
+
+    def stateless_async_client(self) -> 'httpx.AsyncClient':
+        """
+        获取使用共享连接池、不保存任何 cookie 的异步客户端，供多个用户同时使用，首次使用时创建
+
+        :return: 共享的异步客户端
+        :rtype: httpx.AsyncClient
+        """
+        if self._stateless_async_client is None:
+            client = self.async_client(cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[])))
+            with self._lock:
+                if self._stateless_async_client is None:
+                    self._stateless_async_client = client
+        return self._stateless_async_client
+
+    def close(self) -> None:
+        """
+        关闭同步请求的共享连接
+        """
+        with self._lock:
+            self._stateless_session = None
+            if self._adapter is not None:
+                self._adapter.close()
+                self._adapter = None
+
+    async def aclose(self) -> None:
+        """
+        关闭当前事件循环中异步请求的共享连接
+        """
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+_DEFAULT_POOL: Optional[SharedConnectionPool] = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def default_pool() -> SharedConnectionPool:
+    """
+    获取模块共享的默认连接池，首次使用时按配置项`pool`创建
+
+    :return: 默认连接池
+    :rtype: SharedConnectionPool
+    """
+    global _DEFAULT_POOL
+    if _DEFAULT_POOL is None:
+        with _DEFAULT_POOL_LOCK:
+            if _DEFAULT_POOL is None:
+                _DEFAULT_POOL = SharedConnectionPool(**ConfigManager().config['pool'])
+    return _DEFAULT_POOL
+
+
+def anonymous_session() -> Session:
+    """
+    获取默认连接池中不保存 cookie 的同步会话，用于无需登录的接口
+
+    :rtype: Session
+    """
+    return default_pool().stateless_session()
+
+
+def anonymous_async_client() -> 'httpx.AsyncClient':
+    """
+    获取默认连接池中不保存 cookie 的异步客户端，用于无需登录的接口
+
+    :rtype: httpx.AsyncClient
+    """
+    return default_pool().stateless_async_client()
+
+
+class TokenClient:
+    """
+    只持有 mycqu 的 authorization 的同步客户端
+
+    每次请求时附加 ``Authorization`` 请求头，经由连接池中不保存 cookie 的共享会话发出，
+    可以在任何接受 ``Request`` 的地方代替调用过 :func:`.mycqu.access_mycqu` 的会话使用
+    """
+
+    def __init__(self, authorization: str, headers: Optional[Dict[str, str]] = None,
+                 pool: Optional[SharedConnectionPool] = None):
+        """
+        :param authorization: 登陆后获取的 authorization
+        :type authorization: str
+        :param headers: 每次请求附加的其他请求头
+        :type headers: Optional[Dict[str, str]]
+        :param pool: 使用的连接池，为 :obj:`None` 时使用 :func:`default_pool`
+        :type pool: Optional[SharedConnectionPool]
+        """
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.headers['Authorization'] = authorization
+        self._pool = pool if pool is not None else default_pool()
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Response:
+        return self._pool.stateless_session().request(method, url, headers={**self.headers, **(headers or {})},
+                                                      **kwargs)
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        return self.request('DELETE', url, **kwargs)
+
+    def options(self, url: str, **kwargs) -> Response:
+        return self.request('OPTIONS', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> Response:
+        return self.request('HEAD', url, **kwargs)
+
+
+class AsyncTokenClient:
+    """
+    只持有 mycqu 的 authorization 的异步客户端，参见 :class:`TokenClient`
+
+    请求经由连接池在当前事件循环中的连接发出，同一对象可以在不同的事件循环中使用
+    """
+
+    def __init__(self, authorization: str, headers: Optional[Dict[str, str]] = None,
+                 pool: Optional[SharedConnectionPool] = None):
+        """
+        :param authorization: 登陆后获取的 authorization
+        :type authorization: str
+        :param headers: 每次请求附加的其他请求头
+        :type headers: Optional[Dict[str, str]]
+        :param pool: 使用的连接池，为 :obj:`None` 时使用 :func:`default_pool`
+        :type pool: Optional[SharedConnectionPool]
+        """
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.headers['Authorization'] = authorization
+        self._pool = pool if pool is not None else default_pool()
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                      **kwargs) -> 'httpx.Response':
+        return await self._pool.stateless_async_client().request(method, url,
+                                                                 headers={**self.headers, **(headers or {})},
+                                                                 **kwargs)
+
+    async def get(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('PUT', url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('PATCH', url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('DELETE', url, **kwargs)
+
+    async def options(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('OPTIONS', url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('HEAD', url, **kwargs)
+
+    def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        """以流的方式发出请求，返回 :meth:`httpx.AsyncClient.stream` 的异步上下文管理器"""
+        return self._pool.stateless_async_client().stream(method, url, headers={**self.headers, **(headers or {})},
+                                                          **kwargs)
+
+
+def ensure_client(auth: Union[Request, str], headers: Optional[Dict[str, str]] = None) -> Request:
+    """
+    将 authorization 字符串转换为 :class:`TokenClient`，会话则原样返回
+
+    :param auth: 登陆后获取的 authorization 或者会话
+    :type auth: Union[Request, str]
+    :param headers: 转换时每次请求附加的其他请求头
+    :type headers: Optional[Dict[str, str]]
+    :rtype: Request
+    """
+    return TokenClient(auth, headers) if isinstance(auth, str) else auth
+
+
+def ensure_async_client(auth: Union[Request, str], headers: Optional[Dict[str, str]] = None) -> Request:
+    """
+    将 authorization 字符串转换为 :class:`AsyncTokenClient`，异步客户端则原样返回
+
+    :param auth: 登陆后获取的 authorization 或者异步客户端
+    :type auth: Union[Request, str]
+    :param headers: 转换时每次请求附加的其他请求头
+    :type headers: Optional[Dict[str, str]]
+    :rtype: Request
+    """
+    return AsyncTokenClient(auth, headers) if isinstance(auth, str) else auth
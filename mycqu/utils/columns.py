@@ -0,0 +1,197 @@
+"""
+模型列表与 numpy 列式数据之间的转换
+"""
+from __future__ import annotations
+
+import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+from typing_extensions import get_args, get_origin
+
+from .construct import construct_model
+from .datetimes import TIMEZONE
+
+__all__ = ['Categorical', 'to_columns', 'from_columns']
+
+_Path = Tuple[str, ...]
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(  # pylint: ignore disable=raise-missing-from
+            "Please install numpy to use to_columns and from_columns")
+    return numpy
+
+
+class Categorical(NamedTuple):
+    """字典编码的字符串列"""
+    codes: Any
+    """int32 编码数组，:obj:`None` 编码为 -1"""
+    categories: Any
+    """编码对应的字符串"""
+
+    def decode(self) -> List[Optional[str]]:
+        """
+        解码为字符串列表
+
+        :rtype: List[Optional[str]]
+        """
+        categories = self.categories.tolist()
+        return [categories[code] if code >= 0 else None for code in self.codes.tolist()]
+
+
+class _Leaf(NamedTuple):
+    path: _Path
+    kind: str
+    optional: bool
+
+
+def _unwrap(annotation: Any) -> Tuple[Any, bool]:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _leaves(model: Type[BaseModel], prefix: _Path = ()) -> List[_Leaf]:
+    leaves = []
+    for name, field in model.model_fields.items():
+        path = prefix + (name,)
+        annotation, optional = _unwrap(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if optional:
+                leaves.append(_Leaf(path, 'present', False))
+            leaves.extend(_leaves(annotation, path))
+            continue
+        if annotation is bool:
+            kind = 'bool'
+        elif annotation is int:
+            kind = 'int'
+        elif annotation is float:
+            kind = 'float'
+        elif annotation is str:
+            kind = 'str'
+        elif annotation is datetime.datetime:
+            kind = 'datetime'
+        elif annotation is datetime.date:
+            kind = 'date'
+        else:
+            kind = 'object'
+        leaves.append(_Leaf(path, kind, optional))
+    return leaves
+
+
+def _get(item: Any, path: _Path) -> Any:
+    for name in path:
+        if item is None:
+            return None
+        item = getattr(item, name)
+    return item
+
+
+def _encode(np, leaf: _Leaf, values: List[Any]) -> Any:
+    if leaf.kind == 'present':
+        return np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+    if leaf.kind == 'str':
+        index: Dict[str, int] = {}
+        codes = np.fromiter((index.setdefault(value, len(index)) if value is not None else -1 for value in values),
+                            dtype=np.int32, count=len(values))
+        categories = np.empty(len(index), dtype=object)
+        categories[:] = list(index)
+        return Categorical(codes, categories)
+    if leaf.kind == 'float' or (leaf.kind == 'int' and any(value is None for value in values)):
+        return np.fromiter((float('nan') if value is None else value for value in values),
+                           dtype=np.float64, count=len(values))
+    if leaf.kind == 'int':
+        return np.fromiter(values, dtype=np.int64, count=len(values))
+    if leaf.kind == 'bool' and not any(value is None for value in values):
+        return np.fromiter(values, dtype=bool, count=len(values))
+    if leaf.kind == 'datetime':
+        return np.array([None if value is None else value.astimezone(TIMEZONE).replace(tzinfo=None)
+                         for value in values], dtype='datetime64[us]')
+    if leaf.kind == 'date':
+        return np.array(values, dtype='datetime64[D]')
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _decode(leaf: _Leaf, column: Any) -> List[Any]:
+    if isinstance(column, Categorical):
+        return column.decode()
+    if leaf.kind == 'int':
+        if column.dtype.kind == 'f':
+            return [None if value != value else int(value) for value in column.tolist()]
+        return column.tolist()
+    if leaf.kind == 'float' and leaf.optional:
+        return [None if value != value else value for value in column.tolist()]
+    if leaf.kind == 'datetime':
+        return [None if value is None else value.replace(tzinfo=TIMEZONE)
+                for value in column.astype('datetime64[us]').astype(object)]
+    if leaf.kind == 'date':
+        return column.astype('datetime64[D]').astype(object).tolist()
+    return column.tolist()
+
+
+def to_columns(items: Sequence[Any], model: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
+    """
+    将一组模型对象（或记录）转换为列式数据
+
+    嵌套模型的字段以 ``.`` 连接为列名（如 ``course.code``），可为 :obj:`None` 的嵌套模型另有同名布尔列标记其是否存在；
+    浮点数为 float64 数组（:obj:`None` 为 nan），整数为 int64 数组（含 :obj:`None` 时为 float64），
+    时间为 datetime64[us] 数组（北京时间），日期为 datetime64[D] 数组，字符串为 :class:`Categorical`，其他值为 object 数组。
+
+    >>> columns = to_columns(Bill.fetch(session))
+    >>> numpy.bincount(columns["place"].codes, weights=columns["tran_amount"])
+
+    :param items: 模型对象或记录
+    :type items: Sequence[Any]
+    :param model: 模型类，留空时由第一项推断
+    :type model: Optional[Type[BaseModel]]
+    :return: 列名到数组的映射
+    :rtype: Dict[str, Any]
+    """
+    np = _numpy()
+    if model is None:
+        if not items:
+            raise ValueError("model is required when items is empty")
+        model = getattr(type(items[0]), '_model', type(items[0]))
+    items = list(items)
+    return {'.'.join(leaf.path): _encode(np, leaf, [_get(item, leaf.path) for item in items])
+            for leaf in _leaves(model)}
+
+
+def _build(model: Type[BaseModel], values: Dict[_Path, List[Any]], index: int, prefix: _Path = ()) -> Any:
+    fields = {}
+    for name, field in model.model_fields.items():
+        path = prefix + (name,)
+        annotation, optional = _unwrap(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if optional and not values[path][index]:
+                fields[name] = None
+            else:
+                fields[name] = _build(annotation, values, index, path)
+        else:
+            fields[name] = values[path][index]
+    return construct_model(model, **fields)
+
+
+def from_columns(columns: Dict[str, Any], model: Type[BaseModel]) -> List[Any]:
+    """
+    将 :func:`to_columns` 得到的列式数据转换回模型对象
+
+    :param columns: 列名到数组的映射
+    :type columns: Dict[str, Any]
+    :param model: 模型类
+    :type model: Type[BaseModel]
+    :return: 模型对象（记录模式下为记录）的列表
+    :rtype: List[Any]
+    """
+    _numpy()
+    values = {leaf.path: _decode(leaf, columns['.'.join(leaf.path)]) for leaf in _leaves(model)}
+    size = len(next(iter(values.values()))) if values else 0
+    return [_build(model, values, index) for index in range(size)]
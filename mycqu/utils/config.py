@@ -8,7 +8,26 @@ __all__ = ['ConfigManager']
 PYMYCQU_CONFIG = {
     'request': {
         'sync_request_params_mapper': RequestsParamsMapper,
-        'async_request_params_mapper': HttpxParamsMapper
+        'async_request_params_mapper': HttpxParamsMapper,
+        # 满足`UnauthorizedRecovery`协议的对象，为 None 时不尝试恢复返回 401 的请求
+        'unauthorized_recovery': None
+    },
+    'pool': {
+        # 默认共享连接池的参数，用于匿名请求与只持有 authorization 的请求，需在首次请求前修改
+        'pool_connections': 10,
+        'pool_maxsize': 100,
+        'keepalive_expiry': 30.0,
+        'max_retries': 0
+    },
+    'auth': {
+        # 从响应中观察到的统一身份认证登陆状态的有效时长（秒），为 0 时不缓存，每次判断登陆状态均发出请求
+        'login_state_ttl': 0
+    },
+    'model': {
+        # 为 True 时 `from_dict` 不校验字段直接构造模型，只应在数据结构已确认无误时开启
+        'trusted_construction': False,
+        # 为 True 时 `from_dict` 对相同的学期与课程返回同一对象，并驻留重复出现的字符串
+        'interning': False
     }
 }
 
@@ -0,0 +1,131 @@
+"""
+可跳过校验的模型构造
+"""
+from __future__ import annotations
+
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .config import ConfigManager
+from .records import is_record, is_record_mode, record_type
+
+__all__ = ['construct_model', 'construct_container', 'trusted_construction', 'is_trusted_construction']
+
+_Model = TypeVar('_Model', bound=BaseModel)
+_Spec = Tuple[bool, Dict[str, Any], Tuple[Tuple[str, Callable[[], Any]], ...]]
+
+_TRUSTED: ContextVar[Optional[bool]] = ContextVar('mycqu_trusted_construction', default=None)
+_SPECS: Dict[type, _Spec] = {}
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+_setattr = object.__setattr__
+
+
+def _spec(cls: Type[BaseModel]) -> _Spec:
+    # 需要初始化私有属性或执行 model_post_init 的模型总是校验构造
+    direct = not cls.__private_attributes__ and cls.__pydantic_post_init__ is None
+    shared, factories = {}, []
+    for name, field in cls.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif not field.is_required():
+            if isinstance(field.default, _IMMUTABLE):
+                shared[name] = field.default
+            else:
+                factories.append((name, partial(copy.deepcopy, field.default)))
+    return direct, shared, tuple(factories)
+
+
+def is_trusted_construction() -> bool:
+    """
+    当前是否处于免校验构造模式，未通过 :func:`trusted_construction` 设置时使用配置 ``model.trusted_construction``
+
+    :rtype: bool
+    """
+    trusted = _TRUSTED.get()
+    if trusted is None:
+        return ConfigManager().config['model']['trusted_construction']
+    return trusted
+
+
+@contextmanager
+def trusted_construction(enabled: bool = True) -> Iterator[None]:
+    """
+    在上下文（当前线程或协程）内开启或关闭免校验构造模式
+
+    >>> with trusted_construction():
+    ...     rooms = [Room.from_dict(room) for room in payload]
+    >>> with trusted_construction(False):  # 调试时强制校验
+    ...     rooms = [Room.from_dict(room) for room in payload]
+
+    :param enabled: 为 :obj:`True` 时开启，为 :obj:`False` 时强制校验
+    :type enabled: bool, optional
+    """
+    token = _TRUSTED.set(enabled)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+def construct_model(cls: Type[_Model], **fields: Any) -> _Model:
+    """
+    构造模型对象，供各模型的 ``from_dict`` 使用
+
+    默认与 ``cls(**fields)`` 相同；处于免校验构造模式时直接写入字段并补全默认值，不做类型校验与转换，
+    只应用于结构已确认无误的数据；处于记录模式（:func:`.records.record_mode`）时返回对应的记录。
+
+    :param cls: 模型类
+    :type cls: Type[BaseModel]
+    :param fields: 字段值
+    :return: 模型对象或记录
+    """
+    record = is_record_mode()
+    if not record and not is_trusted_construction():
+        return cls(**fields)
+    try:
+        direct, shared, factories = _SPECS[cls]
+    except KeyError:
+        direct, shared, factories = _SPECS[cls] = _spec(cls)
+    if not record and not direct:
+        return cls(**fields)
+    values = {**shared, **fields}
+    for name, factory in factories:
+        if name not in fields:
+            values[name] = factory()
+    if record:
+        return record_type(cls)(**values)
+    model = cls.__new__(cls)
+    _setattr(model, '__dict__', values)
+    _setattr(model, '__pydantic_fields_set__', set(fields))
+    _setattr(model, '__pydantic_extra__', None)
+    _setattr(model, '__pydantic_private__', None)
+    return model
+
+
+def _holds_record(value: Any) -> bool:
+    if is_record(value):
+        return True
+    return isinstance(value, (list, tuple)) and any(_holds_record(item) for item in value)
+
+
+def construct_container(cls: Type[_Model], **fields: Any) -> _Model:
+    """
+    构造持有其他模型的结果对象（如 :class:`.enroll.EnrollEvent`、:class:`.exam.ExamChanges`、
+    :class:`.enroll.EnrollConflict`）
+
+    字段中含有记录（记录模式下 ``from_dict`` 的结果）时不做校验直接构造，使结果对象可以持有记录，
+    结果对象本身仍为模型；处于免校验构造模式时同样不做校验，其余情况与 ``cls(**fields)`` 相同。
+
+    :param cls: 模型类
+    :type cls: Type[BaseModel]
+    :param fields: 字段值
+    :return: 模型对象
+    """
+    if is_trusted_construction() or any(_holds_record(value) for value in fields.values()):
+        return cls.model_construct(**fields)
+    return cls(**fields)
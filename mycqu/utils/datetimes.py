@@ -3,6 +3,7 @@ from datetime import date, time, datetime
 import pytz
 
 from ..utils.period import Period
+from .construct import construct_model
 
 TIMEZONE = datetime.now(pytz.timezone("Asia/Shanghai")).tzinfo
 SHORT_WEEKDAY: Dict[str, int] = {
@@ -33,7 +34,7 @@ def time_from_str(string: str) -> time:
 def parse_period_str(string: str) -> Period:
     period = tuple(map(int, string.split("-")))
     assert len(period) == 1 or len(period) == 2
-    return Period(start=period[0], end=(period[1] if len(period) == 2 else period[0]))
+    return construct_model(Period, start=period[0], end=(period[1] if len(period) == 2 else period[0]))
 
 
 def parse_weeks_str(string: str) -> List[Period]:
@@ -0,0 +1,29 @@
+"""
+用于判断数据是否变化的摘要
+"""
+from hashlib import blake2b
+from typing import Any, Iterable
+
+__all__ = ['digest', 'fingerprint']
+
+
+def digest(data: bytes) -> str:
+    """
+    计算原始响应内容的摘要
+
+    :param data: 原始内容
+    :type data: bytes
+    :rtype: str
+    """
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def fingerprint(values: Iterable[Any]) -> str:
+    """
+    计算若干字段值的摘要，字段值以其 :func:`repr` 参与计算
+
+    :param values: 字段值
+    :type values: Iterable[Any]
+    :rtype: str
+    """
+    return digest('\x1f'.join(map(repr, values)).encode())
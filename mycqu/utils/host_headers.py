@@ -0,0 +1,152 @@
+"""
+只附加到特定主机的请求头
+
+mycqu 与 library 都使用 ``Authorization`` 请求头保存各自的 token，写入会话的公共请求头会互相覆盖；
+此模块将这类请求头按主机保存在会话上，仅在请求对应主机时附加。
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Mapping
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
+from requests import Session, PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+__all__ = ['set_host_headers', 'remove_host_headers', 'get_host_headers', 'suspend_host_headers']
+
+_HostHeaders = Dict[str, Dict[str, str]]
+"""主机名到该主机请求头的映射"""
+
+_CLIENT_HEADERS: 'WeakKeyDictionary[Any, _HostHeaders]' = WeakKeyDictionary()
+
+_SUSPENDED: 'ContextVar[FrozenSet[str]]' = ContextVar('_SUSPENDED', default=frozenset())
+"""当前上下文中暂不附加请求头的主机"""
+
+
+def _apply(host_headers: _HostHeaders, host: str, headers: Any) -> None:
+    if host in _SUSPENDED.get():
+        return
+    # 请求中已有的同名请求头为调用方显式传入的，不覆盖
+    for key, value in host_headers.get(host, {}).items():
+        if key not in headers:
+            headers[key] = value
+
+
+class _HostHeadersAdapter(BaseAdapter):
+    """
+    为发往特定主机的请求附加请求头后转交给原有的适配器
+    """
+
+    def __init__(self, adapter: BaseAdapter, host_headers: _HostHeaders):
+        super().__init__()
+        self._adapter = adapter
+        self._host_headers = host_headers
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        _apply(self._host_headers, urlsplit(request.url).hostname or '', request.headers)
+        return self._adapter.send(request, **kwargs)
+
+    def close(self) -> None:
+        # 原有的适配器仍挂载在会话上，由会话负责关闭
+        pass
+
+
+def _install(client: Any) -> _HostHeaders:
+    host_headers = _CLIENT_HEADERS.get(client)
+    if host_headers is None:
+        host_headers = _CLIENT_HEADERS[client] = {}
+        if not isinstance(client, Session):
+            def hook(request) -> None:
+                _apply(host_headers, request.url.host, request.headers)
+
+            async def async_hook(request) -> None:
+                hook(request)
+
+            hooks = client.event_hooks
+            hooks['request'] = [*hooks['request'], async_hook if hasattr(client, 'aclose') else hook]
+            client.event_hooks = hooks
+    return host_headers
+
+
+def _mount(session: Session, host: str, host_headers: _HostHeaders) -> None:
+    for scheme in ('http', 'https'):
+        for prefix in (f'{scheme}://{host}/', f'{scheme}://{host}:'):
+            adapter = session.get_adapter(prefix)
+            if not isinstance(adapter, _HostHeadersAdapter):
+                session.mount(prefix, _HostHeadersAdapter(adapter, host_headers))
+
+
+def set_host_headers(client: Any, hosts: Iterable[str], headers: Mapping[str, str]) -> None:
+    """
+    设置会话发往指定主机的请求所附加的请求头，同名请求头会被替换
+
+    请求中显式传入的同名请求头优先于此处设置的值。
+
+    >>> set_host_headers(session, ('my.cqu.edu.cn',), {'Authorization': mycqu_token})
+    >>> set_host_headers(session, ('lib.cqu.edu.cn',), {'Authorization': library_token})
+
+    :param client: :class:`requests.Session`、:class:`httpx.Client` 或 :class:`httpx.AsyncClient`
+    :param hosts: 主机名
+    :type hosts: Iterable[str]
+    :param headers: 请求头
+    :type headers: Mapping[str, str]
+    """
+    host_headers = _install(client)
+    for host in hosts:
+        host_headers.setdefault(host, {}).update(headers)
+        if isinstance(client, Session):
+            _mount(client, host, host_headers)
+
+
+def remove_host_headers(client: Any, hosts: Iterable[str], names: Iterable[str]) -> None:
+    """
+    移除会话发往指定主机的请求所附加的请求头
+
+    :param client: 会话
+    :param hosts: 主机名
+    :type hosts: Iterable[str]
+    :param names: 请求头名称
+    :type names: Iterable[str]
+    """
+    host_headers = _CLIENT_HEADERS.get(client)
+    if host_headers is None:
+        return
+    names = tuple(names)
+    for host in hosts:
+        headers = host_headers.get(host)
+        if headers is None:
+            continue
+        for name in names:
+            headers.pop(name, None)
+        if not headers:
+            del host_headers[host]
+
+
+def get_host_headers(client: Any) -> Dict[str, Dict[str, str]]:
+    """
+    获取会话按主机附加的请求头的副本
+
+    :param client: 会话
+    :return: 主机名到请求头的映射
+    :rtype: Dict[str, Dict[str, str]]
+    """
+    return {host: dict(headers) for host, headers in _CLIENT_HEADERS.get(client, {}).items()}
+
+
+@contextmanager
+def suspend_host_headers(hosts: Iterable[str]) -> Iterator[None]:
+    """
+    在当前上下文中暂不为发往指定主机的请求附加请求头，已设置的请求头不会被移除
+
+    用于在重新认证时避免发送旧的 token，同时保证认证失败时旧的 token 仍然可用；
+    仅对当前线程或协程（及由其复制上下文创建的任务）生效。
+
+    :param hosts: 主机名
+    :type hosts: Iterable[str]
+    """
+    token = _SUSPENDED.set(_SUSPENDED.get() | frozenset(hosts))
+    try:
+        yield
+    finally:
+        _SUSPENDED.reset(token)
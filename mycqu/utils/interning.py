@@ -0,0 +1,116 @@
+"""
+可选的对象与字符串驻留
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator, Optional, TypeVar
+
+from .config import ConfigManager
+
+__all__ = ['InternTable', 'interning', 'is_interning', 'intern_str', 'SESSION_TABLE', 'COURSE_TABLE']
+
+_T = TypeVar('_T')
+
+_INTERNING: ContextVar[Optional[bool]] = ContextVar('mycqu_interning', default=None)
+
+
+class InternTable:
+    """
+    有容量上限的驻留表，相同键只保留一个对象，超出容量时淘汰最久未使用的对象
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        :param maxsize: 最多保留的对象数量
+        :type maxsize: int, optional
+        """
+        self.maxsize = maxsize
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """
+        获取键对应的驻留对象，不存在时调用 ``factory`` 构造并驻留
+
+        :param key: 键
+        :type key: Hashable
+        :param factory: 构造对象的函数
+        :type factory: Callable[[], T]
+        :rtype: T
+        """
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+                return value
+        value = factory()
+        with self._lock:
+            value = self._items.setdefault(key, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """清空驻留表"""
+        with self._lock:
+            self._items.clear()
+
+
+SESSION_TABLE = InternTable(256)
+"""学期 :class:`.course.CQUSession` 的驻留表"""
+COURSE_TABLE = InternTable(65536)
+"""课程 :class:`.course.Course` 的驻留表"""
+
+
+def is_interning() -> bool:
+    """
+    当前是否开启驻留，未通过 :func:`interning` 设置时使用配置 ``model.interning``
+
+    :rtype: bool
+    """
+    enabled = _INTERNING.get()
+    if enabled is None:
+        return ConfigManager().config['model']['interning']
+    return enabled
+
+
+@contextmanager
+def interning(enabled: bool = True) -> Iterator[None]:
+    """
+    在上下文（当前线程或协程）内开启或关闭驻留
+
+    开启时 ``from_dict`` 对相同的学期与课程返回同一对象，并对院系、教师、教室等重复出现的字符串调用 :func:`sys.intern`。
+
+    >>> with interning():
+    ...     scores = Score.fetch(session)
+
+    :param enabled: 是否开启
+    :type enabled: bool, optional
+    """
+    token = _INTERNING.set(enabled)
+    try:
+        yield
+    finally:
+        _INTERNING.reset(token)
+
+
+def intern_str(value: Any) -> Any:
+    """
+    开启驻留时对字符串调用 :func:`sys.intern`，其他值原样返回
+
+    :param value: 待驻留的值
+    :type value: Any
+    :rtype: Any
+    """
+    if isinstance(value, str) and is_interning():
+        return sys.intern(value)
+    return value
@@ -0,0 +1,62 @@
+"""
+从响应中观察到的统一身份认证登陆状态
+
+登陆状态按会话与登陆站点保存，供 :meth:`.auth._authorizer.Authorizer.is_logined` 在配置项`auth.login_state_ttl`
+大于 0 时免去一次网络请求；任一请求返回 401 时会话的全部登陆状态都会被遗忘，下次判断时重新发出请求。
+"""
+import threading
+from time import monotonic
+from typing import Any, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+__all__ = ['observe_login_state', 'get_login_state', 'forget_login_state']
+
+# 会话 -> {登陆 url: (是否登陆, 观察到该状态的时刻)}
+_LOGIN_STATES: WeakKeyDictionary = WeakKeyDictionary()
+_LOGIN_STATES_LOCK = threading.Lock()
+
+
+def observe_login_state(session: Any, url: str, logined: bool) -> None:
+    """
+    记录从响应中观察到的登陆状态，无法被弱引用的会话不记录
+
+    :param session: 会话
+    :param url: 登陆站点的 url
+    :type url: str
+    :param logined: 是否处于登陆状态
+    :type logined: bool
+    """
+    try:
+        with _LOGIN_STATES_LOCK:
+            _LOGIN_STATES.setdefault(session, {})[url] = (logined, monotonic())
+    except TypeError:
+        pass
+
+
+def get_login_state(session: Any, url: str) -> Optional[Tuple[bool, float]]:
+    """
+    获取记录的登陆状态
+
+    :param session: 会话
+    :param url: 登陆站点的 url
+    :type url: str
+    :return: 是否登陆及观察到该状态的时刻（:func:`time.monotonic`），没有记录时返回 :obj:`None`
+    :rtype: Optional[Tuple[bool, float]]
+    """
+    try:
+        return _LOGIN_STATES.get(session, {}).get(url)
+    except TypeError:
+        return None
+
+
+def forget_login_state(session: Any) -> None:
+    """
+    遗忘会话的全部登陆状态
+
+    :param session: 会话
+    """
+    try:
+        with _LOGIN_STATES_LOCK:
+            _LOGIN_STATES.pop(session, None)
+    except TypeError:
+        pass
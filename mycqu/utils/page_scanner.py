@@ -0,0 +1,174 @@
+"""
+从页面中直接提取少量目标数据的扫描器，用于替代对整个页面进行 :class:`html.parser.HTMLParser` 解析
+"""
+import re
+from html import unescape
+from typing import Dict, Iterable, List, Optional
+
+__all__ = ['PageScanner', 'element_text', 'element_inner', 'element_tag', 'attr_value', 'strip_tags', 'last_tag_end']
+
+_ATTR_TEMPLATE = r'\b{attr}\s*=\s*["\']{value}["\']'
+_ATTR_RE_CACHE: Dict[str, re.Pattern] = {}
+_TAG_RE: re.Pattern = re.compile(r'<[^>]*>')
+# 注释中的内容对 HTMLParser 不可见，扫描时一并跳过
+_COMMENT = r'<!--.*?-->'
+
+
+def _attrs_pattern(tag: str, attrs: Dict[str, str]) -> str:
+    lookaheads = ''.join(
+        rf'(?=[^>]*{_ATTR_TEMPLATE.format(attr=re.escape(attr), value=re.escape(value))})'
+        for attr, value in attrs.items()
+    )
+    return rf'<{tag}\b{lookaheads}[^>]*>'
+
+
+def element_text(tag: str, **attrs: str) -> str:
+    """
+    生成匹配带有指定属性的元素内第一段文本的模式
+
+    >>> element_text('p', id='login-croypto')
+    """
+    return _attrs_pattern(tag, attrs) + r'([^<]*)'
+
+
+def element_inner(tag: str, **attrs: str) -> str:
+    """
+    生成匹配带有指定属性的元素到其后第一个同名结束标签之间全部内容的模式，配合 :func:`strip_tags` 取出文本
+
+    >>> element_inner('div', id='login-error-msg')
+    """
+    return _attrs_pattern(tag, attrs) + rf'(.*?)</{tag}\s*>'
+
+
+def element_tag(tag: str, **attrs: str) -> str:
+    """
+    生成匹配带有指定属性的开始标签本身的模式，配合 :func:`attr_value` 取出其他属性
+
+    >>> element_tag('input', name='ssoticketid')
+    """
+    return f'({_attrs_pattern(tag, attrs)})'
+
+
+def attr_value(tag: str, name: str) -> Optional[str]:
+    """
+    从开始标签中取出属性值，属性不存在时返回 :obj:`None`
+
+    :param tag: 完整的开始标签，如 ``<input name="lt" value="abc">``
+    :type tag: str
+    :param name: 属性名
+    :type name: str
+    :return: 反转义后的属性值
+    :rtype: Optional[str]
+    """
+    pattern = _ATTR_RE_CACHE.get(name)
+    if pattern is None:
+        pattern = re.compile(rf'\s{re.escape(name)}\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+        _ATTR_RE_CACHE[name] = pattern
+    match = pattern.search(tag)
+    if match is None:
+        return None
+    return unescape(next(group for group in match.groups() if group is not None))
+
+
+def strip_tags(fragment: str) -> str:
+    """
+    去除片段中的标签并反转义，得到其中的文本
+    """
+    return unescape(_TAG_RE.sub('', fragment))
+
+
+def last_tag_end(page: str, tag: str) -> int:
+    """
+    页面中最后一个指定开始标签之后的位置，用作 :meth:`PageScanner.scan` 的 ``endpos``
+
+    在只需要某种标签的最后一次出现时，扫描到此处即可提前结束；
+    若该位置位于注释之中，则延伸到注释结束，以免扫描时把注释中的内容当作目标。
+
+    :param page: 页面内容
+    :type page: str
+    :param tag: 标签名，如 :obj:`"input"`
+    :type tag: str
+    :return: 位置，页面中没有该标签时为 0
+    :rtype: int
+    """
+    start = page.rfind(f'<{tag}')
+    if start < 0:
+        return 0
+    end = page.find('>', start) + 1 or len(page)
+    if page.rfind('<!--', 0, end) > page.rfind('-->', 0, end):
+        close = page.find('-->', end)
+        end = len(page) if close < 0 else close + 3
+    return end
+
+
+class PageScanner:
+    """
+    将若干目标模式编译为一个正则表达式，在一次扫描中提取全部目标
+
+    每个目标模式恰好包含一个捕获组，扫描结果为目标名到捕获内容（未反转义）的映射；
+    在只需要首次出现的值时，所有目标都找到后立即停止扫描。
+
+    >>> scanner = PageScanner({'salt': 'var pwdDefaultEncryptSalt = "([^"]+)"'})
+    >>> scanner.scan(page)
+    {'salt': '...'}
+    """
+
+    def __init__(self, targets: Dict[str, str], optional: Iterable[str] = (), flags: int = 0):
+        """
+        :param targets: 目标名到目标模式的映射，每个模式恰好包含一个捕获组
+        :type targets: Dict[str, str]
+        :param optional: 允许缺失的目标名，缺失时其结果为 :obj:`None`
+        :type optional: Iterable[str], optional
+        :param flags: 编译正则表达式时使用的额外标志
+        :type flags: int, optional
+        """
+        self._names: List[Optional[str]] = [None]
+        for name, pattern in targets.items():
+            if re.compile(pattern, flags).groups != 1:
+                raise ValueError(f"pattern of {name} should contain exactly one group")
+            self._names.append(name)
+        self._required = frozenset(targets) - frozenset(optional)
+        self._optional = frozenset(targets) & frozenset(optional)
+        pattern = '|'.join([_COMMENT] + [f'(?:{pattern})' for pattern in targets.values()])
+        patterns = targets.values()
+        if all(pattern.lstrip('(').startswith('<') for pattern in patterns) and \
+                any(pattern.startswith('(') for pattern in patterns):
+            # re 提取各分支共同首字符的优化无法越过捕获组（如 :func:`element_tag`），
+            # 此时显式前瞻 ``<``，跳过不可能匹配的位置
+            pattern = f'(?=<)(?:{pattern})'
+        self._pattern: re.Pattern = re.compile(pattern, flags | re.DOTALL)
+
+    def scan(self, page: str, last: bool = False, endpos: Optional[int] = None) -> Optional[Dict[str, Optional[str]]]:
+        """
+        扫描页面
+
+        :param page: 页面内容
+        :type page: str
+        :param last: 目标多次出现时是否取最后一次出现的值（与逐个覆盖的 HTMLParser 行为一致），
+                     为 :obj:`True` 时会扫描到 ``endpos`` 为止
+        :type last: bool, optional
+        :param endpos: 扫描的结束位置，默认为页面末尾；目标不会出现在其后时可由 :func:`last_tag_end` 给出
+        :type endpos: Optional[int], optional
+        :return: 目标名到捕获内容的映射，有必需的目标未找到时返回 :obj:`None`
+        :rtype: Optional[Dict[str, Optional[str]]]
+        """
+        result: Dict[str, Optional[str]] = dict.fromkeys(self._optional)
+        remaining = len(self._names) - 1
+        found = set()
+        for match in self._pattern.finditer(page, 0, len(page) if endpos is None else endpos):
+            index = match.lastindex
+            if index is None:
+                continue
+            name = self._names[index]
+            if name in found:
+                if last:
+                    result[name] = match[index]
+                continue
+            result[name] = match[index]
+            found.add(name)
+            remaining -= 1
+            if not remaining and not last:
+                break
+        if not self._required <= found:
+            return None
+        return result
@@ -0,0 +1,239 @@
+"""
+将模型以分区的 Parquet 文件保存与读取
+"""
+from __future__ import annotations
+
+import datetime
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import get_args, get_origin
+
+from .construct import construct_model
+from .datetimes import TIMEZONE
+from .records import _from_record_value, _to_record_value, is_record, is_record_mode
+
+__all__ = ['arrow_schema', 'write_parquet', 'read_parquet']
+
+Partition = Union[str, Callable[[Any], Any]]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError:
+        raise ImportError(  # pylint: ignore disable=raise-missing-from
+            "Please install pyarrow to use write_parquet and read_parquet")
+    return pyarrow
+
+
+def _unwrap(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _kind(annotation: Any, stack: Tuple[type, ...]) -> str:
+    if _is_model(annotation):
+        # Parquet 不支持递归的结构，递归出现的模型以 json 字符串保存
+        return 'json' if annotation in stack else 'model'
+    if get_origin(annotation) is list:
+        return 'list'
+    if annotation in (bool, int, float, str, datetime.datetime, datetime.date, datetime.time):
+        return annotation.__name__
+    return 'json'
+
+
+def _arrow_type(pa, annotation: Any, stack: Tuple[type, ...]) -> Any:
+    annotation = _unwrap(annotation)
+    kind = _kind(annotation, stack)
+    if kind == 'model':
+        return pa.struct([pa.field(name, _arrow_type(pa, field.annotation, stack + (annotation,)))
+                          for name, field in annotation.model_fields.items()])
+    if kind == 'list':
+        return pa.list_(_arrow_type(pa, get_args(annotation)[0], stack))
+    return {
+        'bool': pa.bool_(), 'int': pa.int64(), 'float': pa.float64(), 'str': pa.string(), 'json': pa.string(),
+        'datetime': pa.timestamp('us', tz='Asia/Shanghai'), 'date': pa.date32(), 'time': pa.time64('us'),
+    }[kind]
+
+
+def arrow_schema(model: Type[BaseModel]) -> Any:
+    """
+    获取模型对应的 pyarrow 结构
+
+    嵌套模型为 struct，列表为 list，时间为 Asia/Shanghai 时区的 timestamp；
+    递归出现的模型（如 :attr:`.enroll.EnrollCourseItem.children`）以及其他类型以 json 字符串保存。
+
+    :param model: 模型类
+    :type model: Type[BaseModel]
+    :rtype: pyarrow.Schema
+    """
+    pa = _pyarrow()
+    return pa.schema([pa.field(name, _arrow_type(pa, field.annotation, (model,)))
+                      for name, field in model.model_fields.items()])
+
+
+def _to_arrow(annotation: Any, value: Any, stack: Tuple[type, ...]) -> Any:
+    if value is None:
+        return None
+    annotation = _unwrap(annotation)
+    kind = _kind(annotation, stack)
+    if kind == 'model':
+        return {name: _to_arrow(field.annotation, getattr(value, name), stack + (annotation,))
+                for name, field in annotation.model_fields.items()}
+    if kind == 'list':
+        item_annotation = get_args(annotation)[0]
+        return [_to_arrow(item_annotation, item, stack) for item in value]
+    if kind == 'json':
+        return _adapter(annotation).dump_json(_from_record_value(value)).decode()
+    if kind == 'time':
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _from_arrow(annotation: Any, value: Any, stack: Tuple[type, ...]) -> Any:
+    if value is None:
+        return None
+    annotation = _unwrap(annotation)
+    kind = _kind(annotation, stack)
+    if kind == 'model':
+        return construct_model(annotation, **{
+            name: _from_arrow(field.annotation, value[name], stack + (annotation,))
+            for name, field in annotation.model_fields.items()
+        })
+    if kind == 'list':
+        item_annotation = get_args(annotation)[0]
+        return [_from_arrow(item_annotation, item, stack) for item in value]
+    if kind == 'json':
+        value = _adapter(annotation).validate_json(value)
+        return _to_record_value(value) if is_record_mode() else value
+    if kind == 'datetime':
+        return value.astimezone(TIMEZONE)
+    if kind == 'time':
+        return value.replace(tzinfo=TIMEZONE)
+    return value
+
+
+def _partition_value(partition: Partition, item: Any) -> str:
+    if callable(partition):
+        return str(partition(item))
+    value = item
+    for name in partition.split('.'):
+        value = getattr(value, name)
+    return str(value)
+
+
+def write_parquet(items: Iterable[Any], base_dir: str, model: Optional[Type[BaseModel]] = None,
+                  partition_by: Optional[Mapping[str, Partition]] = None, batch_size: int = 65536) -> None:
+    """
+    将模型对象（或记录）分批写入 hive 风格分区的 Parquet 数据集
+
+    每次调用写入新的文件，不会覆盖已有的快照。
+
+    >>> write_parquet(scores, "snapshots/scores", partition_by={"user": lambda _: student_id, "semester": "session"})
+    >>> write_parquet(bills, "snapshots/bills", partition_by={"day": lambda bill: bill.date.date()})
+
+    :param items: 模型对象或记录，可以是生成器
+    :type items: Iterable[Any]
+    :param base_dir: 数据集目录
+    :type base_dir: str
+    :param model: 模型类，留空时由第一项推断
+    :type model: Optional[Type[BaseModel]]
+    :param partition_by: 分区列名（不能与模型字段重名）到取值方式的映射，取值方式为以 ``.`` 分隔的属性路径或接收对象返回分区值的函数，
+                         分区值以字符串保存
+    :type partition_by: Optional[Mapping[str, Union[str, Callable[[Any], Any]]]]
+    :param batch_size: 每个 record batch 的行数
+    :type batch_size: int, optional
+    :raises ValueError: 分区列名与模型字段重名时抛出
+    """
+    pa = _pyarrow()
+    partition_by = dict(partition_by or {})
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        return
+    if model is None:
+        model = type(first)._model if is_record(first) else type(first)
+    schema = arrow_schema(model)
+    for name in partition_by:
+        if name in model.model_fields:
+            raise ValueError(f"partition column {name} conflicts with a field of {model.__name__}")
+        schema = schema.append(pa.field(name, pa.string()))
+
+    def batches() -> Iterator[Any]:
+        rows: List[Dict[str, Any]] = []
+        for item in _chain(first, iterator):
+            row = {name: _to_arrow(field.annotation, getattr(item, name), (model,))
+                   for name, field in model.model_fields.items()}
+            for name, partition in partition_by.items():
+                row[name] = _partition_value(partition, item)
+            rows.append(row)
+            if len(rows) >= batch_size:
+                yield pa.RecordBatch.from_pylist(rows, schema=schema)
+                rows = []
+        if rows:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+    pa.dataset.write_dataset(
+        batches(), base_dir, schema=schema, format='parquet',
+        partitioning=pa.dataset.partitioning(pa.schema([schema.field(name) for name in partition_by]),
+                                             flavor='hive') if partition_by else None,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior='overwrite_or_ignore',
+    )
+
+
+def _chain(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
+
+
+def read_parquet(base_dir: str, model: Type[BaseModel], filters: Optional[Mapping[str, Any]] = None,
+                 batch_size: int = 65536) -> Iterator[Any]:
+    """
+    分批读取由 :func:`write_parquet` 写入的数据集
+
+    >>> for score in read_parquet("snapshots/scores", Score, filters={"user": student_id}):
+    ...     print(score)
+
+    :param base_dir: 数据集目录
+    :type base_dir: str
+    :param model: 模型类
+    :type model: Type[BaseModel]
+    :param filters: 分区列名到取值的映射，只读取对应的分区
+    :type filters: Optional[Mapping[str, Any]]
+    :param batch_size: 每个 record batch 的最大行数
+    :type batch_size: int, optional
+    :return: 模型对象（记录模式下为记录）的迭代器
+    :rtype: Iterator[Any]
+    """
+    pa = _pyarrow()
+    fields = model.model_fields
+    # 分区值总是以字符串写入，读取时不推断类型；没有分区时 pyarrow 发现的结构为文件的结构，需排除模型字段
+    discovered = pa.dataset.dataset(base_dir, format='parquet', partitioning='hive').partitioning.schema
+    names = [name for name in discovered.names if name not in fields]
+    dataset = pa.dataset.dataset(base_dir, format='parquet', partitioning=pa.dataset.partitioning(
+        pa.schema([pa.field(name, pa.string()) for name in names]), flavor='hive'))
+    expression = None
+    for name, value in (filters or {}).items():
+        condition = pa.dataset.field(name) == str(value)
+        expression = condition if expression is None else expression & condition
+    for batch in dataset.to_batches(columns=list(fields), filter=expression, batch_size=batch_size):
+        for row in batch.to_pylist():
+            yield construct_model(model, **{name: _from_arrow(field.annotation, row[name], (model,))
+                                            for name, field in fields.items()})
@@ -0,0 +1,50 @@
+"""
+按结构解析原始响应
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Union
+
+from .._lib_wrapper.fastjson import loads
+from ..exception import ParseError
+
+__all__ = ['decode_payload']
+
+try:
+    import msgspec as _msgspec
+except ImportError:
+    _msgspec = None
+
+
+@lru_cache(maxsize=None)
+def _decoder(schema: Any) -> Any:
+    # 与 pydantic 的宽松模式一样允许数字字符串等转换为对应类型
+    return _msgspec.json.Decoder(schema, strict=False)
+
+
+def decode_payload(content: Union[bytes, str], schema: Any) -> Any:
+    """
+    将原始响应按结构（通常为各模块 ``_schemas`` 中的 :class:`TypedDict`）反序列化
+
+    安装了 msgspec 时一次完成解析与校验，结果仍为字典与列表，缺少字段或类型不符时给出出错的位置；
+    未安装时只做解析，不做校验。
+
+    :param content: 原始响应内容
+    :type content: Union[bytes, str]
+    :param schema: 响应的结构
+    :type schema: Any
+    :raises ParseError: 响应不是合法的 json 或与结构不符时抛出
+    :return: 反序列化得到的对象
+    :rtype: Any
+    """
+    if _msgspec is None:
+        try:
+            return loads(content)
+        except ValueError as e:
+            raise ParseError(str(e)) from e
+    try:
+        return _decoder(schema).decode(content)
+    except _msgspec.DecodeError as e:
+        # ValidationError 为 DecodeError 的子类，信息中包含出错的位置，如 "Object missing required field `courseName` - at `$.data[0]`"
+        raise ParseError(str(e)) from e
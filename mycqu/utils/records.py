@@ -0,0 +1,127 @@
+"""
+与模型对应的轻量记录类型
+"""
+from __future__ import annotations
+
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Tuple, Type
+
+from pydantic import BaseModel
+
+__all__ = ['record_type', 'record_mode', 'is_record_mode', 'is_record', 'to_record', 'from_record']
+
+_RECORD_MODE: ContextVar[bool] = ContextVar('mycqu_record_mode', default=False)
+_RECORD_TYPES: Dict[type, Type[tuple]] = {}
+
+
+def record_type(cls: Type[BaseModel]) -> Type[tuple]:
+    """
+    获取模型对应的记录类型
+
+    记录类型是字段与模型相同的 :func:`collections.namedtuple`，没有 ``__dict__``，
+    可通过 ``to_model()`` 方法转换回模型对象。
+
+    >>> ExamRecord = record_type(Exam)
+    >>> ExamRecord._fields
+    ('course', 'batch', 'batch_id', ...)
+
+    :param cls: 模型类
+    :type cls: Type[BaseModel]
+    :rtype: Type[tuple]
+    """
+    try:
+        return _RECORD_TYPES[cls]
+    except KeyError:
+        pass
+    record = namedtuple(cls.__name__ + 'Record', tuple(cls.model_fields))
+    record.__doc__ = f"{cls.__name__} 的记录类型"
+    record.__module__ = cls.__module__
+    record._model = cls
+    record.to_model = from_record
+    return _RECORD_TYPES.setdefault(cls, record)
+
+
+def is_record(value: Any) -> bool:
+    """
+    判断对象是否为由 :func:`record_type` 生成的记录
+
+    :param value: 待判断的对象
+    :type value: Any
+    :rtype: bool
+    """
+    return isinstance(value, tuple) and hasattr(type(value), '_model')
+
+
+def is_record_mode() -> bool:
+    """
+    当前是否处于记录模式
+
+    :rtype: bool
+    """
+    return _RECORD_MODE.get()
+
+
+@contextmanager
+def record_mode(enabled: bool = True) -> Iterator[None]:
+    """
+    在上下文（当前线程或协程）内开启记录模式，此时各模型的 ``from_dict`` 以及调用它们的 ``fetch``
+    返回对应的记录而不是模型对象，与免校验构造模式一样不做类型校验与转换；
+    持有这些结果的对象（如 :class:`.enroll.EnrollEvent`、:class:`.exam.ExamChanges`、:class:`.enroll.EnrollConflict`）
+    仍为模型，其中的字段为记录
+
+    >>> with record_mode():
+    ...     exams = Exam.fetch(session, student_id)
+
+    :param enabled: 是否开启
+    :type enabled: bool, optional
+    """
+    token = _RECORD_MODE.set(enabled)
+    try:
+        yield
+    finally:
+        _RECORD_MODE.reset(token)
+
+
+def _to_record_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_record(value)
+    if isinstance(value, list):
+        return [_to_record_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_record_value(item) for key, item in value.items()}
+    return value
+
+
+def _from_record_value(value: Any) -> Any:
+    if is_record(value):
+        return from_record(value)
+    if isinstance(value, list):
+        return [_from_record_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _from_record_value(item) for key, item in value.items()}
+    return value
+
+
+def to_record(model: BaseModel) -> Tuple:
+    """
+    将模型对象（包括其中嵌套的模型）转换为记录
+
+    :param model: 模型对象
+    :type model: BaseModel
+    :rtype: tuple
+    """
+    cls = type(model)
+    return record_type(cls)(*(_to_record_value(getattr(model, name)) for name in cls.model_fields))
+
+
+def from_record(record: Tuple) -> BaseModel:
+    """
+    将记录（包括其中嵌套的记录）转换回模型对象
+
+    :param record: 由 :func:`to_record` 或记录模式得到的记录
+    :type record: tuple
+    :rtype: BaseModel
+    """
+    return type(record)._model(**{name: _from_record_value(value) for name, value in record._asdict().items()})
@@ -4,7 +4,8 @@ from typing import NewType, Tuple, Optional, Dict, Protocol, Any, Literal, TypeV
 from .params_mapper import RequestParamsMapper
 
 
-__all__ = ['ResponseProtocol', 'RequestProtocol', 'RequestReturns', 'RequestParams', 'Requestable', 'Request', 'Response']
+__all__ = ['ResponseProtocol', 'RequestProtocol', 'RequestReturns', 'RequestParams', 'Requestable', 'Request', 'Response',
+           'UnauthorizedRecovery']
 
 REQUEST_METHOD = Literal['delete', 'get', 'head', 'options', 'patch', 'post', 'put']
 
@@ -88,6 +89,17 @@ class RequestParams:
             result.update({param_key.value: v})
         return result
 
+class UnauthorizedRecovery(Protocol):
+    """
+    请求返回 401 时尝试恢复认证状态的对象，通过配置项`request.unauthorized_recovery`启用
+
+    恢复成功（返回 :obj:`True`）后`RequestTransformer`会重新发出一次失败的请求
+    """
+    def recover(self, request: RequestProtocol, params: 'RequestParams', sent_at: float) -> bool: ...
+
+    async def async_recover(self, request: RequestProtocol, params: 'RequestParams', sent_at: float) -> bool: ...
+
+
 RequestReturns = NewType('RequestReturns', Tuple[RequestProtocol, RequestParams])
 
 class Requestable:
@@ -1,14 +1,46 @@
+from copy import copy
 from functools import wraps, partial
 from inspect import isgeneratorfunction, isgenerator
-from typing import Callable, Any, Generator, Tuple
+from time import monotonic
+from typing import Callable, Any, Generator, Tuple, Optional
 
 from ..config import ConfigManager
-from .models import RequestReturns, RequestProtocol, Requestable, Request, Response
+from ..login_state import forget_login_state
+from .models import RequestReturns, RequestProtocol, RequestParams, Requestable, Request, Response, \
+    UnauthorizedRecovery
 
 
 __all__ = ['RequestTransformer', ]
 
 
+def _recovery() -> Optional[UnauthorizedRecovery]:
+    return ConfigManager().config['request'].get('unauthorized_recovery')
+
+
+def _sync_send(requestable: RequestProtocol, params: RequestParams) -> Response:
+    param_dict = params.to_param_dict(ConfigManager().config['request']['sync_request_params_mapper'])
+    sent_at = monotonic()
+    res = requestable.request(**param_dict)
+    if res.status_code == 401:
+        forget_login_state(requestable)
+        recovery = _recovery()
+        if recovery is not None and recovery.recover(requestable, params, sent_at):
+            res = requestable.request(**param_dict)
+    return res
+
+
+async def _async_send(requestable: RequestProtocol, params: RequestParams) -> Response:
+    param_dict = params.to_param_dict(ConfigManager().config['request']['async_request_params_mapper'])
+    sent_at = monotonic()
+    res = await requestable.request(**param_dict)
+    if res.status_code == 401:
+        forget_login_state(requestable)
+        recovery = _recovery()
+        if recovery is not None and await recovery.async_recover(requestable, params, sent_at):
+            res = await requestable.request(**param_dict)
+    return res
+
+
 class RequestTransformer:
     def __init__(self, generator: Callable[..., Generator[RequestReturns, Any, Any]]):
         """
@@ -26,8 +58,10 @@ class RequestTransformer:
         self.instance = None
 
     def __get__(self, instance, owner):
-        self.instance = instance if instance is not None else owner
-        return self
+        # 返回绑定了实例的副本而非修改自身，避免多线程并发调用时互相覆盖绑定的实例
+        bound = copy(self)
+        bound.instance = instance if instance is not None else owner
+        return bound
 
 
     @property
@@ -56,11 +90,7 @@ class RequestTransformer:
                     if isinstance(request_returns[0], RequestTransformer):
                         res = request_returns[0].sync_request(request, **request_returns[1])
                     else:
-                        res = request_returns[0].request(
-                            **request_returns[1].to_param_dict(
-                                ConfigManager().config['request']['sync_request_params_mapper']
-                            )
-                        )
+                        res = _sync_send(request_returns[0], request_returns[1])
             except StopIteration as e:
                 return e.value
 
@@ -94,11 +124,7 @@ class RequestTransformer:
                     if isinstance(request_returns[0], RequestTransformer):
                         res = await request_returns[0].async_request(request, **request_returns[1])
                     else:
-                        res = await request_returns[0].request(
-                            **request_returns[1].to_param_dict(
-                                ConfigManager().config['request']['async_request_params_mapper']
-                            )
-                        )
+                        res = await _async_send(request_returns[0], request_returns[1])
             except StopIteration as e:
                 return e.value
 
@@ -0,0 +1,364 @@
+"""
+以紧凑形式保存空闲用户会话状态的存储，仅在发出请求时才还原为真实的会话
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, asynccontextmanager
+from http.cookiejar import CookieJar
+from time import monotonic
+from typing import Any, Dict, Hashable, Iterator, AsyncIterator, Optional, Tuple
+
+from requests import Session
+from requests.cookies import create_cookie
+from requests.utils import default_headers
+
+from .clients import SharedConnectionPool
+from .host_headers import get_host_headers, set_host_headers
+
+__all__ = ['SessionState', 'SessionStore']
+
+_Cookie = Tuple[str, str, str, str, Optional[int], bool]
+"""(name, value, domain, path, expires, secure)"""
+
+_DEFAULT_HEADERS: Dict[bool, Dict[str, str]] = {}
+
+
+def _jar(client: Any) -> CookieJar:
+    cookies = client.cookies
+    return getattr(cookies, 'jar', cookies)
+
+
+def _default_headers(client: Any) -> Dict[str, str]:
+    is_requests = isinstance(client, Session)
+    if is_requests not in _DEFAULT_HEADERS:
+        if is_requests:
+            _DEFAULT_HEADERS[is_requests] = dict(default_headers())
+        else:
+            import httpx
+            # httpx 的同步与异步客户端默认请求头相同；使用模拟的传输层，不创建任何连接
+            with httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(204))) as client:
+                _DEFAULT_HEADERS[is_requests] = dict(client.headers)
+    return _DEFAULT_HEADERS[is_requests]
+
+
+class SessionState:
+    """
+    紧凑的会话状态记录，仅保存 cookie、与默认值不同的请求头、按主机附加的请求头（如 ``Authorization``）、过期时间和最后使用时间
+    """
+    __slots__ = ('cookies', 'headers', 'host_headers', 'expires_at', 'last_used', '_client', '_users', '__weakref__')
+
+    def __init__(self, cookies: Tuple[_Cookie, ...] = (), headers: Tuple[Tuple[str, str], ...] = (),
+                 expires_at: Optional[float] = None,
+                 host_headers: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = ()):
+        """
+        :param cookies: cookie 记录
+        :type cookies: Tuple[Tuple[str, str, str, str, Optional[int], bool], ...]
+        :param headers: 与默认值不同的请求头
+        :type headers: Tuple[Tuple[str, str], ...]
+        :param expires_at: 会话过期的时间戳，为 :obj:`None` 时不过期
+        :type expires_at: Optional[float]
+        :param host_headers: 按主机附加的请求头（参见 :func:`.utils.host_headers.set_host_headers`）
+        :type host_headers: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]
+        """
+        self.cookies = cookies
+        self.headers = headers
+        self.host_headers = host_headers
+        self.expires_at = expires_at
+        self.last_used: float = monotonic()
+        self._client: Any = None
+        self._users: int = 0
+
+    @classmethod
+    def from_client(cls, client: Any, expires_at: Optional[float] = None) -> 'SessionState':
+        """
+        从 :class:`requests.Session` 或 :class:`httpx.AsyncClient` 中记录会话状态
+
+        :param client: 会话
+        :param expires_at: 会话过期的时间戳，为 :obj:`None` 时不过期
+        :type expires_at: Optional[float]
+        :return: 会话状态
+        :rtype: SessionState
+        """
+        state = cls(expires_at=expires_at)
+        state.capture(client)
+        return state
+
+    @property
+    def expired(self) -> bool:
+        """
+        会话是否已过期
+        """
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+    @property
+    def materialised(self) -> bool:
+        """
+        当前是否持有真实的会话
+        """
+        return self._client is not None
+
+    def capture(self, client: Any) -> None:
+        """
+        将会话中的 cookie 与请求头记录到此对象中
+        """
+        self.cookies = tuple(
+            (cookie.name, cookie.value, cookie.domain, cookie.path, cookie.expires, cookie.secure)
+            for cookie in _jar(client)
+        )
+        defaults = _default_headers(client)
+        self.headers = tuple(
+            (key, value) for key, value in client.headers.items() if defaults.get(key) != value
+        )
+        self.host_headers = tuple(
+            (host, tuple(headers.items())) for host, headers in get_host_headers(client).items()
+        )
+
+    def restore(self, client: Any) -> Any:
+        """
+        将记录的 cookie 与请求头写入会话
+
+        :return: 传入的会话
+        """
+        jar = _jar(client)
+        for name, value, domain, path, expires, secure in self.cookies:
+            jar.set_cookie(create_cookie(name, value, domain=domain, path=path, expires=expires, secure=secure))
+        client.headers.update(self.headers)
+        for host, headers in self.host_headers:
+            set_host_headers(client, (host,), dict(headers))
+        return client
+
+    def memory_usage(self) -> int:
+        """
+        估计此记录占用的内存（字节），不包括持有的真实会话
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.cookies) + sys.getsizeof(self.headers) + \
+            sys.getsizeof(self.host_headers)
+        for record in self.cookies + self.headers:
+            size += sys.getsizeof(record) + sum(sys.getsizeof(item) for item in record)
+        for host, headers in self.host_headers:
+            size += sys.getsizeof(host) + sys.getsizeof(headers)
+            for record in headers:
+                size += sys.getsizeof(record) + sum(sys.getsizeof(item) for item in record)
+        return size
+
+
+class SessionStore:
+    """
+    有容量上限的会话状态存储
+
+    会话状态平时以 :class:`SessionState` 的形式保存；通过 :meth:`acquire` 或 :meth:`async_acquire` 使用时，
+    才会基于共享连接池创建真实的会话，并在超过空闲时长后由 :meth:`compact` 释放。超过容量时淘汰最久未使用的会话状态。
+    :meth:`put` 每隔半个空闲时长会顺带调用一次 :meth:`compact`，已过期的会话状态在取得时即被移除。
+
+    >>> store = SessionStore(max_size=50000, idle_timeout=300)
+    >>> store.put(student_id, session)
+    >>> with store.acquire(student_id) as session:
+    ...     get_score(session)
+    >>> store.compact()
+    """
+
+    def __init__(self, pool: Optional[SharedConnectionPool] = None, max_size: int = 10000,
+                 idle_timeout: float = 300.0):
+        """
+        :param pool: 还原会话所用的共享连接池，为 :obj:`None` 时新建一个
+        :type pool: Optional[SharedConnectionPool]
+        :param max_size: 最多保存的会话状态数量
+        :type max_size: int, optional
+        :param idle_timeout: 真实会话空闲多久（秒）后释放为紧凑形式
+        :type idle_timeout: float, optional
+        """
+        self.pool = pool if pool is not None else SharedConnectionPool()
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._states: 'OrderedDict[Hashable, SessionState]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._next_compact: float = monotonic() + idle_timeout / 2
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._states
+
+    def put(self, key: Hashable, client: Any, expires_at: Optional[float] = None) -> SessionState:
+        """
+        记录会话的状态，记录后该会话本身可以关闭
+
+        :param key: 用户标识
+        :type key: Hashable
+        :param client: 会话
+        :param expires_at: 会话过期的时间戳，为 :obj:`None` 时不过期
+        :type expires_at: Optional[float]
+        :return: 会话状态
+        :rtype: SessionState
+        """
+        state = SessionState.from_client(client, expires_at)
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_size:
+                self._states.popitem(last=False)
+        if monotonic() >= self._next_compact:
+            self.compact()
+        return state
+
+    def get(self, key: Hashable) -> Optional[SessionState]:
+        """
+        获取用户的会话状态，不存在或已过期时返回 :obj:`None`
+        """
+        state = self._states.get(key)
+        if state is not None and state.expired:
+            self._discard_expired(key, state)
+            return None
+        return state
+
+    def _discard_expired(self, key: Hashable, state: SessionState) -> None:
+        with self._lock:
+            if self._states.get(key) is state and not state._users:
+                del self._states[key]
+
+    def remove(self, key: Hashable) -> None:
+        """
+        移除用户的会话状态
+        """
+        with self._lock:
+            self._states.pop(key, None)
+
+    def _checkout(self, key: Hashable, is_async: bool) -> Tuple[SessionState, Any]:
+        with self._lock:
+            state = self._states[key]
+            if state.expired:
+                self._discard_expired(key, state)
+                raise KeyError(key)
+            self._states.move_to_end(key)
+            client = state._client
+            if client is not None and isinstance(client, Session) == is_async:
+                if state._users:
+                    # 另一种会话正在使用中，另外还原一个不由此状态持有的会话，归还时再合并其变化
+                    state._users += 1
+                    return state, state.restore(self.pool.async_client() if is_async else self.pool.session())
+                # 已持有另一种会话时，先记录其状态并释放，再重新还原
+                state.capture(client)
+                _release(client)
+                client = None
+            if client is None:
+                client = state.restore(self.pool.async_client() if is_async else self.pool.session())
+                state._client = client
+            state._users += 1
+            return state, client
+
+    def _checkin(self, state: SessionState, client: Any) -> None:
+        with self._lock:
+            state._users -= 1
+            state.last_used = monotonic()
+            state.capture(client)
+            if state._client is not client:
+                # 将临时会话的变化写入仍在使用的会话，以免其归还时覆盖这些变化
+                if state._client is not None:
+                    state.restore(state._client)
+                _release(client)
+
+    @contextmanager
+    def acquire(self, key: Hashable) -> Iterator[Session]:
+        """
+        取得用户的同步会话，退出时记录会话状态的变化
+
+        :param key: 用户标识
+        :type key: Hashable
+        :raises KeyError: 用户的会话状态不存在或已过期时抛出
+        :return: 会话
+        :rtype: Session
+        """
+        state, client = self._checkout(key, False)
+        try:
+            yield client
+        finally:
+            self._checkin(state, client)
+
+    @asynccontextmanager
+    async def async_acquire(self, key: Hashable) -> AsyncIterator[Any]:
+        """
+        取得用户的异步客户端，退出时记录会话状态的变化
+
+        :param key: 用户标识
+        :type key: Hashable
+        :raises KeyError: 用户的会话状态不存在或已过期时抛出
+        :return: 异步客户端
+        :rtype: httpx.AsyncClient
+        """
+        state, client = self._checkout(key, True)
+        try:
+            yield client
+        finally:
+            self._checkin(state, client)
+
+    def compact(self, idle_timeout: Optional[float] = None) -> int:
+        """
+        释放空闲超过指定时长的真实会话，并移除已过期的会话状态
+
+        :param idle_timeout: 空闲时长（秒），为 :obj:`None` 时使用创建时指定的值
+        :type idle_timeout: Optional[float]
+        :return: 释放的真实会话数量
+        :rtype: int
+        """
+        idle_timeout = self.idle_timeout if idle_timeout is None else idle_timeout
+        now = monotonic()
+        deadline = now - idle_timeout
+        self._next_compact = now + self.idle_timeout / 2
+        released = 0
+        with self._lock:
+            for key, state in list(self._states.items()):
+                if state._users:
+                    continue
+                if state.expired:
+                    del self._states[key]
+                elif state._client is not None and state.last_used <= deadline:
+                    state.capture(state._client)
+                    _release(state._client)
+                    state._client = None
+                    released += 1
+        return released
+
+    def memory_usage(self, key: Hashable) -> int:
+        """
+        估计用户的会话占用的内存（字节），持有真实会话时包含真实会话的估计占用
+
+        :param key: 用户标识
+        :type key: Hashable
+        :raises KeyError: 用户的会话状态不存在时抛出
+        :return: 字节数
+        :rtype: int
+        """
+        state = self._states[key]
+        size = state.memory_usage()
+        client = state._client
+        if client is not None:
+            # 共享的连接池不计入单个用户
+            pool = self.pool
+            shared = {id(pool), id(pool._adapter), id(pool._stateless_session), id(pool._stateless_async_client),
+                      *map(id, pool.transports())}
+            size += _deep_sizeof(client, shared)
+        return size
+
+
+def _release(client: Any) -> None:
+    if isinstance(client, Session):
+        client.close()
+    # 异步客户端使用共享连接池，无需关闭
+
+
+def _deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += _deep_sizeof(vars(obj), seen)
+    return size
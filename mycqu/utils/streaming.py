@@ -0,0 +1,130 @@
+"""
+增量解析较大的 json 响应
+"""
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Iterator, List, Sequence, Tuple
+
+from ..exception import MycquUnauthorized, ParseError
+from .request_transformer import Request
+
+__all__ = ['stream_items', 'async_stream_items']
+
+_CHUNK_SIZE = 65536
+
+
+def _ijson():
+    try:
+        import ijson
+    except ImportError:
+        raise ImportError(  # pylint: ignore disable=raise-missing-from
+            "Please install ijson to use stream_items and async_stream_items")
+    return ijson
+
+
+class _Sink:
+    __slots__ = ('items', 'prefix')
+
+    def __init__(self, items: List[Tuple[str, Any]], prefix: str):
+        self.items = items
+        self.prefix = prefix
+
+    def send(self, value: Any) -> None:
+        self.items.append((self.prefix, value))
+
+
+class _ItemParser:
+    """
+    将分块的响应内容依次送入 ijson，收集各前缀下已完整解析的元素
+    """
+
+    def __init__(self, prefixes: Sequence[str]):
+        self._ijson = _ijson()
+        self._items: List[Tuple[str, Any]] = []
+        self._coros = [self._ijson.items_coro(_Sink(self._items, prefix), prefix, use_float=True)
+                       for prefix in prefixes]
+
+    def _drain(self) -> List[Tuple[str, Any]]:
+        items = self._items[:]
+        del self._items[:]
+        return items
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Any]]:
+        try:
+            for coro in self._coros:
+                coro.send(chunk)
+        except self._ijson.JSONError as e:
+            raise ParseError(str(e)) from e
+        return self._drain()
+
+    def close(self) -> List[Tuple[str, Any]]:
+        try:
+            for coro in self._coros:
+                coro.close()
+        except self._ijson.JSONError as e:
+            raise ParseError(str(e)) from e
+        return self._drain()
+
+
+def stream_items(session: Request, method: str, url: str, prefixes: Sequence[str],
+                 **kwargs) -> Iterator[Tuple[str, Any]]:
+    """
+    发出请求并边接收边解析响应，逐个返回位于给定前缀下的 json 元素，内存占用与单个元素而不是整个响应相当
+
+    前缀为 ijson 的格式，如 ``"classTimetableVOList.item"`` 表示 ``classTimetableVOList`` 列表中的每一项；
+    数字解析为 :class:`int` 或 :class:`float`。
+
+    >>> for prefix, data in stream_items(session, "POST", url, ("classTimetableVOList.item",), json=[code]):
+    ...     print(data["courseName"])
+
+    :param session: requests 会话或 :class:`.utils.clients.TokenClient`
+    :type session: Request
+    :param method: 请求方法
+    :type method: str
+    :param url: 请求 url
+    :type url: str
+    :param prefixes: 需要返回的元素的前缀
+    :type prefixes: Sequence[str]
+    :param kwargs: 其他请求参数，如 ``params``、``json``
+    :raises MycquUnauthorized: 响应状态码为 401 时抛出
+    :raises ParseError: 响应不是合法的 json 时抛出
+    :return: (前缀, 元素) 的迭代器
+    :rtype: Iterator[Tuple[str, Any]]
+    """
+    parser = _ItemParser(prefixes)
+    with session.request(method, url, stream=True, **kwargs) as res:
+        if res.status_code == 401:
+            raise MycquUnauthorized()
+        for chunk in res.iter_content(_CHUNK_SIZE):
+            yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def async_stream_items(session: Request, method: str, url: str, prefixes: Sequence[str],
+                             **kwargs) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    异步的发出请求并边接收边解析响应，参见 :func:`stream_items`
+
+    :param session: httpx 异步客户端或 :class:`.utils.clients.AsyncTokenClient`
+    :type session: Request
+    :param method: 请求方法
+    :type method: str
+    :param url: 请求 url
+    :type url: str
+    :param prefixes: 需要返回的元素的前缀
+    :type prefixes: Sequence[str]
+    :param kwargs: 其他请求参数，如 ``params``、``json``
+    :raises MycquUnauthorized: 响应状态码为 401 时抛出
+    :raises ParseError: 响应不是合法的 json 时抛出
+    :return: (前缀, 元素) 的异步迭代器
+    :rtype: AsyncIterator[Tuple[str, Any]]
+    """
+    parser = _ItemParser(prefixes)
+    async with session.stream(method, url, **kwargs) as res:
+        if res.status_code == 401:
+            raise MycquUnauthorized()
+        async for chunk in res.aiter_bytes(_CHUNK_SIZE):
+            for item in parser.feed(chunk):
+                yield item
+    for item in parser.close():
+        yield item
@@ -0,0 +1,51 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """
+    以 json 返回请求的路径与请求头；路径为 ``/status/<code>`` 时返回对应状态码，
+    为 ``/auth/<token>`` 时若 ``Authorization`` 请求头不为 ``Bearer <token>`` 则返回 401
+    """
+    # 保持连接，以便检查连接在事件循环之间的复用
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        status = 200
+        if self.path.startswith('/status/'):
+            status = int(self.path.rsplit('/', 1)[1])
+        elif self.path.startswith('/auth/'):
+            status = 200 if self.headers.get('Authorization') == 'Bearer ' + self.path.rsplit('/', 1)[1] else 401
+        body = json.dumps({'path': self.path, 'headers': dict(self.headers)}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope='session')
+def server_port():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def server_url(server_port):
+    return f'http://127.0.0.1:{server_port}'
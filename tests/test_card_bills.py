@@ -0,0 +1,36 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from mycqu.card.models import Card
+from mycqu.card.tools import BILL_PAGE_SIZE
+
+TOTAL = BILL_PAGE_SIZE * 2 + 30
+
+
+def _page(data) -> bytes:
+    page, size = int(data['page']), int(data['row'])
+    rows = [{'tranName': '消费', 'tranDt': '2021-06-01 12:00:00', 'mchAcctName': '食堂', 'tranAmt': -i,
+             'acctAmt': 10000} for i in range((page - 1) * size, min(page * size, TOTAL))]
+    return json.dumps({'rows': rows}).encode()
+
+
+class _BillSession:
+    def request(self, method, url, data=None, **kwargs):
+        return SimpleNamespace(status_code=200, content=_page(data))
+
+
+class _AsyncBillSession:
+    async def request(self, method, url, data=None, **kwargs):
+        await asyncio.sleep(0)
+        return SimpleNamespace(status_code=200, content=_page(data))
+
+
+def test_fetch_bills_returns_every_page():
+    bills = Card(id='1', amount=0).fetch_bills(_BillSession())
+    assert [bill.tran_amount for bill in bills] == [-i / 100 for i in range(TOTAL)]
+
+
+def test_async_fetch_bills_returns_every_page():
+    bills = asyncio.run(Card(id='1', amount=0).async_fetch_bills(_AsyncBillSession()))
+    assert [bill.tran_amount for bill in bills] == [-i / 100 for i in range(TOTAL)]
@@ -0,0 +1,53 @@
+import asyncio
+
+from mycqu.utils.clients import SharedConnectionPool, AsyncTokenClient, anonymous_async_client
+from mycqu.utils.streaming import async_stream_items
+
+
+def _run_twice(make_coroutine):
+    # 每次 asyncio.run 都会创建并关闭一个新的事件循环
+    return [asyncio.run(make_coroutine()) for _ in range(2)]
+
+
+def test_anonymous_async_client_survives_a_new_event_loop(server_url):
+    async def fetch():
+        res = await anonymous_async_client().get(server_url + '/api')
+        return res.status_code
+
+    assert _run_twice(fetch) == [200, 200]
+
+
+def test_pool_async_client_created_outside_a_loop(server_url):
+    pool = SharedConnectionPool()
+    client = pool.async_client()
+
+    async def fetch():
+        res = await client.get(server_url + '/api')
+        return res.status_code
+
+    assert _run_twice(fetch) == [200, 200]
+    # 已关闭的事件循环中的连接在新的事件循环首次使用时被丢弃
+    assert len(pool.transports()) == 1
+
+
+def test_pool_aclose_only_closes_the_current_loop(server_url):
+    pool = SharedConnectionPool()
+
+    async def fetch_and_close():
+        res = await pool.stateless_async_client().get(server_url + '/api')
+        await pool.aclose()
+        return res.status_code
+
+    assert _run_twice(fetch_and_close) == [200, 200]
+    assert pool.transports() == []
+
+
+def test_async_token_client_survives_a_new_event_loop(server_url):
+    client = AsyncTokenClient('Bearer token', pool=SharedConnectionPool())
+
+    async def fetch():
+        res = await client.get(server_url + '/auth/token')
+        streamed = [item async for item in async_stream_items(client, 'GET', server_url + '/auth/token', ('path',))]
+        return res.status_code, streamed
+
+    assert _run_twice(fetch) == [(200, [('path', '/auth/token')])] * 2
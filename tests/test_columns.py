@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from mycqu.card.models import Bill
+from mycqu.exam import Exam
+from mycqu.utils.columns import Categorical, to_columns, from_columns
+from mycqu.utils.records import is_record, record_mode, to_record
+
+from test_exam_cache import _exam
+
+
+def _exams():
+    exams = [Exam.from_dict(_exam('A1', room='101', seat=1)), Exam.from_dict(_exam('B2', room='202', seat=2)),
+             Exam.from_dict(dict(_exam('C3', room='101', seat=3), floorNum=None, session=None))]
+    return exams
+
+
+def _bills():
+    return [Bill.from_dict({'tranName': '消费', 'tranDt': f'2021-06-0{day} 12:30:00', 'mchAcctName': place,
+                            'tranAmt': -amount, 'acctAmt': 10000})
+            for day, place, amount in ((1, '食堂', 1200), (2, '超市', 350), (3, '食堂', 800))]
+
+
+def test_column_types():
+    columns = to_columns(_exams())
+    assert columns['seat_num'].dtype == np.int64 and columns['seat_num'].tolist() == [1, 2, 3]
+    # 含 None 的整数列为 float64，None 为 nan
+    assert columns['floor'].dtype == np.float64 and np.isnan(columns['floor'][2])
+    assert isinstance(columns['room'], Categorical)
+    assert columns['room'].codes.tolist() == [0, 1, 0] and columns['room'].categories.tolist() == ['101', '202']
+    assert columns['date'].dtype == np.dtype('datetime64[D]')
+    # 可为 None 的嵌套模型另有一列标记其是否存在
+    assert columns['course.session'].tolist() == [True, True, False]
+    assert columns['course.session.year'][:2].tolist() == [2021, 2021]
+
+
+def test_categorical_supports_grouping():
+    columns = to_columns(_bills())
+    totals = np.bincount(columns['place'].codes, weights=columns['tran_amount'])
+    assert dict(zip(columns['place'].categories.tolist(), totals.tolist())) == {'食堂': -20.0, '超市': -3.5}
+    assert columns['place'].decode() == ['食堂', '超市', '食堂']
+
+
+@pytest.mark.parametrize('items, model', [(_exams(), Exam), (_bills(), Bill)], ids=['exam', 'bill'])
+def test_round_trip(items, model):
+    assert from_columns(to_columns(items), model) == items
+
+
+def test_bill_datetimes_keep_timezone():
+    bills = _bills()
+    restored = from_columns(to_columns(bills), Bill)
+    assert [bill.date for bill in restored] == [bill.date for bill in bills]
+    assert all(bill.date.utcoffset() == bills[0].date.utcoffset() for bill in restored)
+
+
+def test_records_and_record_mode():
+    exams = _exams()
+    records = [to_record(exam) for exam in exams]
+    columns = to_columns(records)
+    assert columns['room'].decode() == ['101', '202', '101']
+    with record_mode():
+        restored = from_columns(columns, Exam)
+    assert all(is_record(record) for record in restored)
+    assert [record.to_model() for record in restored] == exams
+
+
+def test_empty_items_require_model():
+    with pytest.raises(ValueError):
+        to_columns([])
+    assert from_columns(to_columns([], Bill), Bill) == []
@@ -0,0 +1,58 @@
+"""
+免校验构造模式与默认的校验模式应构造出相同的对象
+"""
+import pytest
+
+from mycqu.card.models import EnergyFees
+from mycqu.course import CourseTimetable
+from mycqu.enroll.models import EnrollCourseItem
+from mycqu.exam import Exam
+from mycqu.utils.construct import trusted_construction
+
+EXAM = {
+    'courseName': '高等数学', 'courseCode': 'MATH10001', 'batchName': '集中考试周', 'batchId': '12',
+    'buildingName': 'D区', 'roomName': 'D1144', 'floorNum': '3', 'examDate': '2021-06-21',
+    'startTime': '09:00', 'endTime': '11:00', 'week': '17', 'weekDay': '1', 'studentId': '20200001',
+    'seatNum': '8', 'examStuNum': '60',
+    'simpleChiefinvigilatorVOS': [{'instructor': '张三', 'instDeptShortName': '数统'}],
+    'simpleAssistantInviVOS': None,
+}
+
+TIMETABLE = {
+    'courseName': '高等数学', 'courseCode': 'MATH10001', 'credit': '5', 'selectedStuNum': '60',
+    'position': 'D1144', 'teachingWeekFormat': '1-16', 'weekDayFormat': '一', 'periodFormat': '1-2',
+    'wholeWeekOccupy': 0, 'roomName': 'D1144', 'exprProjectName': None,
+}
+
+ENROLL_ITEM = {
+    'courseName': '高等数学', 'courseCode': 'MATH10001', 'id': 'c1', 'sessionId': '1', 'checked': 0,
+    'courseId': 'x', 'classType': '理论', 'selectedNum': '30', 'stuCapacity': '60', 'childrenList': None,
+    'campusShortName': 'D区', 'parentClassId': None, 'classTime': '1-16周 星期一 1-2小节 &D1144',
+}
+
+CASES = [
+    pytest.param(lambda: Exam.from_dict(EXAM), id='exam'),
+    pytest.param(lambda: Exam.from_dict({**EXAM, 'floorNum': 'null'}), id='exam-no-floor'),
+    pytest.param(lambda: CourseTimetable.from_dict(TIMETABLE), id='course-timetable'),
+    pytest.param(lambda: EnrollCourseItem.from_dict(ENROLL_ITEM), id='enroll-course-item'),
+    pytest.param(lambda: EnergyFees.from_dict({'剩余金额': '12.5', '电剩余补助': '1', '水剩余补助': None}, True),
+                 id='energy-fees-huxi'),
+    pytest.param(lambda: EnergyFees.from_dict({'现金余额': '12.5', '补贴余额': '3'}, False), id='energy-fees'),
+]
+
+
+@pytest.mark.parametrize('build', CASES)
+def test_trusted_construction_matches_validation(build):
+    validated = build()
+    with trusted_construction():
+        trusted = build()
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    for name, value in validated.model_dump().items():
+        assert type(getattr(trusted, name)) is type(getattr(validated, name)), name
+
+
+def test_exam_floor_is_an_int():
+    with trusted_construction():
+        assert Exam.from_dict(EXAM).floor == 3
+    assert Exam.from_dict({**EXAM, 'floorNum': None}).floor is None
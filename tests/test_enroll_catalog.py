@@ -0,0 +1,93 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from mycqu.enroll import EnrollCatalog
+from mycqu.exception import MycquUnauthorized
+
+from test_record_mode import _item
+
+
+def _info(course_id: str, code: str, category: str = '专业课') -> dict:
+    return {'id': course_id, 'name': code, 'codeR': code, 'departmentName': None, 'credit': 2,
+            'courseCategory': category, 'selectionArea': '主修', 'courseEnrollSign': None, 'courseNature': '必修',
+            'campusShortNameSet': ['A区']}
+
+
+class _CatalogSession:
+    """
+    选课列表包含 ``courses`` 中的课程；``failures`` 为各课程详情前若干次请求失败的次数，
+    ``unauthorized`` 中的课程详情返回 401
+    """
+
+    def __init__(self, failures=None, unauthorized=()):
+        self.courses = [_info('c1', 'A1'), _info('c2', 'B2', category='公共基础课'), _info('c3', 'A1')]
+        self.failures = dict(failures or {})
+        self.unauthorized = set(unauthorized)
+        self.attempts = {}
+
+    def _respond(self, url):
+        if 'course-list' in url:
+            body = {'status': 'success', 'data': [{'selectionArea': '主修', 'courseVOList': self.courses}]}
+            return SimpleNamespace(status_code=200, content=json.dumps(body).encode())
+        course_id = url.rsplit('/', 1)[1].split('?')[0]
+        self.attempts[course_id] = self.attempts.get(course_id, 0) + 1
+        if course_id in self.unauthorized:
+            return SimpleNamespace(status_code=401, content=b'<html>401</html>')
+        if self.attempts[course_id] <= self.failures.get(course_id, 0):
+            return SimpleNamespace(status_code=502, content=b'<html>bad gateway</html>')
+        child = dict(_item(course_id + '-lab', 0), campusShortName='B区', instructorName='王五')
+        item = dict(_item(course_id + '-1', 0), instructorName='张三, 李四', childrenList=[child])
+        body = {'selectCourseListVOs': [{'selectCourseVOList': [item]}]}
+        return SimpleNamespace(status_code=200, content=json.dumps(body).encode())
+
+    def request(self, method, url, **kwargs):
+        return self._respond(url)
+
+
+class _AsyncCatalogSession(_CatalogSession):
+    async def request(self, method, url, **kwargs):
+        await asyncio.sleep(0)
+        return self._respond(url)
+
+
+def _fetch(session, **kwargs):
+    if isinstance(session, _AsyncCatalogSession):
+        return asyncio.run(EnrollCatalog.async_fetch_full(session, retry_delay=0, **kwargs))
+    return EnrollCatalog.fetch_full(session, retry_delay=0, **kwargs)
+
+
+@pytest.fixture(params=[_CatalogSession, _AsyncCatalogSession], ids=['sync', 'async'])
+def session_type(request):
+    return request.param
+
+
+def test_failed_details_are_retried(session_type):
+    session = session_type(failures={'c1': 2, 'c2': 5})
+    catalog = _fetch(session, retries=2)
+    assert session.attempts == {'c1': 3, 'c2': 3, 'c3': 1}
+    assert catalog.failed == ['c2']
+    assert [item.id for item in catalog.items_of('c1')] == ['c1-1']
+    assert catalog.items_of('c2') == []
+
+
+def test_unauthorized_is_raised_without_retrying(session_type):
+    session = session_type(unauthorized={'c2'})
+    with pytest.raises(MycquUnauthorized):
+        _fetch(session, retries=2)
+    assert session.attempts['c2'] == 1
+
+
+def test_catalog_indexes(session_type):
+    catalog = _fetch(session_type())
+    assert catalog.get('c2').category == '公共基础课'
+    assert [info.id for info in catalog.find_by_code('A1')] == ['c1', 'c3']
+    assert [info.id for info in catalog.find_by_category('专业课')] == ['c1', 'c3']
+    # 从属课程按自身的校区与教师编入索引
+    assert [item.id for item in catalog.find_by_campus('A区')] == ['c1-1', 'c2-1', 'c3-1']
+    assert [item.id for item in catalog.find_by_campus('B区')] == ['c1-lab', 'c2-lab', 'c3-lab']
+    assert [item.id for item in catalog.find_by_instructor('李四')] == ['c1-1', 'c2-1', 'c3-1']
+    assert [item.id for item in catalog.find_by_instructor('王五')] == ['c1-lab', 'c2-lab', 'c3-lab']
+    assert catalog.find_by_instructor('赵六') == []
@@ -0,0 +1,58 @@
+from mycqu.course import CourseTimetable
+from mycqu.enroll import EnrollCourseItem
+from mycqu.enroll.conflict import ConflictChecker
+
+from test_record_mode import _item
+
+
+def _timetable(code: str, weeks: str = '1-8', weekday: str = '一', periods: str = '1-2',
+               whole_week: bool = False) -> CourseTimetable:
+    data = {'courseName': code, 'courseCode': code, 'wholeWeekOccupy': whole_week, 'roomName': 'A101',
+            'exprProjectName': None, 'teachingWeekFormat': weeks}
+    if not whole_week:
+        data.update(weekDayFormat=weekday, periodFormat=periods)
+    return CourseTimetable.from_dict(data)
+
+
+def _enroll_item(item_id: str, time, children=()) -> EnrollCourseItem:
+    data = _item(item_id, 0, time=time)
+    data['childrenList'] = [_item(child_id, 0, time=child_time) for child_id, child_time in children] or None
+    return EnrollCourseItem.from_dict(data)
+
+
+def test_overlapping_weeks_and_periods_conflict():
+    checker = ConflictChecker([_timetable('B1', weeks='1-8', periods='1-2'), _timetable('B2', weeks='5-12')])
+    item = _enroll_item('1', '7-10周 星期一 2-3小节 &A101')
+    [conflicts] = checker.check([item])
+    assert [(conflict.timetable.course.code, conflict.weeks) for conflict in conflicts] == \
+        [('B1', [7, 8]), ('B2', [7, 8, 9, 10])]
+    assert all(conflict.item is item and conflict.part is item for conflict in conflicts)
+
+
+def test_adjacent_periods_and_other_weekdays_do_not_conflict():
+    checker = ConflictChecker([_timetable('B1', periods='1-2')])
+    items = [_enroll_item('1', '1-8周 星期一 3-4小节 &A101'), _enroll_item('2', '1-8周 星期二 1-2小节 &A101'),
+             _enroll_item('3', '9-16周 星期一 1-2小节 &A101'), _enroll_item('4', None)]
+    assert checker.check(items) == [[], [], [], []]
+    assert checker.free(items) == items
+
+
+def test_child_item_conflict_is_reported_on_its_parent():
+    checker = ConflictChecker([_timetable('B1', weekday='三', periods='5-6')])
+    item = _enroll_item('1', '1-8周 星期一 1-2小节 &A101', children=[('1-lab', '3周 星期三 6小节 &L1')])
+    [[conflict]] = checker.check([item])
+    assert conflict.item is item and conflict.part.id == '1-lab' and conflict.weeks == [3]
+    assert checker.free([item]) == []
+
+
+def test_whole_week_timetable_occupies_every_day():
+    checker = ConflictChecker([_timetable('Practice', weeks='2', whole_week=True)])
+    [conflicts, free] = checker.check([_enroll_item('1', '1-3周 星期日 11-12小节 &A101'),
+                                       _enroll_item('2', '3周 星期日 11-12小节 &A101')])
+    assert [conflict.weeks for conflict in conflicts] == [[2]] and free == []
+
+
+def test_weeks_and_periods_beyond_the_bitmap_are_ignored():
+    checker = ConflictChecker([_timetable('B1', weeks='1-30', periods='1-2')], weeks=20)
+    [conflicts] = checker.check([_enroll_item('1', '18-30周 星期一 1-2小节 &A101')])
+    assert [conflict.weeks for conflict in conflicts] == [[18, 19, 20]]
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import pytest
+
+from mycqu.enroll.monitor import EnrollMonitor
+
+
+class _FlakyMonitor(EnrollMonitor):
+    """
+    课程 ``bad`` 的每次轮询都失败，其他课程每次轮询都产生一个事件
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__('Bearer token', min_interval=0.01, max_interval=0.01, jitter=0, **kwargs)
+        self.polls = {}
+
+    async def poll(self, course_id):
+        self.polls[course_id] = self.polls.get(course_id, 0) + 1
+        if course_id == 'bad':
+            raise ConnectionError('network down')
+        self._schedule(self._courses[course_id])
+        return [course_id]
+
+
+async def _take(stream, count):
+    results = []
+    async for item in stream:
+        results.append(item)
+        if len(results) == count:
+            break
+    return results
+
+
+def test_monitor_runs_under_several_event_loops():
+    # 在事件循环之外创建，先后在两个事件循环中使用
+    monitor = _FlakyMonitor()
+    monitor.watch('user', 'good')
+    assert asyncio.run(_take(monitor.events(), 2)) == ['good', 'good']
+    assert asyncio.run(_take(monitor.events(), 2)) == ['good', 'good']
+
+
+def test_watch_wakes_up_a_waiting_stream():
+    monitor = _FlakyMonitor()
+
+    async def main():
+        stream = asyncio.ensure_future(_take(monitor.events(), 1))
+        await asyncio.sleep(0.05)
+        monitor.watch('user', 'good')
+        return await asyncio.wait_for(stream, 1)
+
+    assert asyncio.run(main()) == ['good']
+
+
+def test_failing_course_is_logged_and_retried_later(caplog):
+    monitor = _FlakyMonitor()
+    monitor.watch('user', 'bad')
+    monitor.watch('user', 'good')
+    with caplog.at_level(logging.WARNING, logger='mycqu.enroll.monitor'):
+        assert asyncio.run(_take(monitor.events(), 5)) == ['good'] * 5
+    assert any('bad' in record.getMessage() for record in caplog.records)
+    # 出错的课程按轮询间隔重试，而不是每次循环都立即重试
+    assert monitor.polls['bad'] <= monitor.polls['good'] + 1
+
+
+def test_on_error_can_stop_the_stream():
+    monitor = _FlakyMonitor()
+    monitor.watch('user', 'bad')
+
+    def on_error(course_id, e):
+        raise RuntimeError(f'stop at {course_id}')
+
+    with pytest.raises(RuntimeError, match='stop at bad'):
+        asyncio.run(_take(monitor.events(on_error=on_error), 1))
@@ -0,0 +1,24 @@
+from mycqu.course import CourseDayTime
+from mycqu.enroll.models.enroll_course_timetable import EnrollCourseTimetable
+from mycqu.utils.period import Period
+
+
+def test_from_str_parses_every_part():
+    result = EnrollCourseTimetable.from_str('1-5,7-9周 星期二 6-7小节 &D1144 ;1-5,7-9周 星期五 10-12小节 &D1143 ')
+    weeks = [Period(start=1, end=5), Period(start=7, end=9)]
+    assert result == [
+        EnrollCourseTimetable(weeks=weeks, time=CourseDayTime(weekday=1, period=Period(start=6, end=7)), pos='D1144'),
+        EnrollCourseTimetable(weeks=weeks, time=CourseDayTime(weekday=4, period=Period(start=10, end=12)),
+                              pos='D1143'),
+    ]
+
+
+def test_from_str_without_time_or_position():
+    assert EnrollCourseTimetable.from_str('3周') == [EnrollCourseTimetable(weeks=[Period(start=3, end=3)])]
+
+
+def test_from_str_returns_fresh_objects():
+    first = EnrollCourseTimetable.from_str('1-5周 星期一 1-2小节 &A101')
+    second = EnrollCourseTimetable.from_str('1-5周 星期一 1-2小节 &A101')
+    assert first == second
+    assert first[0] is not second[0] and first[0].weeks is not second[0].weeks
@@ -0,0 +1,73 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from mycqu.exam import cache as exam_cache
+from mycqu.exam.cache import ExamCache
+
+
+def _exam(code: str, room: str = '101', seat: int = 1, day: str = '2099-01-10') -> dict:
+    return {
+        'courseName': '课程', 'courseCode': code, 'session': '2021春', 'batchName': '期末', 'batchId': 1,
+        'buildingName': 'A区', 'roomName': room, 'floorNum': 1, 'examDate': day, 'startTime': '09:00',
+        'endTime': '11:00', 'week': 18, 'weekDay': 1, 'studentId': '20200001', 'seatNum': seat,
+        'examStuNum': 30, 'simpleChiefinvigilatorVOS': None, 'simpleAssistantInviVOS': None,
+    }
+
+
+class _ExamSession:
+    """
+    返回 ``exams`` 中当前考表的会话
+    """
+    def __init__(self, *exams: dict):
+        self.exams = list(exams)
+
+    def request(self, method, url, **kwargs):
+        return SimpleNamespace(status_code=200, content=json.dumps({'data': self.exams}).encode())
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    calls = []
+    decode = exam_cache.decode_payload
+
+    def counting(content, schema):
+        calls.append(content)
+        return decode(content, schema)
+
+    monkeypatch.setattr(exam_cache, 'decode_payload', counting)
+    return calls
+
+
+def test_unchanged_content_skips_parsing(decodes):
+    cache = ExamCache()
+    session = _ExamSession(_exam('A1'))
+    first = cache.refresh('20200001', session, force=True)
+    assert [exam.course.code for exam in first.added] == ['A1']
+    assert not cache.refresh('20200001', session, force=True)
+    assert len(decodes) == 1
+
+
+def test_seat_and_room_changes_are_reported(decodes):
+    cache = ExamCache()
+    session = _ExamSession(_exam('A1'), _exam('B2'))
+    cache.refresh('20200001', session, force=True)
+
+    session.exams = [_exam('A1', room='202', seat=7), _exam('B2'), _exam('C3')]
+    changes = cache.refresh('20200001', session, force=True)
+    assert [(old.room, old.seat_num, new.room, new.seat_num) for old, new in changes.changed] == \
+        [('101', 1, '202', 7)]
+    assert [exam.course.code for exam in changes.added] == ['C3']
+    assert not changes.removed
+    assert len(decodes) == 2
+
+
+def test_least_recently_refreshed_students_are_evicted():
+    cache = ExamCache(max_size=2)
+    session = _ExamSession(_exam('A1'))
+    for student_id in ('1', '2', '1', '3'):
+        cache.refresh(student_id, session, force=True)
+    assert len(cache) == 2
+    assert cache.get_cached('2') is None
+    assert cache.get_cached('1') is not None and cache.get_cached('3') is not None
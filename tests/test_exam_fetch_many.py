@@ -0,0 +1,90 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from mycqu._lib_wrapper.encrypt import aes_ecb_encryptor, pad16
+from mycqu.exam import Exam
+from mycqu.exam import tools as exam_tools
+from mycqu.exam.tools import _encrypt_student_ids
+
+from test_exam_cache import _exam
+
+STUDENT_IDS = ['20200001', '20200002', '20200003', '20200004', '20200005']
+
+
+def _expected(student_id: str) -> str:
+    return aes_ecb_encryptor('cquisse123456789'.encode())(pad16(student_id.encode())).hex().upper()
+
+
+def _content(encrypted_id: str) -> bytes:
+    student_id = {_encrypt_student_ids([sid])[0]: sid for sid in STUDENT_IDS}[encrypted_id]
+    return json.dumps({'data': [_exam(student_id)]}).encode()
+
+
+class _ExamSession:
+    """
+    按加密后的学号返回以学号为课程代码的考表，并记录同时进行的请求数量
+    """
+    def __init__(self):
+        self.requested = []
+        self.active = self.peak = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, **kwargs):
+        with self._lock:
+            self.requested.append(params['studentId'])
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return SimpleNamespace(status_code=200, content=_content(params['studentId']))
+
+
+class _AsyncExamSession(_ExamSession):
+    async def request(self, method, url, params=None, **kwargs):
+        self.requested.append(params['studentId'])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(status_code=200, content=_content(params['studentId']))
+
+
+def test_batched_encryption_matches_single_encryption():
+    exam_tools._encrypted_ids.clear()
+    assert _encrypt_student_ids(STUDENT_IDS + STUDENT_IDS[:2]) == \
+        [_expected(sid) for sid in STUDENT_IDS + STUDENT_IDS[:2]]
+    # 再次加密时全部命中缓存
+    assert _encrypt_student_ids(reversed(STUDENT_IDS)) == [_expected(sid) for sid in reversed(STUDENT_IDS)]
+
+
+def test_encryption_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(exam_tools, '_ENCRYPTED_ID_CACHE_SIZE', 2)
+    exam_tools._encrypted_ids.clear()
+    assert _encrypt_student_ids(STUDENT_IDS) == [_expected(sid) for sid in STUDENT_IDS]
+    assert list(exam_tools._encrypted_ids) == STUDENT_IDS[-2:]
+
+
+def test_fetch_many_returns_every_student_once_within_concurrency():
+    session = _ExamSession()
+    result = dict(Exam.fetch_many(STUDENT_IDS + STUDENT_IDS[:1], session, concurrency=2))
+    assert {sid: [exam.course.code for exam in exams] for sid, exams in result.items()} == \
+        {sid: [sid] for sid in STUDENT_IDS}
+    assert len(session.requested) == len(STUDENT_IDS)
+    assert session.peak <= 2
+
+
+def test_async_fetch_many_returns_every_student_once_within_concurrency():
+    session = _AsyncExamSession()
+
+    async def main():
+        return {sid: exams async for sid, exams in Exam.async_fetch_many(STUDENT_IDS, session, concurrency=2)}
+
+    result = asyncio.run(main())
+    assert {sid: [exam.course.code for exam in exams] for sid, exams in result.items()} == \
+        {sid: [sid] for sid in STUDENT_IDS}
+    assert len(session.requested) == len(STUDENT_IDS)
+    assert session.peak <= 2
@@ -0,0 +1,67 @@
+import pytest
+
+from mycqu.score import Score
+from mycqu.score.calculator import GpaCalculator, default_grade_point
+
+
+def _score(code: str, score, credit, nature: str = '必修', session: str = '2021春') -> Score:
+    return Score.from_dict({
+        'sessionName': session, 'courseName': code, 'courseCode': code, 'credit': credit,
+        'effectiveScoreShow': score, 'studyNature': '初修', 'courseNature': nature,
+    })
+
+
+SCORES = [
+    _score('A', '95', 2),
+    _score('B', '合格', 1),
+    _score('C', '缓考', 3),
+    _score('D', '72', 3, nature='选修', session='2021秋'),
+    _score('E', '60', None),
+]
+
+
+def test_summary_uses_grade_scores_and_skips_unusable_scores():
+    summary = GpaCalculator().summary(SCORES)
+    # 合格 按 85 分计，缓考与缺少学分的成绩不计入
+    assert summary.course_count == 3 and summary.credits == 6
+    assert summary.gpa == pytest.approx((4.0 * 2 + 3.5 * 1 + 2.2 * 3) / 6)
+    assert summary.weighted_avg == pytest.approx((95 * 2 + 85 * 1 + 72 * 3) / 6)
+
+
+def test_grade_scores_can_be_overridden():
+    summary = GpaCalculator(grade_scores={'合格': 75}).summary(SCORES[:2])
+    assert summary.weighted_avg == pytest.approx((95 * 2 + 75) / 3)
+
+
+def test_course_nature_filter():
+    summary = GpaCalculator(course_natures={'必修'}).summary(SCORES)
+    assert summary.gpa == pytest.approx((4.0 * 2 + 3.5) / 3)
+
+
+def test_empty_summary():
+    summary = GpaCalculator().summary([SCORES[2]])
+    assert summary.gpa is None and summary.weighted_avg is None and summary.course_count == 0
+
+
+def test_what_if_changes_and_extra_courses():
+    calculator = GpaCalculator()
+    summary = calculator.what_if(SCORES, changes={'D': '90'}, extra=[('优', 2)])
+    assert summary.credits == 8
+    assert summary.gpa == pytest.approx((4.0 * 2 + 3.5 + 4.0 * 3 + 4.0 * 2) / 8)
+    # 原有成绩不被修改
+    assert SCORES[3].score == '72'
+    assert calculator.summary(SCORES).credits == 6
+
+
+def test_batch_and_by_session_match_summary():
+    calculator = GpaCalculator()
+    assert calculator.batch({'x': SCORES, 'y': SCORES[:1], 'z': []}) == \
+        {'x': calculator.summary(SCORES), 'y': calculator.summary(SCORES[:1]), 'z': calculator.summary([])}
+    by_session = calculator.by_session(SCORES)
+    assert by_session['2021秋'] == calculator.summary([SCORES[3]])
+    assert by_session['2021春'] == calculator.summary(SCORES[:3] + SCORES[4:])
+
+
+def test_default_grade_point():
+    import numpy as np
+    assert default_grade_point(np.array([100, 90, 89, 60, 59])).tolist() == [4.0, 4.0, 3.9, 1.0, 0.0]
@@ -0,0 +1,86 @@
+import pytest
+from pydantic import ValidationError
+
+from mycqu.course import Course, CQUSession
+from mycqu.utils.config import ConfigManager
+from mycqu.utils.interning import InternTable, interning, COURSE_TABLE, SESSION_TABLE
+from mycqu.utils.records import is_record, record_mode
+
+
+def _course_data() -> dict:
+    # 每次构造新的字符串对象，以检查驻留是否生效
+    return {'courseName': ''.join(['高等', '数学']), 'courseCode': 'MATH1', 'courseDepartmentName': ''.join(['数学', '学院']),
+            'instructorName': ''.join(['张', '三']), 'credit': '5', 'session': '2021春'}
+
+
+@pytest.fixture(autouse=True)
+def clear_tables():
+    COURSE_TABLE.clear()
+    SESSION_TABLE.clear()
+    yield
+    COURSE_TABLE.clear()
+    SESSION_TABLE.clear()
+
+
+def test_intern_table_reuses_objects_and_evicts_least_recently_used():
+    table = InternTable(maxsize=2)
+    calls = []
+
+    def factory(value):
+        return lambda: calls.append(value) or [value]
+
+    a = table.get('a', factory('a'))
+    table.get('b', factory('b'))
+    assert table.get('a', factory('a')) is a
+    table.get('c', factory('c'))
+    assert len(table) == 2 and calls == ['a', 'b', 'c']
+    # b 最久未使用而被淘汰，a 仍被保留
+    table.get('b', factory('b'))
+    assert table.get('a', factory('a')) is not a
+    assert calls == ['a', 'b', 'c', 'b', 'a']
+
+
+def test_interning_shares_courses_sessions_and_strings():
+    with interning():
+        first, second = Course.from_dict(_course_data()), Course.from_dict(_course_data())
+    assert first is second
+    assert first.session == CQUSession.from_str('2021春')
+    with interning():
+        assert CQUSession.from_str('2021春') is first.session
+        other = Course.from_dict(dict(_course_data(), courseCode='MATH2'))
+    assert other is not first and other.dept is first.dept and other.instructor is first.instructor
+
+
+def test_without_interning_objects_are_equal_but_distinct():
+    first, second = Course.from_dict(_course_data()), Course.from_dict(_course_data())
+    assert first == second and hash(first) == hash(second)
+    assert first is not second and first.dept is not second.dept
+
+
+def test_interning_can_be_enabled_by_config():
+    config = ConfigManager().config['model']
+    saved = config['interning']
+    config['interning'] = True
+    try:
+        assert Course.from_dict(_course_data()) is Course.from_dict(_course_data())
+        with interning(False):
+            assert Course.from_dict(_course_data()) is not Course.from_dict(_course_data())
+    finally:
+        config['interning'] = saved
+
+
+def test_interned_models_are_frozen():
+    with interning():
+        course = Course.from_dict(_course_data())
+    with pytest.raises(ValidationError):
+        course.code = 'OTHER'
+    with pytest.raises(ValidationError):
+        course.session.year = 2000
+
+
+def test_record_mode_does_not_share_interned_models():
+    with interning():
+        model = Course.from_dict(_course_data())
+        with record_mode():
+            record = Course.from_dict(_course_data())
+    assert not is_record(model) and is_record(record) and is_record(record.session)
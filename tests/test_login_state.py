@@ -0,0 +1,100 @@
+from typing import Dict, Optional
+
+import pytest
+from requests import Session
+
+from mycqu.auth import _authorizer
+from mycqu.auth._authorizer import Authorizer
+from mycqu.utils.config import ConfigManager
+from mycqu.utils.request_transformer import RequestTransformer
+
+
+class _FakeAuthorizer(Authorizer):
+    def _get_request_data(self, session) -> Dict:
+        return {}
+
+    def _need_captcha(self, session) -> Optional[str]:
+        return None
+
+    def _need_captcha_handler(self, captcha: str, request_data: Dict):
+        pass
+
+    def _login(self, session, request_data: Dict):
+        pass
+
+
+@pytest.fixture
+def authorizer(server_url):
+    # 登陆页返回 302 即视为已登陆
+    return type('Authorizer', (_FakeAuthorizer,), {
+        'LOGIN_URL': server_url + '/status/302',
+        'LOGOUT_URL': server_url + '/logout',
+    })
+
+
+@pytest.fixture
+def ttl():
+    config = ConfigManager().config['auth']
+    saved = config['login_state_ttl']
+    config['login_state_ttl'] = 60
+    yield 60
+    config['login_state_ttl'] = saved
+
+
+@pytest.fixture
+def session():
+    session = Session()
+    session.cookies.set('CASTGC', 'ticket', domain='127.0.0.1')
+    session.sent = []
+    session.hooks['response'].append(lambda res, **kwargs: session.sent.append(res.request.url))
+    return session
+
+
+@RequestTransformer.register()
+def _get_status(session, url: str) -> int:
+    res = yield session.get(url)
+    return res.status_code
+
+
+def test_login_state_is_not_cached_by_default(authorizer, session):
+    assert authorizer.is_logined(session)
+    assert authorizer.is_logined(session)
+    assert len(session.sent) == 2
+
+
+def test_cached_login_state_until_ttl_expires(authorizer, session, ttl, monkeypatch):
+    assert authorizer.is_logined(session)
+    assert authorizer.is_logined(session)
+    assert len(session.sent) == 1
+
+    now = _authorizer.monotonic()
+    monkeypatch.setattr(_authorizer, 'monotonic', lambda: now + ttl + 1)
+    assert authorizer.is_logined(session)
+    assert len(session.sent) == 2
+
+
+def test_verify_bypasses_cached_login_state(authorizer, session, ttl):
+    assert authorizer.is_logined(session)
+    assert authorizer.is_logined(session, verify=True)
+    assert len(session.sent) == 2
+
+
+def test_logout_replaces_cached_login_state(authorizer, session, ttl):
+    assert authorizer.is_logined(session)
+    authorizer.logout(session)
+    assert not authorizer.is_logined(session)
+    assert len(session.sent) == 2
+
+
+def test_unauthorized_response_forgets_login_state(authorizer, session, ttl, server_url):
+    assert authorizer.is_logined(session)
+    assert _get_status.sync_request(session, server_url + '/status/401') == 401
+    assert authorizer.is_logined(session)
+    assert len(session.sent) == 3
+
+
+def test_expired_login_cookies_invalidate_cached_state(authorizer, session, ttl):
+    assert authorizer.is_logined(session)
+    session.cookies.clear()
+    assert not authorizer.is_logined(session)
+    assert len(session.sent) == 1
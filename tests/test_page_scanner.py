@@ -0,0 +1,73 @@
+import pytest
+
+from mycqu.auth._page_parser import _AuthPageParser, _SSOPageParser, _SSOErrorParser
+from mycqu.card._help import _CardPageParser
+from mycqu.utils.page_scanner import PageScanner, element_tag, attr_value, last_tag_end
+
+AUTHSERVER_PAGE = '''<html><head><script type="text/javascript">var pwdDefaultEncryptSalt = "0123456789abcdef";</script>
+</head><body><!-- <input name="lt" value="commented"/> -->
+<form><input type="hidden" name="lt" value="LT-1"/><input name="execution" value="e1s1"/>
+<input name="_eventId" value="submit"/><input name="rmShown" value="1"/></form></body></html>'''
+
+SSO_PAGE = '''<html><body><p id="login-croypto">Y3JveXB0bw==</p><p id="login-page-flowkey">key&amp;1</p>
+<p id="captcha-url">/captcha</p></body></html>'''
+
+
+def test_authserver_scan_matches_full_parse():
+    scanned, fed = _AuthPageParser(), _AuthPageParser()
+    scanned.parse(AUTHSERVER_PAGE)
+    fed.feed(AUTHSERVER_PAGE)
+    assert scanned.salt == fed.salt == '0123456789abcdef'
+    assert scanned.input_data == fed.input_data
+    assert scanned.input_data['lt'] == 'LT-1' and scanned.input_data['dllt'] is None
+
+
+def test_sso_scan_matches_full_parse():
+    fed = _SSOPageParser()
+    with pytest.raises(_SSOPageParser._AllValuesGot):
+        fed.feed(SSO_PAGE)
+    assert _SSOPageParser().parse(SSO_PAGE) == fed.data
+    assert fed.data['login-page-flowkey'] == 'key&1'
+
+
+def test_sso_error_code():
+    assert _SSOErrorParser().parse('<div id="login-error-msg"><span>1001</span></div>') == 1001
+    assert _SSOErrorParser().parse('<div id="other">1001</div>') is None
+
+
+def test_card_ticket():
+    page = '<form><input type="hidden" name="ssoticketid" value="abc&amp;d"/></form>'
+    assert _CardPageParser().parse(page) == 'abc&d'
+
+
+def test_scanner_requires_every_mandatory_target():
+    scanner = PageScanner({'a': element_tag('input', name='a'), 'b': element_tag('input', name='b')}, optional=['b'])
+    found = scanner.scan('<input name="a" value="1"><input name="a" value="2">', last=True)
+    assert found is not None and found['b'] is None
+    assert attr_value(found['a'], 'value') == '2'
+    assert scanner.scan('<input name="b" value="1">') is None
+
+
+def test_authserver_scan_keeps_last_field_and_stops_after_last_input():
+    page = AUTHSERVER_PAGE.replace('</form></body></html>', '''</form>
+<form id="other"><input name="lt" value="LT-2"/></form><!-- <input name="execution" value="commented"/> -->
+<div>footer <input-like> text</div></body></html>''')
+    scanned, fed = _AuthPageParser(), _AuthPageParser()
+    scanned.parse(page)
+    fed.feed(page)
+    assert scanned.salt == fed.salt
+    assert scanned.input_data == fed.input_data
+    assert scanned.input_data['lt'] == 'LT-2' and scanned.input_data['execution'] == 'e1s1'
+
+
+def test_last_tag_end():
+    page = '<input name="a"><p>tail</p>'
+    assert page[:last_tag_end(page, 'input')] == '<input name="a">'
+    # 位于注释中时延伸到注释结束
+    page = '<input name="a"><!-- <input name="b"> --><p>tail</p>'
+    assert page[:last_tag_end(page, 'input')] == '<input name="a"><!-- <input name="b"> -->'
+    assert last_tag_end('<p>no inputs</p>', 'input') == 0
+
+    scanner = PageScanner({'a': element_tag('input', name='a')})
+    page = '<input name="a" value="1"><input name="a" value="2">'
+    assert attr_value(scanner.scan(page, last=True, endpos=len('<input name="a" value="1">'))['a'], 'value') == '1'
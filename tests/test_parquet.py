@@ -0,0 +1,90 @@
+import os
+from urllib.parse import unquote
+
+import pytest
+
+from mycqu.card.models import Bill
+from mycqu.enroll import EnrollCourseItem
+from mycqu.exam import Exam
+from mycqu.utils.parquet import arrow_schema, write_parquet, read_parquet
+from mycqu.utils.records import is_record, record_mode, to_record
+
+from test_columns import _bills, _exams
+from test_record_mode import _item
+
+
+def _files(base_dir) -> list:
+    return sorted(os.path.relpath(os.path.join(root, name), base_dir)
+                  for root, _, names in os.walk(base_dir) for name in names)
+
+
+def test_arrow_schema():
+    import pyarrow as pa
+
+    schema = arrow_schema(Exam)
+    assert schema.field('seat_num').type == pa.int64()
+    assert schema.field('date').type == pa.date32()
+    assert pa.types.is_struct(schema.field('course').type)
+    # 递归出现的模型以 json 字符串保存
+    assert arrow_schema(EnrollCourseItem).field('children').type == pa.list_(pa.string())
+    assert arrow_schema(Bill).field('date').type == pa.timestamp('us', tz='Asia/Shanghai')
+
+
+@pytest.mark.parametrize('items, model', [(_exams(), Exam), (_bills(), Bill)], ids=['exam', 'bill'])
+def test_round_trip(tmp_path, items, model):
+    write_parquet(items, str(tmp_path))
+    assert list(read_parquet(str(tmp_path), model)) == items
+
+
+def test_recursive_model_round_trip(tmp_path):
+    parent = EnrollCourseItem.from_dict(dict(_item('1', 10), childrenList=[_item('2', 5), _item('3', 6)]))
+    write_parquet([parent], str(tmp_path))
+    [restored] = read_parquet(str(tmp_path), EnrollCourseItem)
+    assert restored == parent
+    assert [child.id for child in restored.children] == ['2', '3']
+
+
+def test_partitions_and_filters(tmp_path):
+    bills = _bills()
+    write_parquet(bills, str(tmp_path), partition_by={'user': lambda _: '20200001', 'place_name': 'place'})
+    # 分区目录名中的非 ascii 字符会被转义
+    assert {unquote(os.path.dirname(path)) for path in _files(tmp_path)} == {
+        os.path.join('user=20200001', 'place_name=食堂'), os.path.join('user=20200001', 'place_name=超市')}
+
+    canteen = list(read_parquet(str(tmp_path), Bill, filters={'place_name': '食堂'}))
+    assert sorted(bill.date for bill in canteen) == [bills[0].date, bills[2].date]
+    assert list(read_parquet(str(tmp_path), Bill, filters={'user': '20200002'})) == []
+
+
+def test_writes_add_snapshots(tmp_path):
+    exams = _exams()
+    write_parquet(exams[:1], str(tmp_path))
+    write_parquet(exams[1:], str(tmp_path))
+    assert len(_files(tmp_path)) == 2
+    assert sorted(read_parquet(str(tmp_path), Exam), key=lambda exam: exam.seat_num) == exams
+
+
+def test_batches_from_generator(tmp_path):
+    exams = _exams()
+    write_parquet((exam for exam in exams), str(tmp_path), model=Exam, batch_size=1)
+    assert list(read_parquet(str(tmp_path), Exam, batch_size=1)) == exams
+
+
+def test_records_and_record_mode(tmp_path):
+    exams = _exams()
+    write_parquet([to_record(exam) for exam in exams], str(tmp_path))
+    with record_mode():
+        records = list(read_parquet(str(tmp_path), Exam))
+    assert all(is_record(record) for record in records)
+    assert [record.room for record in records] == [exam.room for exam in exams]
+    assert list(read_parquet(str(tmp_path), Exam)) == exams
+
+
+def test_empty_items_write_nothing(tmp_path):
+    write_parquet([], str(tmp_path / 'empty'))
+    assert not (tmp_path / 'empty').exists()
+
+
+def test_partition_conflicting_with_field(tmp_path):
+    with pytest.raises(ValueError):
+        write_parquet(_exams(), str(tmp_path), partition_by={'room': 'room'})
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from mycqu._lib_wrapper.fastjson import loads
+from mycqu.card._schemas import BillResponse, CardResponse
+from mycqu.enroll._schemas import EnrollDetailResponse
+from mycqu.exam import Exam
+from mycqu.exam._schemas import ExamResponse
+from mycqu.exception import ParseError
+from mycqu.room._schemas import RoomTimetableResponse
+from mycqu.score._schemas import ScoreResponse
+from mycqu.utils import payload
+from mycqu.utils.payload import decode_payload
+
+from test_exam_cache import _exam, _ExamSession
+from test_record_mode import _item
+
+
+def test_loads_accepts_bytes_and_str():
+    assert loads(b'{"a": [1, 2.5, "\\u4e2d"]}') == loads('{"a": [1, 2.5, "\\u4e2d"]}') == {'a': [1, 2.5, '中']}
+
+
+def test_loads_raises_value_error():
+    with pytest.raises(ValueError):
+        loads(b'{"a": ')
+
+
+def test_decode_payload_reports_malformed_json():
+    with pytest.raises(ParseError):
+        decode_payload(b'{"data": [', ExamResponse)
+
+
+def test_decode_payload_reports_missing_fields():
+    pytest.importorskip('msgspec')
+    with pytest.raises(ParseError, match='courseName'):
+        decode_payload(b'{"data": [{"courseCode": "MATH10001"}]}', ExamResponse)
+
+
+_PAYLOADS = [
+    (ExamResponse, {'data': [_exam('A1'), dict(_exam('B2'), floorNum='3F', simpleChiefinvigilatorVOS=[
+        {'instructor': '张三', 'instDeptShortName': '数统'}])]}),
+    (EnrollDetailResponse, {'selectCourseListVOs': [{'selectCourseVOList': [
+        dict(_item('1', 10), childrenList=[_item('2', 5)], credit='3.0')]}]}),
+    (BillResponse, {'rows': [{'tranName': '消费', 'tranDt': '2021-06-01 12:30:00', 'mchAcctName': '食堂',
+                              'tranAmt': -12.0, 'acctAmt': '100.00'}]}),
+    (CardResponse, {'respCode': '0000', 'objs': [{'acctNo': '123', 'acctAmt': 10000.0}]}),
+    (ScoreResponse, {'status': 'success', 'data': {'2021春': {'stuScoreHomePgVoS': [
+        {'courseName': '课程', 'courseCode': 'A1', 'sessionName': '2021春', 'effectiveScoreShow': '90',
+         'studyNature': '初修', 'courseNature': '必修'}]}}}),
+    (RoomTimetableResponse, {'classTimetableVOList': None, 'roomExamTimeTableVOList': [],
+                             'tempActivityTimetableVOList': None}),
+]
+
+
+@pytest.mark.parametrize('schema, payload', _PAYLOADS, ids=[schema.__name__ for schema, _ in _PAYLOADS])
+def test_schemas_accept_responses(schema, payload):
+    content = json.dumps(payload).encode()
+    assert decode_payload(content, schema) == loads(content)
+
+
+def test_decode_payload_converts_numeric_strings():
+    pytest.importorskip('msgspec')
+    content = json.dumps({'data': [dict(_exam('A1'), seatNum='12', batchId='3')]}).encode()
+    [exam] = decode_payload(content, ExamResponse)['data']
+    assert exam['seatNum'] == 12 and exam['batchId'] == 3
+
+
+def test_decode_payload_reports_location_of_wrong_types():
+    pytest.importorskip('msgspec')
+    content = json.dumps({'data': [_exam('A1'), dict(_exam('B2'), seatNum=[1])]}).encode()
+    with pytest.raises(ParseError, match=r'\$\.data\[1\]\.seatNum'):
+        decode_payload(content, ExamResponse)
+
+
+def test_decode_payload_without_msgspec(monkeypatch):
+    monkeypatch.setattr(payload, '_msgspec', None)
+    # 未安装 msgspec 时只做解析
+    assert decode_payload(b'{"data": [{"courseCode": "A1"}]}', ExamResponse) == {'data': [{'courseCode': 'A1'}]}
+    with pytest.raises(ParseError):
+        decode_payload(b'{"data": [', ExamResponse)
+
+
+def test_fetch_validates_response():
+    pytest.importorskip('msgspec')
+    assert [exam.seat_num for exam in Exam.fetch(_ExamSession(dict(_exam('A1'), seatNum='5')), '20200001')] == [5]
+    with pytest.raises(ParseError, match='courseName'):
+        Exam.fetch(_ExamSession({'courseCode': 'A1'}), '20200001')
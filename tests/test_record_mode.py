@@ -0,0 +1,71 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from mycqu.course import CourseTimetable
+from mycqu.enroll import EnrollCourseItem
+from mycqu.enroll.conflict import ConflictChecker
+from mycqu.enroll.monitor import EnrollMonitor
+from mycqu.exam.cache import ExamCache
+from mycqu.utils.records import is_record, record_mode
+
+from test_exam_cache import _exam, _ExamSession
+
+
+def _item(item_id: str, selected: int, capacity: int = 30, time: str = '1-16周 星期一 1-2小节 &A101') -> dict:
+    return {
+        'courseName': '课程', 'courseCode': 'A1', 'id': item_id, 'sessionId': '1', 'checked': False,
+        'courseId': 'course', 'classType': '理论', 'selectedNum': selected, 'stuCapacity': capacity,
+        'childrenList': None, 'campusShortName': 'A区', 'parentClassId': None, 'classTime': time,
+    }
+
+
+class _EnrollSession:
+    def __init__(self, *items: dict):
+        self.items = list(items)
+
+    async def request(self, method, url, **kwargs):
+        body = {'selectCourseListVOs': [{'selectCourseVOList': self.items}]}
+        return SimpleNamespace(status_code=200, content=json.dumps(body).encode())
+
+
+def test_exam_cache_reports_changes_in_record_mode():
+    cache = ExamCache()
+    session = _ExamSession(_exam('A1'))
+    with record_mode():
+        first = cache.refresh('20200001', session, force=True)
+        session.exams = [_exam('A1', seat=9)]
+        changes = cache.refresh('20200001', session, force=True)
+    assert all(is_record(exam) for exam in first.added)
+    [(old, new)] = changes.changed
+    assert is_record(old) and is_record(new) and (old.seat_num, new.seat_num) == (1, 9)
+
+
+def test_enroll_monitor_events_in_record_mode():
+    session = _EnrollSession(_item('1', selected=30))
+    monitor = EnrollMonitor(session)
+    monitor.watch('user', 'course')
+
+    async def main():
+        with record_mode():
+            await monitor.poll('course')
+            session.items = [_item('1', selected=29)]
+            return await monitor.poll('course')
+
+    [event] = asyncio.run(main())
+    assert is_record(event.item) and is_record(event.previous)
+    assert event.became_available
+
+
+def test_conflict_checker_accepts_records():
+    timetable = CourseTimetable.from_dict({
+        'courseName': '已选', 'courseCode': 'B1', 'wholeWeekOccupy': False, 'roomName': 'A101',
+        'exprProjectName': None, 'teachingWeekFormat': '1-8', 'weekDayFormat': '一', 'periodFormat': '1-2',
+    })
+    with record_mode():
+        items = [EnrollCourseItem.from_dict(_item('1', 0)),
+                 EnrollCourseItem.from_dict(_item('2', 0, time='1-16周 星期二 1-2小节 &A101'))]
+    [conflicts, free] = ConflictChecker([timetable]).check(items)
+    assert not free
+    [conflict] = conflicts
+    assert conflict.item is items[0] and conflict.weeks == list(range(1, 9))
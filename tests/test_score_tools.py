@@ -0,0 +1,19 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mycqu.exception import MycquUnauthorized
+from mycqu.score.tools import get_gpa_ranking_raw
+
+
+class _UnauthorizedSession:
+    """
+    返回 401 与非 json 页面的会话
+    """
+    def request(self, method, url, **kwargs):
+        return SimpleNamespace(status_code=401, content=b'<html>401 Unauthorized</html>')
+
+
+def test_gpa_ranking_raises_unauthorized_before_decoding():
+    with pytest.raises(MycquUnauthorized):
+        get_gpa_ranking_raw(_UnauthorizedSession())
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+
+import pytest
+
+from mycqu.score.watcher import ScoreWatcher
+
+
+class _FlakyWatcher(ScoreWatcher):
+    """
+    用户 ``bad`` 的每次轮询都失败，其他用户每次都有新成绩
+    """
+
+    async def async_check(self, user, auth):
+        if user == 'bad':
+            raise ConnectionError('token expired')
+        return [f'{user}-score']
+
+
+async def _take(stream, count):
+    results = []
+    async for item in stream:
+        results.append(item)
+        if len(results) == count:
+            break
+    return results
+
+
+def test_one_failing_user_does_not_stop_the_others(caplog):
+    watcher = _FlakyWatcher(interval=0.01, jitter=0)
+    with caplog.at_level(logging.WARNING, logger='mycqu.score.watcher'):
+        results = asyncio.run(_take(watcher.watch({'bad': 'token-a', 'good': 'token-b'}), 3))
+    assert results == [('good', ['good-score'])] * 3
+    assert any('bad' in record.getMessage() for record in caplog.records)
+
+
+def test_on_error_receives_failures():
+    watcher = _FlakyWatcher(interval=0.01, jitter=0)
+    errors = []
+    asyncio.run(_take(watcher.watch({'bad': 'a', 'good': 'b'}, on_error=lambda user, e: errors.append(user)), 5))
+    assert errors and set(errors) == {'bad'}
+
+
+def test_on_error_can_stop_the_stream():
+    watcher = _FlakyWatcher(interval=0.01, jitter=0)
+
+    def on_error(user, e):
+        raise RuntimeError(f'stop at {user}')
+
+    with pytest.raises(RuntimeError, match='stop at bad'):
+        asyncio.run(_take(watcher.watch({'bad': 'a', 'good': 'b'}, on_error=on_error), 1000))
@@ -0,0 +1,168 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from requests import Session
+
+from mycqu.auth import access_services, async_access_services
+from mycqu.auth._services import _SERVICES, _register_service, ServiceAccessRecovery
+from mycqu.utils.config import ConfigManager
+from mycqu.utils.request_transformer import RequestTransformer
+from mycqu.utils.session_store import SessionStore
+
+
+@pytest.fixture
+def services(server_port):
+    """
+    两个都使用 ``Authorization`` 请求头的服务，分别位于 127.0.0.1 与 localhost；
+    认证流程返回 ``tokens`` 中当前的 token，并在 ``handshakes`` 中计数；
+    ``sent`` 记录认证流程请求中携带的 ``Authorization``，``failing`` 中的服务认证失败
+    """
+    env = SimpleNamespace(
+        urls={'test-a': f'http://127.0.0.1:{server_port}', 'test-b': f'http://localhost:{server_port}'},
+        tokens={'test-a': 'test-a', 'test-b': 'test-b'},
+        handshakes={'test-a': 0, 'test-b': 0},
+        sent={},
+        failing=set(),
+    )
+
+    def register(name: str, host: str) -> None:
+        @RequestTransformer.register()
+        def handshake(session, use_sso: bool = True):
+            res = yield session.get(f'http://{host}:{server_port}/handshake/{name}')
+            assert res.status_code == 200
+            env.sent[name] = res.json()['headers'].get('Authorization')
+            if name in env.failing:
+                raise RuntimeError(f'{name} handshake failed')
+            env.handshakes[name] += 1
+            return {'Authorization': f'Bearer {env.tokens[name]}'}
+
+        _register_service(name, (host,), handshake, ('Authorization',))
+
+    saved = dict(_SERVICES)
+    register('test-a', '127.0.0.1')
+    register('test-b', 'localhost')
+    yield env
+    _SERVICES.clear()
+    _SERVICES.update(saved)
+
+
+@pytest.fixture
+def recovery():
+    config = ConfigManager().config['request']
+    saved = config.get('unauthorized_recovery')
+    recovery = config['unauthorized_recovery'] = ServiceAccessRecovery()
+    yield recovery
+    config['unauthorized_recovery'] = saved
+
+
+@RequestTransformer.register()
+def _get_status(session, url: str) -> int:
+    res = yield session.get(url)
+    return res.status_code
+
+
+def _authorization(res) -> str:
+    return res.json()['headers'].get('Authorization')
+
+
+def test_access_services_keeps_conflicting_headers_per_host(services):
+    session = Session()
+    result = access_services(session, services.urls)
+    assert result == {'test-a': {'Authorization': 'Bearer test-a'}, 'test-b': {'Authorization': 'Bearer test-b'}}
+    assert 'Authorization' not in session.headers
+    for name, url in services.urls.items():
+        assert _authorization(session.get(url + '/api')) == f'Bearer {name}'
+
+
+def test_explicit_header_takes_precedence(services):
+    session = Session()
+    access_services(session, services.urls)
+    res = session.get(services.urls['test-a'] + '/api', headers={'Authorization': 'Bearer explicit'})
+    assert _authorization(res) == 'Bearer explicit'
+
+
+def test_reaccess_replaces_only_its_own_service(services):
+    session = Session()
+    access_services(session, services.urls)
+    session.headers['Authorization'] = 'Bearer legacy'
+    access_services(session, ['test-a'])
+    assert 'Authorization' not in session.headers
+    assert _authorization(session.get(services.urls['test-a'] + '/api')) == 'Bearer test-a'
+    assert _authorization(session.get(services.urls['test-b'] + '/api')) == 'Bearer test-b'
+
+
+def test_failed_access_keeps_existing_headers(services):
+    session = Session()
+    access_services(session, services.urls)
+    services.tokens = {'test-a': 'test-a-2', 'test-b': 'test-b-2'}
+    services.failing.add('test-b')
+    with pytest.raises(RuntimeError):
+        access_services(session, services.urls)
+    # 认证请求不携带旧的 token，但失败后旧的 token 仍然附加在请求上
+    assert services.sent == {'test-a': None, 'test-b': None}
+    for name, url in services.urls.items():
+        assert _authorization(session.get(url + '/api')) == f'Bearer {name}'
+
+
+def test_async_failed_access_keeps_existing_headers(services):
+    async def main():
+        async with httpx.AsyncClient() as client:
+            await async_access_services(client, services.urls)
+            services.failing.add('test-b')
+            services.tokens['test-a'] = 'test-a-2'
+            with pytest.raises(RuntimeError):
+                await async_access_services(client, services.urls)
+            return {name: _authorization(await client.get(url + '/api')) for name, url in services.urls.items()}
+
+    assert asyncio.run(main()) == {'test-a': 'Bearer test-a', 'test-b': 'Bearer test-b'}
+    assert services.sent == {'test-a': None, 'test-b': None}
+
+
+def test_async_access_services_keeps_conflicting_headers_per_host(services):
+    async def main():
+        async with httpx.AsyncClient() as client:
+            await async_access_services(client, services.urls)
+            return {name: _authorization(await client.get(url + '/api')) for name, url in services.urls.items()}
+
+    assert asyncio.run(main()) == {'test-a': 'Bearer test-a', 'test-b': 'Bearer test-b'}
+
+
+def test_session_store_keeps_host_headers(services):
+    session = Session()
+    access_services(session, services.urls)
+    store = SessionStore()
+    store.put('user', session)
+    with store.acquire('user') as restored:
+        assert restored is not session
+        for name, url in services.urls.items():
+            assert _authorization(restored.get(url + '/api')) == f'Bearer {name}'
+
+
+def test_recovery_reauthenticates_only_the_failed_service(services, recovery):
+    session = Session()
+    access_services(session, services.urls)
+    services.tokens['test-a'] = 'test-a-2'
+
+    assert _get_status.sync_request(session, services.urls['test-a'] + '/auth/test-a-2') == 200
+    assert services.handshakes == {'test-a': 2, 'test-b': 1}
+    # 另一服务的认证信息不受影响，不会再触发认证
+    assert _get_status.sync_request(session, services.urls['test-b'] + '/auth/test-b') == 200
+    assert _get_status.sync_request(session, services.urls['test-a'] + '/auth/test-a-2') == 200
+    assert services.handshakes == {'test-a': 2, 'test-b': 1}
+
+
+def test_async_recovery_reauthenticates_only_the_failed_service(services, recovery):
+    async def main():
+        async with httpx.AsyncClient() as client:
+            await async_access_services(client, services.urls)
+            services.tokens['test-a'] = 'test-a-2'
+            return [
+                await _get_status.async_request(client, services.urls['test-a'] + '/auth/test-a-2'),
+                await _get_status.async_request(client, services.urls['test-b'] + '/auth/test-b'),
+                await _get_status.async_request(client, services.urls['test-a'] + '/auth/test-a-2'),
+            ]
+
+    assert asyncio.run(main()) == [200, 200, 200]
+    assert services.handshakes == {'test-a': 2, 'test-b': 1}
@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import pytest
+from requests import Session
+
+from mycqu.utils.session_store import SessionStore
+
+
+def test_only_non_default_headers_are_kept():
+    session = Session()
+    session.headers['X-Token'] = 'abc'
+    store = SessionStore()
+    assert store.put('user', session).headers == (('X-Token', 'abc'),)
+
+
+def test_async_client_state_round_trip():
+    store = SessionStore()
+
+    async def main():
+        async with store.async_acquire('user') as client:
+            client.headers['X-Token'] = 'abc'
+        return store.get('user').headers
+
+    store.put('user', Session())
+    assert [(key.lower(), value) for key, value in asyncio.run(main())] == [('x-token', 'abc')]
+
+
+def test_acquire_rejects_expired_states():
+    store = SessionStore()
+    store.put('user', Session(), expires_at=time.time() - 1)
+    with pytest.raises(KeyError):
+        with store.acquire('user'):
+            pass
+    assert 'user' not in store
+
+    store.put('user', Session(), expires_at=time.time() - 1)
+    assert store.get('user') is None
+    assert 'user' not in store
+
+
+def test_async_acquire_rejects_expired_states():
+    store = SessionStore()
+    store.put('user', Session(), expires_at=time.time() - 1)
+
+    async def main():
+        async with store.async_acquire('user'):
+            pass
+
+    with pytest.raises(KeyError):
+        asyncio.run(main())
+
+
+def test_put_compacts_idle_sessions():
+    store = SessionStore(idle_timeout=0)
+    store.put('idle', Session())
+    with store.acquire('idle'):
+        pass
+    assert store.get('idle').materialised
+    store.put('expired', Session(), expires_at=time.time() - 1)
+    store.put('other', Session())
+    assert not store.get('idle').materialised
+    assert 'expired' not in store
+
+
+def test_memory_usage_excludes_the_shared_pool():
+    store = SessionStore()
+    store.pool.stateless_session()
+    store.pool.stateless_async_client()
+    session = Session()
+    session.cookies.set('token', 'abc', domain='example.com')
+    store.put('user', session)
+
+    with store.acquire('user'):
+        sync_size = store.memory_usage('user')
+
+    async def main():
+        async with store.async_acquire('user'):
+            return store.memory_usage('user')
+
+    async_size = asyncio.run(main())
+    assert max(sync_size, async_size) < 2 * min(sync_size, async_size)
+
+
+def test_switching_client_kind_while_in_use_keeps_both_changes():
+    store = SessionStore()
+    store.put('user', Session())
+
+    async def main():
+        async with store.async_acquire('user') as client:
+            client.cookies.set('async', '1', domain='example.com')
+
+    with store.acquire('user') as session:
+        session.cookies.set('sync', '1', domain='example.com')
+        asyncio.run(main())
+        # 异步客户端的变化已写入仍在使用的同步会话
+        assert session.cookies.get('async') == '1'
+        assert store.get('user')._client is session
+    assert {cookie[0] for cookie in store.get('user').cookies} == {'sync', 'async'}
+
+
+def test_switching_client_kind_closes_the_sync_session():
+    store = SessionStore()
+    store.put('user', Session())
+    closed = []
+    with store.acquire('user') as session:
+        session.close = lambda: closed.append(True)
+
+    async def main():
+        async with store.async_acquire('user'):
+            pass
+
+    asyncio.run(main())
+    assert closed == [True]
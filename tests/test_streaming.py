@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from requests import Session
+
+from mycqu.exception import MycquUnauthorized, ParseError
+from mycqu.utils.streaming import stream_items, async_stream_items
+
+
+class _ChunkedResponse:
+    """
+    逐字节返回内容的流式响应，``sent`` 记录已发出的字节数
+    """
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+        self.sent = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(len(self.content)):
+            self.sent = i + 1
+            yield self.content[i:i + 1]
+
+    async def aiter_bytes(self, chunk_size):
+        for chunk in self.iter_content(chunk_size):
+            yield chunk
+
+
+class _ChunkedSession:
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.response = _ChunkedResponse(content, status_code)
+
+    def request(self, method, url, **kwargs):
+        return self.response
+
+    def stream(self, method, url, **kwargs):
+        return self.response
+
+
+_CONTENT = json.dumps({'status': 'success', 'data': [{'id': 1, 'credit': 2.5}, {'id': 2, 'credit': 3}]}).encode()
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_stream_items_from_server(server_url):
+    with Session() as session:
+        items = list(stream_items(session, 'POST', server_url + '/timetable', ('path', 'headers.Host'), json=['1']))
+    assert sorted(items) == [('headers.Host', server_url.split('//', 1)[1]), ('path', '/timetable')]
+
+
+def test_async_stream_items_from_server(server_url):
+    async def main():
+        async with httpx.AsyncClient() as client:
+            return await _collect(async_stream_items(client, 'GET', server_url + '/timetable', ('path',)))
+
+    assert asyncio.run(main()) == [('path', '/timetable')]
+
+
+def test_unauthorized(server_url):
+    with Session() as session, pytest.raises(MycquUnauthorized):
+        list(stream_items(session, 'GET', server_url + '/status/401', ('path',)))
+
+    async def main():
+        async with httpx.AsyncClient() as client:
+            await _collect(async_stream_items(client, 'GET', server_url + '/status/401', ('path',)))
+
+    with pytest.raises(MycquUnauthorized):
+        asyncio.run(main())
+
+
+def test_items_are_yielded_while_receiving():
+    session = _ChunkedSession(_CONTENT)
+    items = stream_items(session, 'GET', '', ('status', 'data.item'))
+    assert next(items) == ('status', 'success')
+    assert next(items) == ('data.item', {'id': 1, 'credit': 2.5})
+    # 第一项解析完成时响应尚未接收完毕
+    assert session.response.sent < len(_CONTENT)
+    assert list(items) == [('data.item', {'id': 2, 'credit': 3})]
+
+
+def test_async_items_match_sync_items():
+    expected = list(stream_items(_ChunkedSession(_CONTENT), 'GET', '', ('status', 'data.item')))
+    items = asyncio.run(_collect(async_stream_items(_ChunkedSession(_CONTENT), 'GET', '', ('status', 'data.item'))))
+    assert items == expected
+    # 数字解析为 int 或 float 而不是 Decimal
+    assert [type(data['credit']) for prefix, data in items if prefix == 'data.item'] == [float, int]
+
+
+@pytest.mark.parametrize('content', [b'{"data": [{"id": 1}, {"id": }]}', b'{"data": [{"id": 1}'],
+                         ids=['malformed', 'truncated'])
+def test_invalid_json(content):
+    with pytest.raises(ParseError):
+        list(stream_items(_ChunkedSession(content), 'GET', '', ('data.item',)))
+    with pytest.raises(ParseError):
+        asyncio.run(_collect(async_stream_items(_ChunkedSession(content), 'GET', '', ('data.item',))))